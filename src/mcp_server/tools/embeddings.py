@@ -11,8 +11,14 @@ Selection via RLM_EMBEDDING_PROVIDER env var (default: model2vec).
 All dependencies are optional — returns None if unavailable.
 """
 
+import hashlib
+import json
 import os
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 try:
     import numpy as np
@@ -42,10 +48,18 @@ class EmbeddingProvider(ABC):
         """Return the embedding dimension."""
 
 
+# On-disk cache of the unpacked Model2Vec model (vectors as .npy + tokenizer.json)
+MODEL2VEC_CACHE_DIR = Path.home() / ".cache" / "rlm" / "model2vec"
+
+
 class Model2VecProvider(EmbeddingProvider):
     """Embedding provider using Model2Vec (minishlab/potion-multilingual-128M).
 
     256 dimensions, very fast inference, good multilingual support.
+
+    The first load unpacks the model into MODEL2VEC_CACHE_DIR; later processes
+    memory-map the embedding matrix from there instead of going through
+    from_pretrained (hub resolution + safetensors decode).
     """
 
     MODEL_NAME = "minishlab/potion-multilingual-128M"
@@ -54,7 +68,68 @@ class Model2VecProvider(EmbeddingProvider):
     def __init__(self):
         from model2vec import StaticModel
 
-        self._model = StaticModel.from_pretrained(self.MODEL_NAME)
+        self._model = self._load_cached()
+        if self._model is None:
+            self._model = StaticModel.from_pretrained(self.MODEL_NAME)
+            self._store_cache(self._model)
+
+    def _cache_dir(self) -> Path:
+        import model2vec
+
+        version = getattr(model2vec, "__version__", "0")
+        key = hashlib.sha256(f"{self.MODEL_NAME}@{version}".encode()).hexdigest()[:16]
+        return MODEL2VEC_CACHE_DIR / key
+
+    def _load_cached(self):
+        """Rebuild the StaticModel from the on-disk cache, or None on a miss."""
+        cache_dir = self._cache_dir()
+        meta_file = cache_dir / "meta.json"
+        if not meta_file.exists():
+            return None
+
+        try:
+            from model2vec import StaticModel
+            from tokenizers import Tokenizer
+
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            kwargs = {"config": meta["config"], "normalize": meta["normalize"]}
+            for name in ("weights", "token_mapping"):
+                array_file = cache_dir / f"{name}.npy"
+                if array_file.exists():
+                    kwargs[name] = np.load(array_file, mmap_mode="r")
+
+            return StaticModel(
+                np.load(cache_dir / "vectors.npy", mmap_mode="r"),
+                Tokenizer.from_file(str(cache_dir / "tokenizer.json")),
+                **kwargs,
+            )
+        except Exception:
+            return None
+
+    def _store_cache(self, model) -> None:
+        """Best-effort write of the unpacked model; failures are ignored."""
+        cache_dir = self._cache_dir()
+        tmp_dir = None
+        try:
+            cache_dir.parent.mkdir(parents=True, exist_ok=True)
+            tmp_dir = Path(tempfile.mkdtemp(dir=cache_dir.parent, prefix=".tmp-"))
+
+            np.save(tmp_dir / "vectors.npy", np.asarray(model.embedding))
+            for name in ("weights", "token_mapping"):
+                array = getattr(model, name, None)
+                if array is not None:
+                    np.save(tmp_dir / f"{name}.npy", np.asarray(array))
+            model.tokenizer.save(str(tmp_dir / "tokenizer.json"))
+            meta = {"config": dict(model.config), "normalize": bool(model.normalize)}
+            (tmp_dir / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+
+            tmp_dir.replace(cache_dir)
+            tmp_dir = None
+        except Exception:
+            pass
+        finally:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
 
     def embed(self, texts: list[str]):
         return self._model.encode(texts)
@@ -71,16 +146,28 @@ class FastEmbedProvider(EmbeddingProvider):
 
     MODEL_NAME = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
     DIM = 384
+    SHARD_SIZE = 32
 
     def __init__(self):
         from fastembed import TextEmbedding
 
         self._model = TextEmbedding(model_name=self.MODEL_NAME)
 
-    def embed(self, texts: list[str]):
+    def _embed_shard(self, texts: list[str]):
         # fastembed returns a generator
-        embeddings = list(self._model.embed(texts))
-        return np.array(embeddings)
+        return np.array(list(self._model.embed(texts)))
+
+    def embed(self, texts: list[str]):
+        if len(texts) <= self.SHARD_SIZE:
+            return self._embed_shard(texts)
+
+        # ONNX Runtime releases the GIL during inference, so shards embedded
+        # from a thread pool overlap tokenization with model execution.
+        shards = [texts[i : i + self.SHARD_SIZE] for i in range(0, len(texts), self.SHARD_SIZE)]
+        workers = min(len(shards), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(self._embed_shard, shards))
+        return np.concatenate(parts)
 
     def dim(self) -> int:
         return self.DIM
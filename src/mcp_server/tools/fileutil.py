@@ -6,15 +6,26 @@ Provides:
 - File locking for concurrent access
 - Chunk ID validation against path traversal
 - JSON loading with structure validation
+- Fast JSON (de)serialization via orjson when installed
+- Append-only access log folded into the chunk index
 """
 
 import fcntl
 import json
+import os
 import re
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Chunk ID format: alphanumeric, hyphens, underscores, dots, ampersands
 # Blocks path traversal sequences like "../" or absolute paths
 CHUNK_ID_PATTERN = re.compile(r"^[\w.&-]+$")
@@ -59,6 +70,9 @@ CONTEXT_DIR = resolve_context_dir()
 MAX_CHUNK_CONTENT_SIZE = 2 * 1024 * 1024  # 2 MB
 MAX_DECOMPRESSED_SIZE = 10 * 1024 * 1024  # 10 MB
 
+# Archive formats, in lookup order (zstd when available, gzip otherwise/legacy)
+ARCHIVE_SUFFIXES = (".md.zst", ".md.gz")
+
 
 def validate_chunk_id(chunk_id: str) -> bool:
     """
@@ -104,7 +118,41 @@ def safe_path(base_dir: Path, chunk_id: str, suffix: str = ".md") -> Path | None
     return file_path
 
 
-def atomic_write_json(filepath: Path, data: dict, ensure_ascii: bool = False) -> None:
+def json_loads(data: bytes | str):
+    """Parse JSON from bytes or str, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data, ensure_ascii: bool = False, compact: bool = False) -> bytes:
+    """
+    Serialize to indented (2 spaces) UTF-8 JSON bytes.
+
+    Uses orjson when available; falls back to the stdlib for ensure_ascii
+    output or for values orjson refuses (e.g. non-string keys).
+
+    Args:
+        data: Object to serialize
+        ensure_ascii: Whether to escape non-ASCII characters
+        compact: Emit no indentation or separator spaces (machine-read files)
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE and not ensure_ascii:
+        try:
+            return orjson.dumps(data, option=None if compact else orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    if compact:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=ensure_ascii).encode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=ensure_ascii).encode("utf-8")
+
+
+def atomic_write_json(
+    filepath: Path, data: dict, ensure_ascii: bool = False, compact: bool = False
+) -> None:
     """
     Write JSON atomically using write-to-temp-then-rename.
 
@@ -115,14 +163,30 @@ def atomic_write_json(filepath: Path, data: dict, ensure_ascii: bool = False) ->
         filepath: Target file path
         data: Dictionary to serialize as JSON
         ensure_ascii: Whether to escape non-ASCII characters
+        compact: Write without indentation (see json_dumps)
+    """
+    atomic_write_bytes(filepath, json_dumps(data, ensure_ascii=ensure_ascii, compact=compact))
+
+
+def atomic_write_bytes(filepath: Path, *parts: bytes) -> None:
+    """
+    Write byte strings back to back into a file, atomically.
+
+    Taking the parts separately lets callers skip concatenating a large
+    payload (e.g. a chunk header and its content) just to write it.
+
+    Args:
+        filepath: Target file path
+        parts: Byte strings written in order
     """
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
     # Write to temp file in same directory (same filesystem = atomic rename)
     fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
     try:
-        with open(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=ensure_ascii)
+        with open(fd, "wb") as f:
+            for part in parts:
+                f.write(part)
         Path(tmp_path).replace(filepath)  # Atomic on POSIX
     except BaseException:
         # Clean up temp file on any error
@@ -141,23 +205,11 @@ def atomic_write_text(filepath: Path, content: str) -> None:
         filepath: Target file path
         content: Text content to write
     """
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
-    try:
-        with open(fd, "w", encoding="utf-8") as f:
-            f.write(content)
-        Path(tmp_path).replace(filepath)
-    except BaseException:
-        try:
-            Path(tmp_path).unlink(missing_ok=True)
-        except OSError:
-            pass
-        raise
+    atomic_write_bytes(filepath, content.encode("utf-8"))
 
 
 @contextmanager
-def locked_json_update(filepath: Path, default: dict | None = None):
+def locked_json_update(filepath: Path, default: dict | None = None, compact: bool = False):
     """
     Context manager for locked read-modify-write on a JSON file.
 
@@ -171,12 +223,13 @@ def locked_json_update(filepath: Path, default: dict | None = None):
     Args:
         filepath: Path to JSON file
         default: Default data if file doesn't exist
+        compact: Write without indentation (see json_dumps)
     """
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
     # Create file if it doesn't exist
     if not filepath.exists() and default is not None:
-        atomic_write_json(filepath, default)
+        atomic_write_json(filepath, default, compact=compact)
 
     # Open with exclusive lock
     lock_file = filepath.with_suffix(filepath.suffix + ".lock")
@@ -186,8 +239,7 @@ def locked_json_update(filepath: Path, default: dict | None = None):
 
         # Read current data
         if filepath.exists():
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_loads(filepath.read_bytes())
         else:
             data = default.copy() if default else {}
 
@@ -195,7 +247,7 @@ def locked_json_update(filepath: Path, default: dict | None = None):
         yield data
 
         # Write back atomically
-        atomic_write_json(filepath, data)
+        atomic_write_json(filepath, data, compact=compact)
     finally:
         fcntl.flock(lock_fd, fcntl.LOCK_UN)
         lock_fd.close()
@@ -225,8 +277,7 @@ def load_json_safe(
     if not filepath.exists():
         return default.copy() if default else {}
 
-    with open(filepath, encoding="utf-8") as f:
-        data = json.load(f)
+    data = json_loads(filepath.read_bytes())
 
     if not isinstance(data, dict):
         raise ValueError(f"Expected dict in {filepath.name}, got {type(data).__name__}")
@@ -237,3 +288,140 @@ def load_json_safe(
             raise ValueError(f"Missing keys in {filepath.name}: {missing}")
 
     return data
+
+
+# =============================================================================
+# Access log: append-only sidecar for chunk access counters
+# =============================================================================
+#
+# Each line is "chunk_id<TAB>iso_timestamp". The index records which log it
+# has absorbed as index["access_log"] = [inode, byte offset]; lines past that
+# offset are applied on load. When the marker names another inode, the log was
+# rotated since the index was written and the whole current log is pending.
+
+ACCESS_LOG_NAME = "access.log"  # lives next to index.json
+
+
+def _lock_log(log_file: Path) -> int:
+    """Open log_file for appending and hold an exclusive lock on the live inode."""
+    while True:
+        fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_ino == os.stat(log_file).st_ino:
+                return fd
+        except FileNotFoundError:
+            pass
+        # Rotated while we waited for the lock: retry on the new file
+        os.close(fd)
+
+
+def append_access(log_file: Path, chunk_id: str, now_iso: str) -> None:
+    """
+    Record one chunk access as a single appended line.
+
+    Args:
+        log_file: Path to the access log
+        chunk_id: ID of the chunk being accessed
+        now_iso: ISO timestamp of the access
+    """
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    fd = _lock_log(log_file)
+    try:
+        os.write(fd, f"{chunk_id}\t{now_iso}\n".encode())
+    finally:
+        os.close(fd)
+
+
+def fold_access_log(index: dict, log_file: Path) -> None:
+    """
+    Apply access-log lines the index hasn't absorbed yet, in place.
+
+    Bumps access_count and last_accessed on matching chunks and advances
+    index["access_log"]. A trailing partial line is left for the next call.
+
+    Args:
+        index: Chunk index dict (as loaded from index.json)
+        log_file: Path to the access log
+    """
+    try:
+        st = os.stat(log_file)
+    except FileNotFoundError:
+        return
+
+    marker = index.get("access_log")
+    start = marker[1] if marker and marker[0] == st.st_ino else 0
+    if start > st.st_size:
+        start = 0  # truncated in place
+    if start == st.st_size:
+        index["access_log"] = [st.st_ino, start]
+        return
+
+    with open(log_file, "rb") as f:
+        f.seek(start)
+        data = f.read(st.st_size - start)
+    data = data[: data.rfind(b"\n") + 1]
+
+    counts: dict[str, int] = {}
+    last: dict[str, str] = {}
+    for line in data.decode("utf-8", errors="replace").splitlines():
+        chunk_id, _, ts = line.partition("\t")
+        counts[chunk_id] = counts.get(chunk_id, 0) + 1
+        last[chunk_id] = ts
+
+    for chunk_info in index.get("chunks", []):
+        chunk_id = chunk_info.get("id")
+        if chunk_id in counts:
+            chunk_info["access_count"] = chunk_info.get("access_count", 0) + counts[chunk_id]
+            chunk_info["last_accessed"] = last[chunk_id]
+
+    index["access_log"] = [st.st_ino, start + len(data)]
+
+
+@contextmanager
+def compact_access_log(index: dict, log_file: Path):
+    """
+    Fold the whole access log into index and start a fresh log.
+
+    Wrap the index write with this: the log stays locked (appenders wait)
+    until the body finishes, and index["access_log"] already names the new,
+    empty log when the body runs. That log only replaces the old one once the
+    body succeeds; if it raises, the old log and the index on disk are left
+    as they were, so no access is lost.
+
+    Usage:
+        with compact_access_log(index, ACCESS_LOG_FILE):
+            atomic_write_json(INDEX_FILE, index)
+
+    Args:
+        index: Chunk index dict about to be saved
+        log_file: Path to the access log
+    """
+    if not log_file.exists():
+        yield
+        return
+
+    fd = _lock_log(log_file)
+    try:
+        fold_access_log(index, log_file)
+        folded = index.get("access_log", [0, 0])
+        if folded[1] == 0:
+            yield
+            return
+
+        tmp_fd, tmp_path = tempfile.mkstemp(
+            dir=log_file.parent, prefix=f".{log_file.name}.", suffix=".tmp"
+        )
+        index["access_log"] = [os.fstat(tmp_fd).st_ino, 0]
+        os.close(tmp_fd)
+        try:
+            yield
+        except BaseException:
+            # Index not written: keep the old log, the saved marker still points into it
+            index["access_log"] = folded
+            os.unlink(tmp_path)
+            raise
+        Path(tmp_path).replace(log_file)
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
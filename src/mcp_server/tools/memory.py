@@ -7,19 +7,49 @@ by offloading to persistent storage.
 """
 
 import hashlib
-import json
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 
-from .fileutil import CONTEXT_DIR, atomic_write_json
+from .fileutil import CONTEXT_DIR, atomic_write_json, json_loads
 from .tokenizer_fr import tokenize_fr
 
 MEMORY_FILE = CONTEXT_DIR / "session_memory.json"
 
+# In-process cache of the memory file, keyed on its stat signature.
+# Counters are kept in sync by remember/update/forget so memory_status is O(1).
+_MEM_CACHE: dict = {
+    "key": None,
+    "memory": None,
+    "by_category": Counter(),
+    "by_importance": Counter(),
+}
+
+
+def _memory_key() -> tuple | None:
+    """Stat signature of MEMORY_FILE, or None if it does not exist."""
+    try:
+        st = MEMORY_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return (str(MEMORY_FILE), st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _uncount(counter: Counter, key: str) -> None:
+    """Decrement a counter entry, dropping it when it reaches zero."""
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+
 
 def _load_memory() -> dict:
-    """Load session memory from JSON file."""
-    if not MEMORY_FILE.exists():
-        return {
+    """Load session memory from JSON file (cached until the file changes)."""
+    key = _memory_key()
+    if key is not None and key == _MEM_CACHE["key"]:
+        return _MEM_CACHE["memory"]
+
+    if key is None:
+        memory = {
             "version": "1.0.0",
             "insights": [],
             "metadata": {
@@ -28,16 +58,39 @@ def _load_memory() -> dict:
                 "total_insights": 0,
             },
         }
+    else:
+        memory = json_loads(MEMORY_FILE.read_bytes())
+
+    insights = memory["insights"]
+    _MEM_CACHE["key"] = key
+    _MEM_CACHE["memory"] = memory
+    _MEM_CACHE["by_category"] = Counter(i.get("category", "general") for i in insights)
+    _MEM_CACHE["by_importance"] = Counter(i.get("importance", "medium") for i in insights)
+    return memory
 
-    with open(MEMORY_FILE, encoding="utf-8") as f:
-        return json.load(f)
 
+def _save_memory(memory: dict, now_iso: str | None = None) -> None:
+    """Save session memory atomically.
 
-def _save_memory(memory: dict) -> None:
-    """Save session memory atomically."""
-    memory["metadata"]["last_updated"] = datetime.now().isoformat()
+    Args:
+        memory: Memory dict to persist
+        now_iso: Timestamp already computed by the caller (avoids a second clock read)
+    """
+    memory["metadata"]["last_updated"] = now_iso or datetime.now().isoformat()
     memory["metadata"]["total_insights"] = len(memory["insights"])
-    atomic_write_json(MEMORY_FILE, memory)
+    try:
+        atomic_write_json(MEMORY_FILE, memory)
+    except Exception:
+        _MEM_CACHE["key"] = None
+        raise
+    _MEM_CACHE["key"] = _memory_key()
+    _MEM_CACHE["memory"] = memory
+
+
+@lru_cache(maxsize=512)
+def _tok(query: str) -> tuple[str, ...]:
+    """Tokenize a recall query, memoized (recall is often repeated with the same query)."""
+    return tuple(tokenize_fr(query))
 
 
 def _generate_id(content: str) -> str:
@@ -70,19 +123,22 @@ def remember(
     Returns:
         Confirmation with insight ID
     """
+    now_iso = datetime.now().isoformat()
     memory = _load_memory()
 
     insight = {
-        "id": _generate_id(content + datetime.now().isoformat()),
+        "id": _generate_id(content + now_iso),
         "content": content,
         "category": category,
         "importance": importance,
         "tags": tags or [],
-        "created_at": datetime.now().isoformat(),
+        "created_at": now_iso,
     }
 
     memory["insights"].append(insight)
-    _save_memory(memory)
+    _MEM_CACHE["by_category"][category] += 1
+    _MEM_CACHE["by_importance"][importance] += 1
+    _save_memory(memory, now_iso)
 
     return {
         "status": "saved",
@@ -129,11 +185,11 @@ def recall(
 
     # Filter by query (tokenized search in content and tags)
     if query:
-        query_tokens = tokenize_fr(query)
+        query_tokens = _tok(query)
 
         # Fallback: si tokenize_fr vide la query (que des stopwords), utiliser le raw
         if not query_tokens:
-            query_tokens = [query.lower()]
+            query_tokens = (query.lower(),)
 
         scored_insights = []
         for insight in insights:
@@ -196,6 +252,7 @@ def update(
     Returns:
         Confirmation with updated insight details
     """
+    now_iso = datetime.now().isoformat()
     memory = _load_memory()
 
     # Find the insight
@@ -216,10 +273,14 @@ def update(
         changes.append("content")
 
     if category is not None:
+        _uncount(_MEM_CACHE["by_category"], target.get("category", "general"))
+        _MEM_CACHE["by_category"][category] += 1
         target["category"] = category
         changes.append("category")
 
     if importance is not None:
+        _uncount(_MEM_CACHE["by_importance"], target.get("importance", "medium"))
+        _MEM_CACHE["by_importance"][importance] += 1
         target["importance"] = importance
         changes.append("importance")
 
@@ -241,13 +302,12 @@ def update(
         if add_tags is not None or remove_tags is not None:
             target["tags"] = sorted(current_tags)
 
-    # Add updated_at timestamp
-    target["updated_at"] = datetime.now().isoformat()
-
     if not changes:
         return {"status": "no_change", "message": "No fields were modified"}
 
-    _save_memory(memory)
+    # Add updated_at timestamp
+    target["updated_at"] = now_iso
+    _save_memory(memory, now_iso)
 
     return {
         "status": "updated",
@@ -267,15 +327,20 @@ def forget(insight_id: str) -> dict:
     Returns:
         Confirmation of removal
     """
+    now_iso = datetime.now().isoformat()
     memory = _load_memory()
 
-    original_count = len(memory["insights"])
-    memory["insights"] = [i for i in memory["insights"] if i["id"] != insight_id]
+    removed = [i for i in memory["insights"] if i["id"] == insight_id]
 
-    if len(memory["insights"]) == original_count:
+    if not removed:
         return {"status": "not_found", "message": f"No insight found with ID {insight_id}"}
 
-    _save_memory(memory)
+    memory["insights"] = [i for i in memory["insights"] if i["id"] != insight_id]
+    for insight in removed:
+        _uncount(_MEM_CACHE["by_category"], insight.get("category", "general"))
+        _uncount(_MEM_CACHE["by_importance"], insight.get("importance", "medium"))
+
+    _save_memory(memory, now_iso)
 
     return {
         "status": "deleted",
@@ -293,24 +358,12 @@ def memory_status() -> dict:
     """
     memory = _load_memory()
 
-    # Count by category
-    categories = {}
-    for insight in memory["insights"]:
-        cat = insight.get("category", "general")
-        categories[cat] = categories.get(cat, 0) + 1
-
-    # Count by importance
-    importance_counts = {}
-    for insight in memory["insights"]:
-        imp = insight.get("importance", "medium")
-        importance_counts[imp] = importance_counts.get(imp, 0) + 1
-
     return {
         "status": "ok",
         "version": memory["version"],
         "total_insights": memory["metadata"]["total_insights"],
-        "by_category": categories,
-        "by_importance": importance_counts,
+        "by_category": dict(_MEM_CACHE["by_category"]),
+        "by_importance": dict(_MEM_CACHE["by_importance"]),
         "created_at": memory["metadata"]["created_at"],
         "last_updated": memory["metadata"]["last_updated"],
     }
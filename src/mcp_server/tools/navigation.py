@@ -17,36 +17,81 @@ Phase 4 additions:
 """
 
 import hashlib
-import json
+import heapq
+import io
 import os
 import re
 import subprocess
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from .fileutil import (
+    ACCESS_LOG_NAME,
+    ARCHIVE_SUFFIXES,
     CONTEXT_DIR,
     MAX_CHUNK_CONTENT_SIZE,
+    append_access,
+    atomic_write_bytes,
     atomic_write_json,
-    atomic_write_text,
-    locked_json_update,
+    compact_access_log,
+    fold_access_log,
+    json_loads,
     safe_path,
 )
+from .retention import _has_protected_keyword
 from .sessions import add_chunk_to_session, register_session
 
 # Phase 5.2: Fuzzy matching (optional dependency)
+# rapidfuzz scores whole chunks in one C call; thefuzz is kept as a fallback.
 try:
-    from thefuzz import fuzz
+    from rapidfuzz import fuzz, process
 
     FUZZY_AVAILABLE = True
 except ImportError:
-    FUZZY_AVAILABLE = False
+    process = None
+    try:
+        from thefuzz import fuzz
+
+        FUZZY_AVAILABLE = True
+    except ImportError:
+        FUZZY_AVAILABLE = False
+
+# Duplicate-detection hash: xxh3_128 when available (optional dependency)
+try:
+    import xxhash
+
+    XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+    XXHASH_AVAILABLE = False
 
+HASH_ALGO = "xxh3_128" if XXHASH_AVAILABLE else "sha256"
 
 CHUNKS_DIR = CONTEXT_DIR / "chunks"
 ARCHIVE_DIR = CONTEXT_DIR / "archive"
 INDEX_FILE = CONTEXT_DIR / "index.json"
 
+# Parsed index.json, reused while the file's stat signature is unchanged.
+# Callers that mutate the returned dict must persist it with _save_index().
+_INDEX_CACHE: dict = {"key": None, "data": None}
+
+# Secondary lookups (by project/domain/date) derived from the cached index.
+_LOOKUP_CACHE: dict = {"key": None, "index": None, "lookup": None}
+
+# Body lines of recently fuzzy-searched chunks, least recently used first.
+# Entries are charged twice their file size (stripped + lowercased copies)
+# and evicted once the total passes BODY_CACHE_MAX_BYTES.
+BODY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_BODY_CACHE: OrderedDict = OrderedDict()
+_BODY_CACHE_STATE: dict = {"bytes": 0}
+_BODY_CACHE_LOCK = threading.Lock()
+
 
 # =============================================================================
 # PHASE 5.5: Multi-sessions support
@@ -69,18 +114,34 @@ def _detect_project() -> str:
     if project := os.getenv("RLM_PROJECT"):
         return project
 
-    # 2. Git repository name
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            return Path(result.stdout.strip()).name
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+    return _detect_project_for_cwd(os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _detect_project_for_cwd(cwd: str) -> str:
+    """Git repository name for cwd, else its directory name. Cached per cwd."""
+    # 2. Git repository name (only shell out if some parent holds a .git entry)
+    path = Path(cwd)
+    if any((parent / ".git").exists() for parent in (path, *path.parents)):
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "--show-toplevel"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                cwd=cwd,
+            )
+            if result.returncode == 0:
+                return Path(result.stdout.strip()).name
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            pass
 
     # 3. Fallback to current directory
-    return Path.cwd().name
+    return path.name
+
+
+# Chunk ID parts starting with one of these (case-insensitive) are tickets
+_TICKET_PREFIXES = ("TIC-", "ISSUE-", "#", "JJ-", "GH-")
 
 
 def parse_chunk_id(chunk_id: str) -> dict:
@@ -126,7 +187,7 @@ def parse_chunk_id(chunk_id: str) -> dict:
         # Parse optional parts (ticket or domain)
         for part in parts[3:]:
             # Tickets start with common prefixes
-            if any(part.upper().startswith(p) for p in ["TIC-", "ISSUE-", "#", "JJ-", "GH-"]):
+            if part.upper().startswith(_TICKET_PREFIXES):
                 result["ticket"] = part
             else:
                 # Assume it's a domain
@@ -138,9 +199,28 @@ def parse_chunk_id(chunk_id: str) -> dict:
     return {"raw": chunk_id, "format": "unknown"}
 
 
+def _index_key() -> tuple | None:
+    """Stat signature of INDEX_FILE, or None if it does not exist."""
+    try:
+        st = os.stat(INDEX_FILE)
+    except FileNotFoundError:
+        return None
+    return (str(INDEX_FILE), st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 def _load_index() -> dict:
-    """Load chunks index from JSON file."""
-    if not INDEX_FILE.exists():
+    """
+    Load chunks index from JSON file (cached until the file changes).
+
+    Access counts logged since the index was last written are folded in.
+    """
+    key = _index_key()
+    if key is not None and key == _INDEX_CACHE["key"]:
+        data = _INDEX_CACHE["data"]
+        fold_access_log(data, INDEX_FILE.with_name(ACCESS_LOG_NAME))
+        return data
+
+    if key is None:
         return {
             "version": "2.0.0",
             "created_at": datetime.now().isoformat(),
@@ -150,22 +230,32 @@ def _load_index() -> dict:
             "last_chunking": None,
         }
 
-    with open(INDEX_FILE, encoding="utf-8") as f:
-        data = json.load(f)
+    with open(INDEX_FILE, "rb") as f:
+        data = json_loads(f.read())
 
     # Migrate from v1 if needed
     if data.get("version", "1.0.0") == "1.0.0":
         data["version"] = "2.0.0"
         data["total_chunks"] = len(data.get("chunks", []))
 
+    fold_access_log(data, INDEX_FILE.with_name(ACCESS_LOG_NAME))
+    _INDEX_CACHE["key"] = key
+    _INDEX_CACHE["data"] = data
     return data
 
 
-def _save_index(index: dict) -> None:
-    """Save chunks index atomically."""
-    index["last_chunking"] = datetime.now().isoformat()
+def _save_index(index: dict, now_iso: str | None = None) -> None:
+    """Save chunks index atomically (absorbing the access log) and refresh the cache."""
+    index["last_chunking"] = now_iso or datetime.now().isoformat()
     index["total_chunks"] = len(index.get("chunks", []))
-    atomic_write_json(INDEX_FILE, index)
+    try:
+        with compact_access_log(index, INDEX_FILE.with_name(ACCESS_LOG_NAME)):
+            atomic_write_json(INDEX_FILE, index, compact=True)
+    except Exception:
+        _INDEX_CACHE["key"] = None
+        raise
+    _INDEX_CACHE["key"] = _index_key()
+    _INDEX_CACHE["data"] = index
 
 
 def _estimate_tokens(text: str) -> int:
@@ -211,7 +301,15 @@ def _auto_summarize(content: str, max_length: int = 100) -> str:
     return first_line
 
 
-def _content_hash(content: str) -> str:
+# Lowercases ASCII and maps every byte str.split() treats as whitespace
+# (including \x1c-\x1f) to a space, for the bytes fast path in _content_hash.
+_ASCII_NORMALIZE = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f",
+    b"abcdefghijklmnopqrstuvwxyz" + b" " * 9,
+)
+
+
+def _content_hash(content: str, algo: str | None = None) -> str:
     """
     Generate hash of normalized content for duplicate detection (Phase 4.2).
 
@@ -220,13 +318,24 @@ def _content_hash(content: str) -> str:
 
     Args:
         content: The text content to hash
+        algo: "xxh3_128" or "sha256" (default: HASH_ALGO)
 
     Returns:
-        SHA256 hash of normalized content (64 chars)
+        Hex digest of normalized content (32 chars for xxh3_128, 64 for sha256)
     """
     # Normalize: lowercase, collapse whitespace
-    normalized = " ".join(content.lower().split())
-    return hashlib.sha256(normalized.encode()).hexdigest()
+    if content.isascii():
+        # Same result as the str path below, without one object per word:
+        # collapse space runs with C-level replace() passes (log2 of longest run)
+        normalized = content.encode("ascii").translate(_ASCII_NORMALIZE)
+        while b"  " in normalized:
+            normalized = normalized.replace(b"  ", b" ")
+        normalized = normalized.strip(b" ")
+    else:
+        normalized = " ".join(content.lower().split()).encode()
+    if (algo or HASH_ALGO) == "xxh3_128":
+        return xxhash.xxh3_128_hexdigest(normalized)
+    return hashlib.sha256(normalized).hexdigest()
 
 
 def _parse_date_from_chunk(chunk_info: dict) -> str | None:
@@ -283,6 +392,76 @@ def _chunk_in_date_range(chunk_info: dict, date_from: str | None, date_to: str |
     return True
 
 
+# Phase 7.2: Entity extraction patterns (compiled once at import)
+# Files, versions and functions are scanned in a single pass through one
+# alternation; delimiters are lookarounds so a match never consumes the
+# separator the next entity needs.
+# 1. Files: paths with common extensions
+_FILE_PAT = (
+    r"(?:^|(?<=[\s`\"'(,;|]))"
+    r"(?:[\w./\\-]+/)?"  # optional directory prefix
+    r"[\w.-]+"  # filename
+    r"\.(?:py|js|ts|jsx|tsx|md|xml|json|css|html|yml|yaml|toml|cfg|conf|sh|sql|csv)"
+    r"(?=[\s`\"'),:;|]|$)"
+)
+# 2. Versions: vX.Y.Z or X.Y.Z.W (3+ segments)
+_VERSION_PAT = r"(?:^|(?<=[\s`\"'(,;|v]))v?\d+\.\d+\.\d+(?:\.\d+)*(?=[\s`\"'),:;|]|$)"
+# 5. Functions: identifier() pattern
+_FUNC_PAT = r"\b[a-zA-Z_][a-zA-Z0-9_]*\(\)"
+_ENTITY_RE = re.compile(
+    f"(?P<files>{_FILE_PAT})|(?P<versions>{_VERSION_PAT})|(?P<functions>{_FUNC_PAT})",
+    re.MULTILINE,
+)
+_DATE_SKIP_RE = re.compile(r"^\d{4}\.\d{2}\.\d{2}$")
+# 3. Modules: snake_case identifiers after keywords
+# Pattern allows optional intermediate keywords (e.g., "install module X")
+_MODULE_RE = re.compile(
+    r"(?:pip\s+install|import|from|module|package|install)"
+    r"(?:\s+(?:module|package))?"  # optional second keyword
+    r"\s+([a-z][a-z0-9_]+(?:\.[a-z][a-z0-9_]+)*)",
+    re.IGNORECASE,
+)
+_SKIP_MODULES = frozenset(
+    {
+        "the",
+        "for",
+        "and",
+        "not",
+        "all",
+        "module",
+        "install",
+        "package",
+        "import",
+        "from",
+        "pip",
+        "with",
+        "this",
+        "that",
+    }
+)
+# 4. Tickets: PREFIX-123 format (2+ uppercase letters, dash, 1+ digits)
+# Kept separate: tickets legitimately overlap file names (JJ-123.md)
+_TICKET_RE = re.compile(r"\b([A-Z]{2,}-\d+)\b")
+
+
+def _keep_version(v: str) -> bool:
+    # Skip dates (YYYY-MM-DD looks like 3 segments but has 4-digit first)
+    return not _DATE_SKIP_RE.match(v)
+
+
+def _keep_function(fn: str) -> bool:
+    # Skip very short or common patterns (fn includes the trailing "()")
+    return len(fn) > 3 and fn[:-2] not in ("if", "for", "in")
+
+
+# Post-filters for single-pass matches, by entity kind
+_ENTITY_FILTERS = {
+    "files": None,
+    "versions": _keep_version,
+    "functions": _keep_function,
+}
+
+
 def _extract_entities(content: str, max_entities: int = 50) -> dict:
     """
     Extract named entities from chunk content (Phase 7.2, MAGMA-inspired).
@@ -312,86 +491,35 @@ def _extract_entities(content: str, max_entities: int = 50) -> dict:
     if not content or not content.strip():
         return {k: sorted(v) for k, v in entities.items()}
 
-    # 1. Files: paths with common extensions
-    file_pattern = re.compile(
-        r"(?:^|[\s`\"'(,;|])("
-        r"(?:[\w./\\-]+/)?"  # optional directory prefix
-        r"[\w.-]+"  # filename
-        r"\.(?:py|js|ts|jsx|tsx|md|xml|json|css|html|yml|yaml|toml|cfg|conf|sh|sql|csv)"
-        r")"
-        r"(?:[\s`\"'),:;|]|$)",
-        re.MULTILINE,
-    )
-    for m in file_pattern.finditer(content):
-        entities["files"].add(m.group(1))
-
-    # 2. Versions: vX.Y.Z or X.Y.Z.W (3+ segments)
-    version_pattern = re.compile(
-        r"(?:^|[\s`\"'(,;|v])"
-        r"(v?\d+\.\d+\.\d+(?:\.\d+)*)"
-        r"(?:[\s`\"'),:;|]|$)",
-        re.MULTILINE,
-    )
-    for m in version_pattern.finditer(content):
-        v = m.group(1)
-        # Skip dates (YYYY-MM-DD looks like 3 segments but has 4-digit first)
-        if re.match(r"^\d{4}\.\d{2}\.\d{2}$", v):
-            continue
-        entities["versions"].add(v)
+    # 1, 2, 5. Files, versions and functions in a single pass
+    for m in _ENTITY_RE.finditer(content):
+        kind = m.lastgroup
+        value = m.group(kind)
+        keep = _ENTITY_FILTERS[kind]
+        if keep is None or keep(value):
+            entities[kind].add(value)
 
     # 3. Modules: snake_case identifiers after keywords
-    # Pattern allows optional intermediate keywords (e.g., "install module X")
-    module_pattern = re.compile(
-        r"(?:pip\s+install|import|from|module|package|install)"
-        r"(?:\s+(?:module|package))?"  # optional second keyword
-        r"\s+([a-z][a-z0-9_]+(?:\.[a-z][a-z0-9_]+)*)",
-        re.IGNORECASE,
-    )
-    skip_modules = {
-        "the",
-        "for",
-        "and",
-        "not",
-        "all",
-        "module",
-        "install",
-        "package",
-        "import",
-        "from",
-        "pip",
-        "with",
-        "this",
-        "that",
-    }
-    for m in module_pattern.finditer(content):
+    for m in _MODULE_RE.finditer(content):
         mod = m.group(1).lower()
         # Skip very short or common words
-        if len(mod) > 2 and mod not in skip_modules:
+        if len(mod) > 2 and mod not in _SKIP_MODULES:
             entities["modules"].add(mod)
 
     # 4. Tickets: PREFIX-123 format (2+ uppercase letters, dash, 1+ digits)
-    ticket_pattern = re.compile(r"\b([A-Z]{2,}-\d+)\b")
-    for m in ticket_pattern.finditer(content):
+    for m in _TICKET_RE.finditer(content):
         entities["tickets"].add(m.group(1))
 
-    # 5. Functions: identifier() pattern
-    func_pattern = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\(\)")
-    for m in func_pattern.finditer(content):
-        fn = m.group(1)
-        # Skip very short or common patterns
-        if len(fn) > 1 and fn not in ("if", "for", "in"):
-            entities["functions"].add(f"{fn}()")
-
-    # Enforce max_entities limit (distribute evenly then fill)
+    # Enforce max_entities limit (distribute evenly then fill); only the
+    # smallest `remaining` values of a type are needed, not a full sort
     result = {}
     total = 0
-    for key in entities:
-        sorted_vals = sorted(entities[key])
+    for key, vals in entities.items():
         remaining = max_entities - total
         if remaining <= 0:
             result[key] = []
         else:
-            result[key] = sorted_vals[:remaining]
+            result[key] = heapq.nsmallest(remaining, vals)
             total += len(result[key])
 
     return result
@@ -410,67 +538,279 @@ def _entity_matches(chunk_info: dict, entity: str) -> bool:
     Returns:
         True if any stored entity matches, False otherwise
     """
+    entity_lower = entity.lower()
+    return any(entity_lower in value for value in _entity_values(chunk_info))
+
+
+def _entity_values(chunk_info: dict) -> list[str]:
+    """Lowercased entity strings of a chunk, across all entity types."""
     chunk_entities = chunk_info.get("entities", {})
     if not chunk_entities or not isinstance(chunk_entities, dict):
-        return False
+        return []
+    return [
+        str(e).lower() for vals in chunk_entities.values() if isinstance(vals, list) for e in vals
+    ]
+
+
+# Separates entity values inside a chunk's entity blob; never part of a value
+_ENTITY_SEP = "\x00"
+
+
+def _entity_blobs(index: dict) -> list[str]:
+    """
+    Per-chunk lowercased entity strings joined by _ENTITY_SEP, in index order.
+
+    Built on the first entity-filtered query and kept with _index_lookup(),
+    so plain greps never touch entities and entity greps do one substring
+    search per chunk instead of lowercasing every value on every query.
+    """
+    lookup = _index_lookup(index)
+    if lookup["entity_blobs"] is None:
+        lookup["entity_blobs"] = [
+            _ENTITY_SEP.join(_entity_values(c)) for c in index.get("chunks", [])
+        ]
+    return lookup["entity_blobs"]
 
-    entity_lower = entity.lower()
-    for vals in chunk_entities.values():
-        if isinstance(vals, list):
-            for e in vals:
-                if entity_lower in str(e).lower():
-                    return True
-    return False
 
+def _trigrams(text: str) -> set[str]:
+    """All 3-character substrings of text."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
 
-def _check_duplicate(content_hash: str) -> dict | None:
+
+def _add_entity_postings(postings: dict, pos: int, blob: str) -> None:
+    """Index one chunk's entity trigrams (per value, so none span two values)."""
+    grams = set()
+    for value in blob.split(_ENTITY_SEP):
+        grams |= _trigrams(value)
+    for gram in grams:
+        postings.setdefault(gram, []).append(pos)
+
+
+def _entity_candidates(index: dict, entity_lower: str) -> list[int] | None:
+    """
+    Positions whose entities may contain entity_lower, from a trigram index.
+
+    A substring match implies every trigram of the query appears in the
+    same value, so intersecting posting lists gives a superset of matches
+    (callers still confirm against _entity_blobs). Returns None for queries
+    shorter than 3 characters, which have no trigrams to look up.
+    """
+    if len(entity_lower) < 3:
+        return None
+
+    lookup = _index_lookup(index)
+    if lookup["entity_trigrams"] is None:
+        postings: dict[str, list[int]] = {}
+        for pos, blob in enumerate(_entity_blobs(index)):
+            _add_entity_postings(postings, pos, blob)
+        lookup["entity_trigrams"] = postings
+
+    lists = sorted(
+        (lookup["entity_trigrams"].get(gram, []) for gram in _trigrams(entity_lower)), key=len
+    )
+    if not lists[0]:
+        return []
+    return sorted(set(lists[0]).intersection(*lists[1:]))
+
+
+def _index_lookup(index: dict) -> dict:
+    """
+    Secondary lookups over index["chunks"], rebuilt once per index version.
+
+    Held in memory next to the cached index rather than written to
+    index.json, so writers that don't know about them (retention, older
+    versions) can never leave them stale.
+
+    Returns:
+        Dict with "by_id" ({id: position}), "by_project" / "by_domain"
+        ({value: [positions]}), "by_hash" ({hash_algo: {hash: first position}}),
+        "dates" / "date_positions" (parallel lists sorted by YYYY-MM-DD, for
+        bisect), "entity_blobs" / "entity_trigrams" (see _entity_blobs and
+        _entity_candidates, None until first needed) and "size" (number of
+        chunks covered).
+    """
+    key = _INDEX_CACHE["key"] if index is _INDEX_CACHE["data"] else None
+    if key is not None and key == _LOOKUP_CACHE["key"] and index is _LOOKUP_CACHE["index"]:
+        return _LOOKUP_CACHE["lookup"]
+
+    lookup = {
+        "by_id": {},
+        "by_project": {},
+        "by_domain": {},
+        "by_hash": {},
+        "dates": [],
+        "date_positions": [],
+        "entity_blobs": None,  # built lazily by _entity_blobs()
+        "entity_trigrams": None,  # built lazily by _entity_candidates()
+        "size": 0,
+    }
+    dated: list[tuple[str, int]] = []
+
+    for pos, chunk_info in enumerate(index.get("chunks", [])):
+        chunk_date = _lookup_add(lookup, pos, chunk_info)
+        if chunk_date is not None:
+            dated.append((chunk_date, pos))
+
+    dated.sort()
+    lookup["dates"] = [d for d, _ in dated]
+    lookup["date_positions"] = [p for _, p in dated]
+    lookup["size"] = len(index.get("chunks", []))
+
+    if key is not None:
+        _LOOKUP_CACHE.update(key=key, index=index, lookup=lookup)
+    return lookup
+
+
+def _lookup_add(lookup: dict, pos: int, chunk_info: dict) -> str | None:
+    """Record one chunk in the id/project/domain/hash maps; return its date."""
+    lookup["by_id"][chunk_info.get("id")] = pos
+    lookup["by_project"].setdefault(chunk_info.get("project"), []).append(pos)
+    lookup["by_domain"].setdefault(chunk_info.get("domain"), []).append(pos)
+    if chunk_info.get("content_hash"):
+        hashes = lookup["by_hash"].setdefault(chunk_info.get("hash_algo", "sha256"), {})
+        hashes.setdefault(chunk_info["content_hash"], pos)
+    return _parse_date_from_chunk(chunk_info)
+
+
+def _extend_lookup(index: dict, lookup: dict) -> None:
+    """
+    Carry a lookup over chunks appended to index since it was built.
+
+    Called by chunk() right after _save_index(), so bulk ingest doesn't
+    rebuild every lookup from scratch on each save. Does nothing unless
+    lookup is the cached one for this index.
+    """
+    if _LOOKUP_CACHE["lookup"] is not lookup or _LOOKUP_CACHE["index"] is not index:
+        return
+    if index is not _INDEX_CACHE["data"] or _INDEX_CACHE["key"] is None:
+        return
+
+    chunks = index.get("chunks", [])
+    for pos in range(lookup["size"], len(chunks)):
+        chunk_date = _lookup_add(lookup, pos, chunks[pos])
+        if chunk_date is not None:
+            at = bisect_right(lookup["dates"], chunk_date)
+            lookup["dates"].insert(at, chunk_date)
+            lookup["date_positions"].insert(at, pos)
+        if lookup["entity_blobs"] is not None:
+            blob = _ENTITY_SEP.join(_entity_values(chunks[pos]))
+            lookup["entity_blobs"].append(blob)
+            if lookup["entity_trigrams"] is not None:
+                _add_entity_postings(lookup["entity_trigrams"], pos, blob)
+    lookup["size"] = len(chunks)
+    _LOOKUP_CACHE["key"] = _INDEX_CACHE["key"]
+
+
+def _filter_chunks(
+    index: dict,
+    project: str | None = None,
+    domain: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    entity: str | None = None,
+) -> list[dict]:
+    """
+    Select chunks matching grep filters, in index order.
+
+    Project/domain/date filters are answered from _index_lookup() (O(k) in
+    the number of matches); the entity filter is applied to what remains.
+
+    Returns:
+        List of chunk metadata dicts
+    """
+    chunks = index.get("chunks", [])
+    candidate_sets = []
+
+    if project or domain or date_from is not None or date_to is not None:
+        lookup = _index_lookup(index)
+        if project:
+            candidate_sets.append(lookup["by_project"].get(project, []))
+        if domain:
+            candidate_sets.append(lookup["by_domain"].get(domain, []))
+        # Phase 7.1: same semantics as _chunk_in_date_range (inclusive bounds,
+        # undated chunks excluded as soon as a range is given)
+        if date_from is not None or date_to is not None:
+            dates = lookup["dates"]
+            lo = bisect_left(dates, date_from) if date_from else 0
+            hi = bisect_right(dates, date_to) if date_to else len(dates)
+            candidate_sets.append(lookup["date_positions"][lo:hi])
+
+    if candidate_sets:
+        positions = sorted(set(candidate_sets[0]).intersection(*candidate_sets[1:]))
+    else:
+        positions = range(len(chunks))
+
+    # Phase 7.2: Apply entity filter
+    if entity:
+        entity_lower = entity.lower()
+        if _ENTITY_SEP in entity_lower:
+            positions = [p for p in positions if _entity_matches(chunks[p], entity)]
+        else:
+            # Phase 7.2: narrow with the trigram index, then confirm substrings
+            hits = _entity_candidates(index, entity_lower)
+            if hits is not None:
+                if candidate_sets:
+                    allowed = set(positions)
+                    hits = [p for p in hits if p in allowed]
+                positions = hits
+            blobs = _entity_blobs(index)
+            positions = [p for p in positions if entity_lower in blobs[p]]
+
+    if not candidate_sets and not entity:
+        return chunks
+    return [chunks[pos] for pos in positions]
+
+
+def _check_duplicate(content: str, content_hash: str) -> dict | None:
     """
     Check if content with this hash already exists (Phase 4.2).
 
+    Chunks indexed before hash_algo was recorded carry a sha256 hash; content
+    is re-hashed once per algorithm found in the index so they still match.
+
     Args:
-        content_hash: MD5 hash of normalized content
+        content: The text content being saved
+        content_hash: Hash of content with HASH_ALGO
 
     Returns:
         Existing chunk info if duplicate found, None otherwise
     """
     index = _load_index()
+    first = None
 
-    for chunk_info in index.get("chunks", []):
-        if chunk_info.get("content_hash") == content_hash:
-            return chunk_info
+    for algo, hashes in _index_lookup(index)["by_hash"].items():
+        if algo == HASH_ALGO:
+            pos = hashes.get(content_hash)
+        elif algo == "sha256" or (algo == "xxh3_128" and XXHASH_AVAILABLE):
+            pos = hashes.get(_content_hash(content, algo))
+        else:
+            continue
+        if pos is not None and (first is None or pos < first):
+            first = pos
 
-    return None
+    return index["chunks"][first] if first is not None else None
 
 
 def _increment_access(chunk_id: str) -> None:
     """
     Increment access counter for a chunk (Phase 4.3).
 
-    Uses file locking to prevent race conditions on concurrent access.
+    Appends to the access log instead of rewriting index.json; _load_index()
+    folds pending accesses in and _save_index() compacts them.
 
     Args:
         chunk_id: ID of the chunk being accessed
     """
-    default_index = {
-        "version": "2.0.0",
-        "created_at": datetime.now().isoformat(),
-        "chunks": [],
-        "total_chunks": 0,
-        "total_tokens_estimate": 0,
-        "last_chunking": None,
-    }
-
-    with locked_json_update(INDEX_FILE, default=default_index) as index:
-        for chunk_info in index.get("chunks", []):
-            if chunk_info["id"] == chunk_id:
-                chunk_info["access_count"] = chunk_info.get("access_count", 0) + 1
-                chunk_info["last_accessed"] = datetime.now().isoformat()
-                break
-        index["last_chunking"] = datetime.now().isoformat()
-        index["total_chunks"] = len(index.get("chunks", []))
+    append_access(INDEX_FILE.with_name(ACCESS_LOG_NAME), chunk_id, datetime.now().isoformat())
 
 
-def _generate_chunk_id(project: str = None, ticket: str = None, domain: str = None) -> str:
+def _generate_chunk_id(
+    project: str = None,
+    ticket: str = None,
+    domain: str = None,
+    today: str | None = None,
+    index: dict | None = None,
+) -> str:
     """
     Generate a unique chunk ID (Phase 5.5 enhanced).
 
@@ -480,12 +820,15 @@ def _generate_chunk_id(project: str = None, ticket: str = None, domain: str = No
         project: Project name (auto-detected if None)
         ticket: Optional ticket reference (e.g., "JJ-123")
         domain: Optional domain (e.g., "bp", "seo")
+        today: Date prefix as YYYY-MM-DD (default: today)
+        index: Index to number against, including unsaved entries (default: loaded)
 
     Returns:
         Unique chunk ID string
     """
-    today = datetime.now().strftime("%Y-%m-%d")
-    index = _load_index()
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    if index is None:
+        index = _load_index()
 
     # Auto-detect project if not provided
     if project is None:
@@ -554,6 +897,142 @@ def chunk(
     Returns:
         Dictionary with chunk_id and confirmation, or duplicate/redirect status
     """
+    rejection = _check_chunk_request(content, chunk_type)
+    if rejection:
+        return rejection
+
+    CHUNKS_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Phase 4.2: Check for duplicates
+    content_hash = _content_hash(content)
+    existing = _check_duplicate(content, content_hash)
+
+    if existing:
+        return _duplicate_result(existing)
+
+    # One timestamp for the whole save: header, index entry and session agree
+    now = datetime.now()
+    now_iso = now.isoformat()
+    today = now.strftime("%Y-%m-%d")
+
+    # Phase 5.5: Resolve project once, then generate ID with project/ticket/domain
+    resolved_project = project if project else _detect_project()
+
+    index = _load_index()
+    lookup = _index_lookup(index)
+    entry = _write_chunk(
+        index,
+        content,
+        content_hash,
+        summary,
+        tags,
+        resolved_project,
+        ticket,
+        domain,
+        chunk_type,
+        now_iso,
+        today,
+    )
+
+    # Update index
+    index["chunks"].append(entry)
+    index["total_tokens_estimate"] = sum(c["tokens_estimate"] for c in index["chunks"])
+    _save_index(index, now_iso)
+    _extend_lookup(index, lookup)
+
+    _embed_chunks([(entry, content)])
+    _link_sessions([entry], today, now_iso)
+
+    return _created_result(entry)
+
+
+def chunk_many(items: list[dict]) -> list[dict]:
+    """
+    Save several chunks at once, with a single index write.
+
+    Each item takes the keyword arguments of chunk() ("content" is required).
+    Project detection, the index load/save, embedding (one batched call) and
+    session registration are paid once per batch instead of once per chunk.
+    Content repeated within the batch is reported as a duplicate of its
+    first occurrence.
+
+    Args:
+        items: List of dicts with chunk() arguments
+
+    Returns:
+        List of chunk() result dicts, one per item, in order
+    """
+    CHUNKS_DIR.mkdir(parents=True, exist_ok=True)
+
+    now = datetime.now()
+    now_iso = now.isoformat()
+    today = now.strftime("%Y-%m-%d")
+    detected_project = None
+
+    index = _load_index()
+    lookup = _index_lookup(index)
+    batch_hashes: dict[str, dict] = {}
+    created: list[tuple[dict, str]] = []
+    results = []
+
+    try:
+        for item in items:
+            content = item.get("content", "")
+            chunk_type = item.get("chunk_type", "session")
+
+            rejection = _check_chunk_request(content, chunk_type)
+            if rejection:
+                results.append(rejection)
+                continue
+
+            content_hash = _content_hash(content)
+            existing = batch_hashes.get(content_hash) or _check_duplicate(content, content_hash)
+            if existing:
+                results.append(_duplicate_result(existing))
+                continue
+
+            resolved_project = item.get("project")
+            if not resolved_project:
+                if detected_project is None:
+                    detected_project = _detect_project()
+                resolved_project = detected_project
+
+            entry = _write_chunk(
+                index,
+                content,
+                content_hash,
+                item.get("summary", ""),
+                item.get("tags"),
+                resolved_project,
+                item.get("ticket"),
+                item.get("domain"),
+                chunk_type,
+                now_iso,
+                today,
+            )
+            index["chunks"].append(entry)
+            batch_hashes[content_hash] = entry
+            created.append((entry, content))
+            results.append(_created_result(entry))
+
+        if created:
+            index["total_tokens_estimate"] = sum(c["tokens_estimate"] for c in index["chunks"])
+            _save_index(index, now_iso)
+    except BaseException:
+        # Entries may have been appended to the cached index without being saved
+        _INDEX_CACHE["key"] = None
+        raise
+
+    if created:
+        _extend_lookup(index, lookup)
+        _embed_chunks(created)
+        _link_sessions([entry for entry, _ in created], today, now_iso)
+
+    return results
+
+
+def _check_chunk_request(content: str, chunk_type: str) -> dict | None:
+    """Redirect/error result for a chunk() call that can't be saved, else None."""
     # Phase 9: chunk_type validation
     if chunk_type == "insight":
         return {
@@ -574,8 +1053,6 @@ def chunk(
             ),
         }
 
-    CHUNKS_DIR.mkdir(parents=True, exist_ok=True)
-
     # Phase 6: Content size limit
     if len(content) > MAX_CHUNK_CONTENT_SIZE:
         return {
@@ -583,18 +1060,62 @@ def chunk(
             "message": f"Content too large ({len(content)} bytes). Maximum: {MAX_CHUNK_CONTENT_SIZE} bytes.",
         }
 
-    # Phase 4.2: Check for duplicates
-    content_hash = _content_hash(content)
-    existing = _check_duplicate(content_hash)
+    return None
 
-    if existing:
-        return {
-            "status": "duplicate",
-            "existing_chunk_id": existing["id"],
-            "existing_summary": existing.get("summary", ""),
-            "message": f"Content already exists in chunk {existing['id']}",
-        }
 
+def _duplicate_result(existing: dict) -> dict:
+    """chunk() result for content already stored in another chunk."""
+    return {
+        "status": "duplicate",
+        "existing_chunk_id": existing["id"],
+        "existing_summary": existing.get("summary", ""),
+        "message": f"Content already exists in chunk {existing['id']}",
+    }
+
+
+def _created_result(entry: dict) -> dict:
+    """chunk() result for a newly written chunk."""
+    return {
+        "status": "created",
+        "chunk_id": entry["id"],
+        "tokens_estimate": entry["tokens_estimate"],
+        "summary": entry["summary"],
+        "message": f"Chunk {entry['id']} created ({entry['tokens_estimate']} tokens estimated)",
+    }
+
+
+def _write_chunk(
+    index: dict,
+    content: str,
+    content_hash: str,
+    summary: str,
+    tags: list[str] | None,
+    project: str,
+    ticket: str | None,
+    domain: str | None,
+    chunk_type: str,
+    now_iso: str,
+    today: str,
+) -> dict:
+    """
+    Write a chunk file and return its index entry (not yet added to index).
+
+    Args:
+        index: Index the new ID is numbered against
+        content: Chunk content
+        content_hash: _content_hash(content)
+        summary: Summary (auto-generated if empty)
+        tags: Keywords
+        project: Resolved project name
+        ticket: Optional ticket reference
+        domain: Optional domain
+        chunk_type: Validated chunk type
+        now_iso: Creation timestamp
+        today: Creation date as YYYY-MM-DD
+
+    Returns:
+        Index entry dict for the chunk
+    """
     # Phase 4.1: Auto-generate summary if not provided
     if not summary:
         summary = _auto_summarize(content)
@@ -603,13 +1124,12 @@ def chunk(
     entities = _extract_entities(content)
 
     # Phase 5.5: Generate ID with project/ticket/domain
-    chunk_id = _generate_chunk_id(project=project, ticket=ticket, domain=domain)
+    chunk_id = _generate_chunk_id(
+        project=project, ticket=ticket, domain=domain, today=today, index=index
+    )
     chunk_file = CHUNKS_DIR / f"{chunk_id}.md"
     tokens = _estimate_tokens(content)
 
-    # Resolve project for metadata (in case it was auto-detected)
-    resolved_project = project if project else _detect_project()
-
     # Build entities string for YAML header
     entities_yaml_parts = []
     for etype, evals in entities.items():
@@ -625,10 +1145,10 @@ tags: {", ".join(tags or [])}
 chunk_type: {chunk_type}
 entities:
 {entities_yaml}
-project: {resolved_project}
+project: {project}
 ticket: {ticket or ""}
 domain: {domain or ""}
-created_at: {datetime.now().isoformat()}
+created_at: {now_iso}
 tokens_estimate: {tokens}
 content_hash: {content_hash}
 format_version: "2.0"
@@ -636,79 +1156,91 @@ format_version: "2.0"
 
 """
 
-    atomic_write_text(chunk_file, header + content)
+    header_bytes = header.encode("utf-8")
+    atomic_write_bytes(chunk_file, header_bytes, content.encode("utf-8"))
+
+    return {
+        "id": chunk_id,
+        "file": f"chunks/{chunk_id}.md",
+        "summary": summary,
+        "tags": tags or [],
+        "tokens_estimate": tokens,
+        "content_hash": content_hash,
+        "hash_algo": HASH_ALGO,
+        # Body starts right after the closing "---" line (see _open_body)
+        "content_offset": header_bytes.rindex(b"---\n") + 4,
+        "access_count": 0,
+        "last_accessed": None,
+        "created_at": now_iso,
+        # Phase 9 fields
+        "chunk_type": chunk_type,
+        # Phase 5.5 fields
+        "project": project,
+        "ticket": ticket,
+        "domain": domain,
+        "format_version": "2.0",
+        # Phase 7.2 fields
+        "entities": entities,
+        # Phase 5.6: keyword immunity, so retention needn't re-read the file
+        "protected_keyword": _has_protected_keyword(header) or _has_protected_keyword(content),
+    }
 
-    # Update index
-    index = _load_index()
-    index["chunks"].append(
-        {
-            "id": chunk_id,
-            "file": f"chunks/{chunk_id}.md",
-            "summary": summary,
-            "tags": tags or [],
-            "tokens_estimate": tokens,
-            "content_hash": content_hash,
-            "access_count": 0,
-            "last_accessed": None,
-            "created_at": datetime.now().isoformat(),
-            # Phase 9 fields
-            "chunk_type": chunk_type,
-            # Phase 5.5 fields
-            "project": resolved_project,
-            "ticket": ticket,
-            "domain": domain,
-            "format_version": "2.0",
-            # Phase 7.2 fields
-            "entities": entities,
-        }
-    )
-    index["total_tokens_estimate"] = sum(c["tokens_estimate"] for c in index["chunks"])
-    _save_index(index)
 
-    # Phase 8: Generate embedding if semantic search available
+def _embed_chunks(created: list[tuple[dict, str]]) -> None:
+    """
+    Embed new chunks and store their vectors (Phase 8), in one provider call.
+
+    Args:
+        created: (index entry, content) pairs
+    """
     # Phase 8.1: Enrich text with metadata for better semantic matching
     try:
         from .embeddings import _get_cached_provider
-        from .vecstore import VectorStore
+        from .vecstore import get_store
 
         provider = _get_cached_provider()
         if provider is not None:
-            embed_text = content
-            if summary:
-                embed_text = f"{summary}\n{embed_text}"
-            if tags:
-                embed_text = f"{', '.join(tags)}\n{embed_text}"
-            vec = provider.embed([embed_text])[0]
-            store = VectorStore()
-            store.load()
-            store.add(chunk_id, vec)
+            texts = []
+            for entry, content in created:
+                embed_text = content
+                if entry["summary"]:
+                    embed_text = f"{entry['summary']}\n{embed_text}"
+                if entry["tags"]:
+                    embed_text = f"{', '.join(entry['tags'])}\n{embed_text}"
+                texts.append(embed_text)
+            vectors = provider.embed(texts)
+            store = get_store()
+            for (entry, _), vec in zip(created, vectors, strict=True):
+                store.add(entry["id"], vec)
             store.save()
     except Exception:
         pass  # Semantic is optional, never block chunk creation
 
-    # Phase 5.5: Register session and link chunk
-    if resolved_project:
-        # Create or get session for this project/domain combo
-        session_id = f"{datetime.now().strftime('%Y-%m-%d')}_{resolved_project}"
-        if domain:
-            session_id += f"_{domain}"
-
-        register_session(
-            session_id=session_id,
-            project=resolved_project,
-            path=str(Path.cwd()),
-            domain=domain or "",
-            ticket=ticket or "",
-        )
-        add_chunk_to_session(chunk_id, session_id)
 
-    return {
-        "status": "created",
-        "chunk_id": chunk_id,
-        "tokens_estimate": tokens,
-        "summary": summary,
-        "message": f"Chunk {chunk_id} created ({tokens} tokens estimated)",
-    }
+def _link_sessions(entries: list[dict], today: str, now_iso: str) -> None:
+    """Phase 5.5: Register each chunk's session and link the chunk to it."""
+    registered = set()
+    for entry in entries:
+        project = entry["project"]
+        if not project:
+            continue
+
+        # Create or get session for this project/domain combo
+        session_id = f"{today}_{project}"
+        if entry["domain"]:
+            session_id += f"_{entry['domain']}"
+
+        if session_id not in registered:
+            register_session(
+                session_id=session_id,
+                project=project,
+                path=str(Path.cwd()),
+                domain=entry["domain"] or "",
+                ticket=entry["ticket"] or "",
+                started=now_iso,
+            )
+            registered.add(session_id)
+        add_chunk_to_session(entry["id"], session_id)
 
 
 def peek(chunk_id: str, start: int = 0, end: int | None = None) -> dict:
@@ -736,10 +1268,8 @@ def peek(chunk_id: str, start: int = 0, end: int | None = None) -> dict:
 
     # Phase 5.6: Check archives if not in active storage
     if not chunk_file.exists():
-        archive_file = safe_path(ARCHIVE_DIR, chunk_id, ".md.gz")
-        if archive_file is None:
-            return {"status": "error", "message": f"Invalid chunk ID format: {chunk_id}"}
-        if archive_file.exists():
+        # chunk_id was validated by safe_path() above
+        if any((ARCHIVE_DIR / f"{chunk_id}{suffix}").exists() for suffix in ARCHIVE_SUFFIXES):
             # Auto-restore from archive
             try:
                 from .retention import restore_chunk
@@ -759,21 +1289,12 @@ def peek(chunk_id: str, start: int = 0, end: int | None = None) -> dict:
         else:
             return {"status": "not_found", "message": f"Chunk {chunk_id} not found"}
 
-    with open(chunk_file, encoding="utf-8") as f:
-        lines = f.readlines()
-
-    # Skip YAML header (find end of ---)
-    content_start = 0
-    in_header = False
-    for i, line in enumerate(lines):
-        if line.strip() == "---":
-            if not in_header:
-                in_header = True
-            else:
-                content_start = i + 1
-                break
-
-    content_lines = lines[content_start:]
+    # Skip YAML header (jump to the recorded offset, or find end of ---)
+    index = _load_index()
+    pos = _index_lookup(index)["by_id"].get(chunk_id)
+    content_offset = index["chunks"][pos].get("content_offset") if pos is not None else None
+    with _open_body(chunk_file, content_offset) as f:
+        content_lines = list(f)
 
     # Apply start/end
     if end is None:
@@ -793,6 +1314,174 @@ def peek(chunk_id: str, start: int = 0, end: int | None = None) -> dict:
     }
 
 
+def _iter_body_lines(f):
+    """
+    Yield the content lines of an open chunk file, skipping the YAML header.
+
+    Only the header is buffered; the body is streamed. A file whose header
+    never closes is returned whole, as the original readlines() scan did.
+    """
+    header = []
+    dashes = 0
+    for line in f:
+        header.append(line)
+        if line.strip() == "---":
+            dashes += 1
+            if dashes == 2:
+                yield from f
+                return
+    yield from header
+
+
+@contextmanager
+def _open_body(chunk_file: Path, content_offset: int | None = None):
+    """
+    Open a chunk file and yield an iterator over its body lines.
+
+    content_offset is the byte offset recorded by chunk() just past the
+    closing "---" line. It is trusted only if that line is really there;
+    otherwise (older chunks, files edited by hand) the header is scanned.
+    """
+    with open(chunk_file, "rb") as raw:
+        if content_offset and content_offset >= 4:
+            raw.seek(content_offset - 4)
+            if raw.read(4) == b"---\n":
+                with io.TextIOWrapper(raw, encoding="utf-8") as f:
+                    yield f
+                return
+            raw.seek(0)
+        with io.TextIOWrapper(raw, encoding="utf-8") as f:
+            yield _iter_body_lines(f)
+
+
+# Characters that make a pattern a regex rather than a plain literal.
+_REGEX_META = frozenset(r".^$*+?{}[]\|()")
+
+# ASCII letters that re.IGNORECASE also matches against non-ASCII code points
+# (dotted/dotless I, long S, Kelvin sign), which bytes.lower() cannot see.
+_NON_ASCII_FOLDS = frozenset(b"iks")
+
+
+def _literal_needle(pattern: str) -> bytes | None:
+    """
+    Return the lowercased bytes of an ASCII literal pattern, or None.
+
+    Used by grep() to rule chunks out with a single C-level substring
+    search before any per-line regex work.
+    """
+    if not pattern or not pattern.isascii() or _REGEX_META.intersection(pattern):
+        return None
+    return pattern.lower().encode("ascii")
+
+
+def _may_contain(data: bytes, needle: bytes) -> bool:
+    """Case-insensitive prefilter: False only if no line can match needle."""
+    if needle in data.lower():
+        return True
+    return not data.isascii() and not _NON_ASCII_FOLDS.isdisjoint(needle)
+
+
+def _grep_file(
+    chunk_file: Path,
+    regex: re.Pattern,
+    context_lines: int,
+    max_matches: int,
+    content_offset: int | None = None,
+) -> list:
+    """
+    Stream a chunk body and collect regex matches with surrounding context.
+
+    Keeps only a rolling window of context_lines lines, and stops reading
+    once max_matches matches have their trailing context.
+
+    Returns:
+        List of (line_number, context) tuples, line numbers 1-based within the body
+    """
+    context_lines = max(0, context_lines)
+    found = []
+    before = deque(maxlen=context_lines)
+    pending = []  # [line_number, context lines, trailing lines still needed]
+    detected = 0
+
+    with _open_body(chunk_file, content_offset) as body:
+        for i, line in enumerate(body):
+            for item in pending:
+                item[1].append(line)
+                item[2] -= 1
+
+            if detected < max_matches and regex.search(line):
+                detected += 1
+                pending.append([i + 1, [*before, line], context_lines])
+
+            while pending and pending[0][2] <= 0:
+                line_number, ctx, _ = pending.pop(0)
+                found.append((line_number, "".join(ctx)))
+
+            if detected >= max_matches and not pending:
+                break
+            before.append(line)
+
+    found.extend((line_number, "".join(ctx)) for line_number, ctx, _ in pending)
+    return found
+
+
+# Below this many candidate chunks, grep() scans inline: a thread pool's
+# startup costs more than it saves.
+GREP_PARALLEL_MIN = 8
+
+
+def _present_chunk_files() -> set[str]:
+    """Index-style paths ("chunks/<name>") of the files in CHUNKS_DIR, in one scandir."""
+    try:
+        with os.scandir(CHUNKS_DIR) as entries:
+            return {f"chunks/{e.name}" for e in entries if e.name.endswith(".md")}
+    except FileNotFoundError:
+        return set()
+
+
+def _search_chunk(
+    chunk_info: dict,
+    regex: re.Pattern,
+    needle: bytes | None,
+    context_lines: int,
+    max_matches: int,
+    present: set[str] | None = None,
+) -> list[dict]:
+    """
+    Grep one chunk file, returning at most max_matches match dicts.
+
+    present, from _present_chunk_files(), replaces the per-file exists()
+    check for entries stored under chunks/.
+    """
+    chunk_file = CONTEXT_DIR / chunk_info["file"]
+
+    if present is not None and chunk_info["file"].startswith("chunks/"):
+        if chunk_info["file"] not in present:
+            return []
+    elif not chunk_file.exists():
+        return []
+
+    try:
+        # Literal patterns: skip chunks that cannot contain the text at all
+        if needle is not None and not _may_contain(chunk_file.read_bytes(), needle):
+            return []
+        found = _grep_file(
+            chunk_file, regex, context_lines, max_matches, chunk_info.get("content_offset")
+        )
+    except FileNotFoundError:
+        return []  # removed (e.g. archived) since the directory scan
+
+    return [
+        {
+            "chunk_id": chunk_info["id"],
+            "chunk_summary": chunk_info.get("summary", ""),
+            "line_number": line_number,
+            "context": context.strip(),
+        }
+        for line_number, context in found
+    ]
+
+
 def grep(
     pattern: str,
     limit: int = 10,
@@ -845,61 +1534,42 @@ def grep(
     except re.error:
         # If invalid regex, treat as literal string
         regex = re.compile(re.escape(pattern), re.IGNORECASE)
+    needle = _literal_needle(pattern)
 
-    for chunk_info in index.get("chunks", []):
-        # Phase 7.1: Apply temporal filter
-        if not _chunk_in_date_range(chunk_info, date_from, date_to):
-            continue
-        # Phase 5.5c: Apply project/domain filters
-        if project and chunk_info.get("project") != project:
-            continue
-        if domain and chunk_info.get("domain") != domain:
-            continue
-        # Phase 7.2: Apply entity filter
-        if entity and not _entity_matches(chunk_info, entity):
-            continue
-        chunk_file = CONTEXT_DIR / chunk_info["file"]
-
-        if not chunk_file.exists():
-            continue
-
-        with open(chunk_file, encoding="utf-8") as f:
-            lines = f.readlines()
-
-        # Skip YAML header
-        content_start = 0
-        in_header = False
-        for i, line in enumerate(lines):
-            if line.strip() == "---":
-                if not in_header:
-                    in_header = True
-                else:
-                    content_start = i + 1
-                    break
-
-        content_lines = lines[content_start:]
-
-        for i, line in enumerate(content_lines):
-            if regex.search(line):
-                # Get context
-                start_ctx = max(0, i - context_lines)
-                end_ctx = min(len(content_lines), i + context_lines + 1)
-                context = "".join(content_lines[start_ctx:end_ctx])
-
-                matches.append(
-                    {
-                        "chunk_id": chunk_info["id"],
-                        "chunk_summary": chunk_info.get("summary", ""),
-                        "line_number": i + 1,
-                        "context": context.strip(),
-                    }
-                )
+    # Phase 5.5c / 7.1 / 7.2: project, domain, date and entity filters
+    candidates = _filter_chunks(index, project, domain, date_from, date_to, entity)
 
+    if len(candidates) < GREP_PARALLEL_MIN:
+        for chunk_info in candidates:
+            matches.extend(
+                _search_chunk(chunk_info, regex, needle, context_lines, limit - len(matches))
+            )
+            if len(matches) >= limit:
+                break
+    else:
+        # One directory scan instead of a stat per file, when enough of the
+        # index is being searched for the scan to be the cheaper of the two
+        present = None
+        if len(candidates) * 4 >= len(index["chunks"]):
+            present = _present_chunk_files()
+
+        # Files are independent: overlap their I/O, but submit in batches so
+        # a search that hits the limit early doesn't read every candidate.
+        workers = min(32, (os.cpu_count() or 1) * 2)
+        batch_size = workers * 4
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for start in range(0, len(candidates), batch_size):
+                batch = candidates[start : start + batch_size]
+                for found in executor.map(
+                    lambda c: _search_chunk(c, regex, needle, context_lines, limit, present),
+                    batch,
+                ):
+                    matches.extend(found)
+                    if len(matches) >= limit:
+                        break
                 if len(matches) >= limit:
                     break
-
-        if len(matches) >= limit:
-            break
+        del matches[limit:]
 
     return {
         "status": "success",
@@ -914,6 +1584,118 @@ def grep(
 # =============================================================================
 
 
+def _load_chunk_body(
+    path_str: str, mtime_ns: int, size: int, content_offset: int | None
+) -> tuple[tuple[int, ...], tuple[str, ...], tuple[str, ...]]:
+    """
+    Non-empty body lines of a chunk as parallel (line_indexes, stripped, lowercased).
+
+    mtime_ns and size are part of the cache key only, so a rewritten chunk
+    file is read again instead of being served stale. The cache is bounded
+    by BODY_CACHE_MAX_BYTES; a chunk larger than the whole budget is never kept.
+    """
+    key = (path_str, mtime_ns, size, content_offset)
+    with _BODY_CACHE_LOCK:
+        entry = _BODY_CACHE.get(key)
+        if entry is not None:
+            _BODY_CACHE.move_to_end(key)
+            return entry[1]
+
+    with _open_body(Path(path_str), content_offset) as f:
+        numbered = [(i, text) for i, text in enumerate(line.strip() for line in f) if text]
+    stripped = tuple(text for _, text in numbered)
+    body = tuple(i for i, _ in numbered), stripped, tuple(text.lower() for text in stripped)
+
+    cost = 2 * size
+    if cost <= BODY_CACHE_MAX_BYTES:
+        with _BODY_CACHE_LOCK:
+            if key not in _BODY_CACHE:
+                _BODY_CACHE[key] = (cost, body)
+                _BODY_CACHE_STATE["bytes"] += cost
+                while _BODY_CACHE_STATE["bytes"] > BODY_CACHE_MAX_BYTES:
+                    evicted_cost, _ = _BODY_CACHE.popitem(last=False)[1]
+                    _BODY_CACHE_STATE["bytes"] -= evicted_cost
+    return body
+
+
+def _clear_body_cache() -> None:
+    """Drop every cached chunk body."""
+    with _BODY_CACHE_LOCK:
+        _BODY_CACHE.clear()
+        _BODY_CACHE_STATE["bytes"] = 0
+
+
+def _fuzzy_line_scores(pattern_lower: str, lowered: tuple[str, ...], threshold: int):
+    """
+    Yield (position, score) for body lines scoring at least threshold.
+
+    Scores are thefuzz-compatible: partial_ratio on lowercased text, rounded
+    to an int. Lines containing the pattern score 100 without being scored;
+    with rapidfuzz the remaining lines of a chunk are scored in a single call.
+
+    Args:
+        pattern_lower: Lowercased search pattern
+        lowered: Lowercased body lines from _load_chunk_body(); positions index it
+        threshold: Minimum score 0-100
+    """
+    exact = set()
+    if pattern_lower:
+        exact = {pos for pos, text in enumerate(lowered) if pattern_lower in text}
+
+    if process is None:
+        for pos, text in enumerate(lowered):
+            score = 100 if pos in exact else fuzz.partial_ratio(pattern_lower, text)
+            if score >= threshold:
+                yield pos, score
+        return
+
+    # Lines are already lowercased: score them as-is (processor=None)
+    rest = range(len(lowered))
+    choices = lowered
+    if exact:
+        rest = [pos for pos in rest if pos not in exact]
+        choices = [lowered[pos] for pos in rest]
+
+    # Cut off half a point low so rounding matches thefuzz's int scores
+    hits = process.extract(
+        pattern_lower,
+        choices,
+        scorer=fuzz.partial_ratio,
+        processor=None,
+        score_cutoff=min(max(threshold - 0.5, 0), 100),
+        limit=None,
+    )
+    scored = [(rest[k], int(round(raw))) for _, raw, k in hits]
+    scored.extend((pos, 100) for pos in exact)
+    for pos, score in sorted(scored):
+        if score >= threshold:
+            yield pos, score
+
+
+def _fuzzy_scan_chunk(chunk_info: dict, pattern_lower: str, threshold: int) -> list[tuple]:
+    """
+    Fuzzy-score one chunk's body lines.
+
+    Returns:
+        (line_number, score, stripped line) for each line at or above threshold,
+        in line order; empty if the chunk file is missing
+    """
+    chunk_file = CONTEXT_DIR / chunk_info["file"]
+    try:
+        stat = chunk_file.stat()
+    except FileNotFoundError:
+        return []
+
+    line_indexes, stripped, lowered = _load_chunk_body(
+        str(chunk_file), stat.st_mtime_ns, stat.st_size, chunk_info.get("content_offset")
+    )
+    # partial_ratio finds best partial match (handles substrings)
+    return [
+        (line_indexes[pos] + 1, score, stripped[pos])
+        for pos, score in _fuzzy_line_scores(pattern_lower, lowered, threshold)
+    ]
+
+
 def grep_fuzzy(
     pattern: str,
     threshold: int = 80,
@@ -927,7 +1709,7 @@ def grep_fuzzy(
     """
     Fuzzy grep - find matches even with typos (Phase 5.2).
 
-    Uses thefuzz library for approximate string matching.
+    Uses rapidfuzz (or thefuzz as a fallback) for approximate string matching.
     Tolerates typos like "validaton" finding "validation".
 
     Phase 7.1: Supports temporal filtering by date range.
@@ -949,76 +1731,61 @@ def grep_fuzzy(
     if not FUZZY_AVAILABLE:
         return {
             "status": "error",
-            "message": "Fuzzy search requires thefuzz: pip install mcp-rlm-server[fuzzy]",
+            "message": (
+                "Fuzzy search requires rapidfuzz or thefuzz: pip install mcp-rlm-server[fuzzy]"
+            ),
         }
 
     index = _load_index()
-    matches = []
-
-    for chunk_info in index.get("chunks", []):
-        # Phase 7.1: Apply temporal filter
-        if not _chunk_in_date_range(chunk_info, date_from, date_to):
-            continue
-        # Phase 5.5c: Apply project/domain filters
-        if project and chunk_info.get("project") != project:
-            continue
-        if domain and chunk_info.get("domain") != domain:
-            continue
-        # Phase 7.2: Apply entity filter
-        if entity and not _entity_matches(chunk_info, entity):
-            continue
-
-        chunk_file = CONTEXT_DIR / chunk_info["file"]
-
-        if not chunk_file.exists():
-            continue
-
-        with open(chunk_file, encoding="utf-8") as f:
-            lines = f.readlines()
-
-        # Skip YAML header
-        content_start = 0
-        in_header = False
-        for i, line in enumerate(lines):
-            if line.strip() == "---":
-                if not in_header:
-                    in_header = True
-                else:
-                    content_start = i + 1
-                    break
-
-        content_lines = lines[content_start:]
-
-        # Search line by line with fuzzy matching
-        for i, line in enumerate(content_lines):
-            line_text = line.strip()
-            if not line_text:
-                continue
-
-            # partial_ratio finds best partial match (handles substrings)
-            score = fuzz.partial_ratio(pattern.lower(), line_text.lower())
-
-            if score >= threshold:
-                matches.append(
-                    {
-                        "chunk_id": chunk_info["id"],
-                        "chunk_summary": chunk_info.get("summary", ""),
-                        "line_number": i + 1,
-                        "score": score,
-                        "context": line_text[:150],  # Truncate for readability
-                    }
-                )
-
-    # Sort by score (highest first)
-    matches.sort(key=lambda x: x["score"], reverse=True)
+    # Min-heap of the best `limit` matches keyed by (score, -order): among equal
+    # scores the earliest match wins, as with the former stable sort. Orders are
+    # unique, so tuple comparison never reaches the chunk_info dicts.
+    heap = []
+    order = 0
+    pattern_lower = pattern.lower()
+
+    # Phase 5.5c / 7.1 / 7.2: project, domain, date and entity filters
+    candidates = _filter_chunks(index, project, domain, date_from, date_to, entity)
+
+    def scan(chunk_info):
+        return _fuzzy_scan_chunk(chunk_info, pattern_lower, threshold)
+
+    # Chunks are independent and rapidfuzz releases the GIL: score them on a
+    # thread pool once there are enough of them. map() keeps index order.
+    if len(candidates) < GREP_PARALLEL_MIN:
+        scanned = list(map(scan, candidates))
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as executor:
+            scanned = list(executor.map(scan, candidates))
+
+    for chunk_info, hits in zip(candidates, scanned, strict=True):
+        for line_number, score, line_text in hits:
+            order -= 1
+            entry = (score, order, chunk_info, line_number, line_text)
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif heap and (score, order) > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+    # Sort by score (highest first); only the survivors become result dicts
+    matches = [
+        {
+            "chunk_id": chunk_info["id"],
+            "chunk_summary": chunk_info.get("summary", ""),
+            "line_number": line_number,
+            "score": score,
+            "context": line_text[:150],  # Truncate for readability
+        }
+        for score, _, chunk_info, line_number, line_text in sorted(heap, reverse=True)
+    ]
 
     return {
         "status": "success",
         "pattern": pattern,
         "fuzzy": True,
         "threshold": threshold,
-        "match_count": len(matches[:limit]),
-        "matches": matches[:limit],
+        "match_count": len(matches),
+        "matches": matches,
     }
 
 
@@ -5,7 +5,7 @@ Phase 5.6: Implements a 3-zone retention system to prevent infinite chunk accumu
 
 Zones:
 1. ACTIVE (context/chunks/*.md) - Fully searchable, access tracking
-2. ARCHIVE (context/archive/*.md.gz) - Compressed, auto-restore on peek
+2. ARCHIVE (context/archive/*.md.zst or *.md.gz) - Compressed, auto-restore on peek
 3. PURGE (deleted) - Only metadata logged in purge_log.json
 
 Retention Rules:
@@ -15,17 +15,35 @@ Retention Rules:
 """
 
 import gzip
-import json
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
 
 from .fileutil import (
+    ACCESS_LOG_NAME,
+    ARCHIVE_SUFFIXES,
     CONTEXT_DIR,
     MAX_DECOMPRESSED_SIZE,
     atomic_write_json,
+    compact_access_log,
+    fold_access_log,
+    json_loads,
     safe_path,
     validate_chunk_id,
 )
 
+# Phase 5.6: zstd archives when zstandard is installed (pip install mcp-rlm-server[fast])
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
 CHUNKS_DIR = CONTEXT_DIR / "chunks"
 ARCHIVE_DIR = CONTEXT_DIR / "archive"
 INDEX_FILE = CONTEXT_DIR / "index.json"
@@ -43,6 +61,15 @@ MIN_ACCESS_FOR_IMMUNITY = 3  # 3+ accesses = protected from archiving
 
 PROTECTED_TAGS = {"critical", "decision", "keep", "important"}
 PROTECTED_KEYWORDS = ["DECISION:", "IMPORTANT:", "A RETENIR:", "CRITICAL:"]
+_PROTECTED_KEYWORDS_RE = re.compile(
+    b"|".join(re.escape(kw.encode()) for kw in PROTECTED_KEYWORDS), re.IGNORECASE
+)
+
+# Format for new archives; restore/purge accept every suffix in ARCHIVE_SUFFIXES
+ARCHIVE_SUFFIX = ".md.zst" if ZSTD_AVAILABLE else ".md.gz"
+ZSTD_LEVEL = 3
+GZIP_LEVEL = 6  # zlib default: same ratio as 9 on chunk text, noticeably faster
+ARCHIVE_PARALLEL_MIN = 8  # Batches this large compress on a thread pool
 
 
 # =============================================================================
@@ -50,40 +77,82 @@ PROTECTED_KEYWORDS = ["DECISION:", "IMPORTANT:", "A RETENIR:", "CRITICAL:"]
 # =============================================================================
 
 
+# Parsed index.json / archive_index.json, reused until the file's stat changes
+# (retention_run archives chunk after chunk, each a load + save of both files)
+_INDEX_CACHE: dict = {"key": None, "data": None}
+_ARCHIVE_INDEX_CACHE: dict = {"key": None, "data": None}
+
+
+def _file_key(path: Path) -> tuple | None:
+    """Stat signature of a JSON file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 def _load_index() -> dict:
-    """Load chunks index from JSON file."""
-    if not INDEX_FILE.exists():
+    """Load chunks index from JSON file (cached until the file changes)."""
+    key = _file_key(INDEX_FILE)
+    if key is None:
         return {
             "version": "2.1.0",
             "created_at": datetime.now().isoformat(),
             "chunks": [],
         }
 
-    with open(INDEX_FILE, encoding="utf-8") as f:
-        return json.load(f)
+    if key == _INDEX_CACHE["key"]:
+        index = _INDEX_CACHE["data"]
+    else:
+        with open(INDEX_FILE, "rb") as f:
+            index = json_loads(f.read())
+        _INDEX_CACHE["key"] = key
+        _INDEX_CACHE["data"] = index
+
+    # Pending accesses decide immunity and archiving, so apply them first
+    fold_access_log(index, INDEX_FILE.with_name(ACCESS_LOG_NAME))
+    return index
 
 
 def _save_index(index: dict) -> None:
-    """Save chunks index atomically."""
-    atomic_write_json(INDEX_FILE, index)
+    """Save chunks index atomically (compact: it is only read by the tools)."""
+    try:
+        with compact_access_log(index, INDEX_FILE.with_name(ACCESS_LOG_NAME)):
+            atomic_write_json(INDEX_FILE, index, compact=True)
+    except Exception:
+        _INDEX_CACHE["key"] = None
+        raise
+    _INDEX_CACHE["key"] = _file_key(INDEX_FILE)
+    _INDEX_CACHE["data"] = index
 
 
 def _load_archive_index() -> dict:
-    """Load archive index from JSON file."""
-    if not ARCHIVE_INDEX_FILE.exists():
+    """Load archive index from JSON file (cached until the file changes)."""
+    key = _file_key(ARCHIVE_INDEX_FILE)
+    if key is None:
         return {
             "version": "1.0.0",
             "created_at": datetime.now().isoformat(),
             "archives": [],
         }
 
-    with open(ARCHIVE_INDEX_FILE, encoding="utf-8") as f:
-        return json.load(f)
+    if key != _ARCHIVE_INDEX_CACHE["key"]:
+        with open(ARCHIVE_INDEX_FILE, "rb") as f:
+            _ARCHIVE_INDEX_CACHE["data"] = json_loads(f.read())
+        _ARCHIVE_INDEX_CACHE["key"] = key
+    return _ARCHIVE_INDEX_CACHE["data"]
 
 
 def _save_archive_index(archive_index: dict) -> None:
-    """Save archive index atomically."""
-    atomic_write_json(ARCHIVE_INDEX_FILE, archive_index)
+    """Save archive index atomically and refresh the cache."""
+    try:
+        atomic_write_json(ARCHIVE_INDEX_FILE, archive_index)
+    except Exception:
+        _ARCHIVE_INDEX_CACHE["key"] = None
+        raise
+    _ARCHIVE_INDEX_CACHE["key"] = _file_key(ARCHIVE_INDEX_FILE)
+    _ARCHIVE_INDEX_CACHE["data"] = archive_index
 
 
 def _load_purge_log() -> dict:
@@ -95,8 +164,8 @@ def _load_purge_log() -> dict:
             "purged": [],
         }
 
-    with open(PURGE_LOG_FILE, encoding="utf-8") as f:
-        return json.load(f)
+    with open(PURGE_LOG_FILE, "rb") as f:
+        return json_loads(f.read())
 
 
 def _save_purge_log(purge_log: dict) -> None:
@@ -109,6 +178,12 @@ def _save_purge_log(purge_log: dict) -> None:
 # =============================================================================
 
 
+def _has_protected_keyword(content: str) -> bool:
+    """True if content contains a PROTECTED_KEYWORDS entry (case-insensitive)."""
+    content = content.upper()
+    return any(kw.upper() in content for kw in PROTECTED_KEYWORDS)
+
+
 def is_immune(chunk: dict) -> bool:
     """
     Determine if a chunk is protected from archiving/purging.
@@ -135,15 +210,24 @@ def is_immune(chunk: dict) -> bool:
     if chunk.get("access_count", 0) >= MIN_ACCESS_FOR_IMMUNITY:
         return True
 
-    # Check content for protected keywords
+    # Check content for protected keywords: recorded when the chunk was
+    # written (chunk files never change), older entries read the file
+    protected_keyword = chunk.get("protected_keyword")
+    if protected_keyword is not None:
+        return protected_keyword
+
     chunk_id = chunk.get("id", "")
     chunk_file = safe_path(CHUNKS_DIR, chunk_id, ".md") if chunk_id else None
 
     if chunk_file and chunk_file.exists():
         try:
-            content = chunk_file.read_text(encoding="utf-8").upper()
-            if any(kw.upper() in content for kw in PROTECTED_KEYWORDS):
-                return True
+            # Scan the raw bytes in place: no read, decode or upper() copy
+            with (
+                open(chunk_file, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                if _PROTECTED_KEYWORDS_RE.search(mm):
+                    return True
         except Exception:
             pass  # If we can't read, assume not immune
 
@@ -255,13 +339,57 @@ def get_purge_candidates() -> list[dict]:
 # =============================================================================
 
 
+def _find_archive(chunk_id: str) -> Path | None:
+    """Return the existing archive file for a chunk (any format), or None."""
+    for suffix in ARCHIVE_SUFFIXES:
+        archive_file = ARCHIVE_DIR / f"{chunk_id}{suffix}"
+        if archive_file.exists():
+            return archive_file
+    return None
+
+
+def _compress(content: bytes) -> bytes:
+    """Compress chunk content in the ARCHIVE_SUFFIX format."""
+    if ARCHIVE_SUFFIX == ".md.zst":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(content)
+    return gzip.compress(content, compresslevel=GZIP_LEVEL)
+
+
+def _decompress(archive_file: Path) -> bytes:
+    """
+    Decompress an archive, reading at most MAX_DECOMPRESSED_SIZE + 1 bytes.
+
+    The cap is the decompression-bomb guard: callers reject anything longer
+    than MAX_DECOMPRESSED_SIZE.
+    """
+    limit = MAX_DECOMPRESSED_SIZE + 1
+    with open(archive_file, "rb") as raw:
+        if archive_file.name.endswith(".zst"):
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError(
+                    "zstd archive requires zstandard: pip install mcp-rlm-server[fast]"
+                )
+            reader = zstandard.ZstdDecompressor().stream_reader(raw)
+        else:
+            reader = gzip.GzipFile(fileobj=raw)
+        with reader:
+            parts = []
+            while limit > 0:
+                data = reader.read(limit)
+                if not data:
+                    break
+                parts.append(data)
+                limit -= len(data)
+            return b"".join(parts)
+
+
 def archive_chunk(chunk_id: str) -> dict:
     """
     Archive a chunk by compressing it to archive/.
 
     Steps:
     1. Read chunk file
-    2. Compress to archive/*.md.gz
+    2. Compress to archive/*.md.zst (zstandard installed) or archive/*.md.gz
     3. Remove from main index
     4. Add to archive index
     5. Delete original file
@@ -272,70 +400,133 @@ def archive_chunk(chunk_id: str) -> dict:
     Returns:
         Dictionary with status and details
     """
-    # Validate chunk ID against path traversal
-    if not validate_chunk_id(chunk_id):
-        return {"status": "error", "message": f"Invalid chunk ID format: {chunk_id}"}
+    return _archive_chunks([chunk_id])[0]
+
 
-    src_file = CHUNKS_DIR / f"{chunk_id}.md"
+def _write_archive(src_file: Path, dst_file: Path) -> tuple[int, int] | Exception:
+    """
+    Compress a chunk file into its archive file.
+
+    Returns:
+        (original size, compressed size), or the error (dst_file removed)
+    """
+    try:
+        # Whole chunk in one call: chunks are capped at 2 MB
+        content = src_file.read_bytes()
+        dst_file.write_bytes(_compress(content))
+        return len(content), dst_file.stat().st_size
+    except Exception as e:
+        dst_file.unlink(missing_ok=True)
+        return e
 
-    if not src_file.exists():
-        return {"status": "error", "message": f"Chunk {chunk_id} not found in active storage"}
 
-    # Ensure archive directory exists
-    ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+def _archive_chunks(chunk_ids: list[str]) -> list[dict]:
+    """
+    Archive several chunks with a single write of each index.
 
-    dst_file = ARCHIVE_DIR / f"{chunk_id}.md.gz"
+    Every chunk is compressed first; both indexes are then updated and saved
+    once, and only after that are the original files deleted.
 
-    # Check if already archived
-    if dst_file.exists():
-        return {"status": "error", "message": f"Chunk {chunk_id} already archived"}
+    Args:
+        chunk_ids: IDs of the chunks to archive
 
-    try:
-        # Read original content
-        content = src_file.read_bytes()
-        original_size = len(content)
+    Returns:
+        One archive_chunk() result dict per chunk ID, in order
+    """
+    results: list[dict | None] = []
+    todo = {}  # chunk_id -> (result position, src_file, dst_file)
 
-        # Compress to archive
-        with gzip.open(dst_file, "wb") as f_out:
-            f_out.write(content)
+    for chunk_id in chunk_ids:
+        # Validate chunk ID against path traversal
+        if not validate_chunk_id(chunk_id):
+            results.append({"status": "error", "message": f"Invalid chunk ID format: {chunk_id}"})
+            continue
 
-        compressed_size = dst_file.stat().st_size
+        src_file = CHUNKS_DIR / f"{chunk_id}.md"
 
+        if not src_file.exists():
+            results.append(
+                {"status": "error", "message": f"Chunk {chunk_id} not found in active storage"}
+            )
+            continue
+
+        # Ensure archive directory exists
+        ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+
+        dst_file = ARCHIVE_DIR / f"{chunk_id}{ARCHIVE_SUFFIX}"
+
+        # Check if already archived (in any format)
+        if chunk_id in todo or _find_archive(chunk_id) is not None:
+            results.append({"status": "error", "message": f"Chunk {chunk_id} already archived"})
+            continue
+
+        todo[chunk_id] = (len(results), src_file, dst_file)
+        results.append(None)
+
+    # Chunks are independent and zlib/zstd release the GIL while compressing:
+    # write the archives on a thread pool once there are enough of them.
+    # map() keeps order; the indexes are only touched after the pool joins.
+    jobs = list(todo.values())
+    if len(jobs) < ARCHIVE_PARALLEL_MIN:
+        written = [_write_archive(src, dst) for _, src, dst in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as executor:
+            written = list(executor.map(lambda job: _write_archive(job[1], job[2]), jobs))
+
+    staged = {}  # chunk_id -> (result position, src_file, dst_file, sizes)
+    for (chunk_id, (pos, src_file, dst_file)), sizes in zip(todo.items(), written, strict=True):
+        if isinstance(sizes, Exception):
+            results[pos] = {"status": "error", "message": f"Failed to archive {chunk_id}: {sizes}"}
+        else:
+            staged[chunk_id] = (pos, src_file, dst_file, sizes)
+
+    if not staged:
+        return results
+
+    try:
         # Get chunk metadata from index
         index = _load_index()
-        chunk_meta = None
+        chunk_meta = {}
         remaining_chunks = []
 
         for chunk in index.get("chunks", []):
-            if chunk.get("id") == chunk_id:
-                chunk_meta = chunk.copy()
+            if chunk.get("id") in staged:
+                chunk_meta[chunk["id"]] = chunk.copy()
             else:
                 remaining_chunks.append(chunk)
 
-        if chunk_meta is None:
-            # Chunk not in index, create minimal metadata
-            chunk_meta = {"id": chunk_id}
-
-        # Update main index (remove chunk)
+        # Update main index (remove chunks)
         index["chunks"] = remaining_chunks
         index["total_chunks"] = len(remaining_chunks)
         _save_index(index)
 
         # Add to archive index
         archive_index = _load_archive_index()
-        archive_entry = chunk_meta.copy()
-        archive_entry["archived_at"] = datetime.now().isoformat()
-        archive_entry["original_size"] = original_size
-        archive_entry["compressed_size"] = compressed_size
-        archive_index["archives"].append(archive_entry)
+        archived_at = datetime.now().isoformat()
+        for chunk_id, (_, _, _, (original_size, compressed_size)) in staged.items():
+            # Chunk not in index: minimal metadata
+            archive_entry = chunk_meta.get(chunk_id, {"id": chunk_id})
+            archive_entry["archived_at"] = archived_at
+            archive_entry["original_size"] = original_size
+            archive_entry["compressed_size"] = compressed_size
+            archive_index["archives"].append(archive_entry)
         _save_archive_index(archive_index)
-
+    except Exception as e:
+        # Cleanup on error; the cached indexes may hold the unsaved edits
+        _INDEX_CACHE["key"] = _ARCHIVE_INDEX_CACHE["key"] = None
+        for chunk_id, (pos, _, dst_file, _) in staged.items():
+            if dst_file.exists():
+                dst_file.unlink()
+            results[pos] = {"status": "error", "message": f"Failed to archive {chunk_id}: {e}"}
+        return results
+
+    for chunk_id, (pos, src_file, _, (original_size, compressed_size)) in staged.items():
         # Delete original file
-        src_file.unlink()
+        src_file.unlink(missing_ok=True)
 
         compression_ratio = (1 - compressed_size / original_size) * 100 if original_size > 0 else 0
 
-        return {
+        results[pos] = {
             "status": "archived",
             "chunk_id": chunk_id,
             "original_size": original_size,
@@ -344,11 +535,7 @@ def archive_chunk(chunk_id: str) -> dict:
             "message": f"Chunk {chunk_id} archived ({compression_ratio:.1f}% compression)",
         }
 
-    except Exception as e:
-        # Cleanup on error
-        if dst_file.exists():
-            dst_file.unlink()
-        return {"status": "error", "message": f"Failed to archive {chunk_id}: {str(e)}"}
+    return results
 
 
 def restore_chunk(chunk_id: str) -> dict:
@@ -372,9 +559,9 @@ def restore_chunk(chunk_id: str) -> dict:
     if not validate_chunk_id(chunk_id):
         return {"status": "error", "message": f"Invalid chunk ID format: {chunk_id}"}
 
-    archive_file = ARCHIVE_DIR / f"{chunk_id}.md.gz"
+    archive_file = _find_archive(chunk_id)
 
-    if not archive_file.exists():
+    if archive_file is None:
         return {"status": "error", "message": f"Chunk {chunk_id} not found in archives"}
 
     dst_file = CHUNKS_DIR / f"{chunk_id}.md"
@@ -384,14 +571,13 @@ def restore_chunk(chunk_id: str) -> dict:
         return {"status": "error", "message": f"Chunk {chunk_id} already exists in active storage"}
 
     try:
-        # Decompress with size limit (gzip bomb protection)
-        with gzip.open(archive_file, "rb") as f_in:
-            content = f_in.read(MAX_DECOMPRESSED_SIZE + 1)
-            if len(content) > MAX_DECOMPRESSED_SIZE:
-                return {
-                    "status": "error",
-                    "message": f"Decompressed size exceeds {MAX_DECOMPRESSED_SIZE} bytes limit",
-                }
+        # Decompress with size limit (decompression bomb protection)
+        content = _decompress(archive_file)
+        if len(content) > MAX_DECOMPRESSED_SIZE:
+            return {
+                "status": "error",
+                "message": f"Decompressed size exceeds {MAX_DECOMPRESSED_SIZE} bytes limit",
+            }
 
         # Ensure chunks directory exists
         CHUNKS_DIR.mkdir(parents=True, exist_ok=True)
@@ -458,55 +644,90 @@ def purge_chunk(chunk_id: str) -> dict:
     Returns:
         Dictionary with status and details
     """
-    # Validate chunk ID against path traversal
-    if not validate_chunk_id(chunk_id):
-        return {"status": "error", "message": f"Invalid chunk ID format: {chunk_id}"}
+    return _purge_chunks([chunk_id])[0]
 
-    archive_file = ARCHIVE_DIR / f"{chunk_id}.md.gz"
 
-    if not archive_file.exists():
-        return {"status": "error", "message": f"Chunk {chunk_id} not found in archives"}
+def _purge_chunks(chunk_ids: list[str]) -> list[dict]:
+    """
+    Purge several archived chunks with a single write of the log and index.
+
+    Args:
+        chunk_ids: IDs of the archived chunks to purge
+
+    Returns:
+        One purge_chunk() result dict per chunk ID, in order
+    """
+    results: list[dict | None] = []
+    staged = {}  # chunk_id -> (result position, archive_file)
+
+    for chunk_id in chunk_ids:
+        # Validate chunk ID against path traversal
+        if not validate_chunk_id(chunk_id):
+            results.append({"status": "error", "message": f"Invalid chunk ID format: {chunk_id}"})
+            continue
+
+        archive_file = _find_archive(chunk_id)
+
+        if archive_file is None or chunk_id in staged:
+            results.append(
+                {"status": "error", "message": f"Chunk {chunk_id} not found in archives"}
+            )
+            continue
+
+        staged[chunk_id] = (len(results), archive_file)
+        results.append(None)
+
+    if not staged:
+        return results
 
     try:
         # Get archive metadata
         archive_index = _load_archive_index()
-        archive_meta = None
+        archive_meta = {}
         remaining_archives = []
 
         for archive in archive_index.get("archives", []):
-            if archive.get("id") == chunk_id:
-                archive_meta = archive.copy()
+            if archive.get("id") in staged:
+                archive_meta[archive["id"]] = archive.copy()
             else:
                 remaining_archives.append(archive)
 
         # Log to purge log (metadata only, no content)
         purge_log = _load_purge_log()
-        purge_entry = {
-            "id": chunk_id,
-            "purged_at": datetime.now().isoformat(),
-            "summary": archive_meta.get("summary", "") if archive_meta else "",
-            "tags": archive_meta.get("tags", []) if archive_meta else [],
-            "created_at": archive_meta.get("created_at", "") if archive_meta else "",
-            "archived_at": archive_meta.get("archived_at", "") if archive_meta else "",
-        }
-        purge_log["purged"].append(purge_entry)
+        purged_at = datetime.now().isoformat()
+        for chunk_id in staged:
+            meta = archive_meta.get(chunk_id, {})
+            purge_entry = {
+                "id": chunk_id,
+                "purged_at": purged_at,
+                "summary": meta.get("summary", ""),
+                "tags": meta.get("tags", []),
+                "created_at": meta.get("created_at", ""),
+                "archived_at": meta.get("archived_at", ""),
+            }
+            purge_log["purged"].append(purge_entry)
         _save_purge_log(purge_log)
 
         # Update archive index (remove)
         archive_index["archives"] = remaining_archives
         _save_archive_index(archive_index)
+    except Exception as e:
+        _ARCHIVE_INDEX_CACHE["key"] = None  # The cached index may hold the unsaved edit
+        for chunk_id, (pos, _) in staged.items():
+            results[pos] = {"status": "error", "message": f"Failed to purge {chunk_id}: {e}"}
+        return results
 
+    for chunk_id, (pos, archive_file) in staged.items():
         # Delete archive file
-        archive_file.unlink()
+        archive_file.unlink(missing_ok=True)
 
-        return {
+        results[pos] = {
             "status": "purged",
             "chunk_id": chunk_id,
             "message": f"Chunk {chunk_id} permanently deleted (metadata logged)",
         }
 
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to purge {chunk_id}: {str(e)}"}
+    return results
 
 
 # =============================================================================
@@ -569,10 +790,11 @@ def retention_run(archive: bool = True, purge: bool = False) -> dict:
         "errors": [],
     }
 
+    # Batched: each index is written once per run, not once per chunk
     if archive:
         candidates = get_archive_candidates()
-        for chunk in candidates:
-            result = archive_chunk(chunk["id"])
+        archived = _archive_chunks([chunk["id"] for chunk in candidates])
+        for chunk, result in zip(candidates, archived, strict=True):
             if result["status"] == "archived":
                 results["archived"].append(result["chunk_id"])
             else:
@@ -580,8 +802,8 @@ def retention_run(archive: bool = True, purge: bool = False) -> dict:
 
     if purge:
         candidates = get_purge_candidates()
-        for chunk in candidates:
-            result = purge_chunk(chunk["id"])
+        purged = _purge_chunks([chunk["id"] for chunk in candidates])
+        for chunk, result in zip(candidates, purged, strict=True):
             if result["status"] == "purged":
                 results["purged"].append(result["chunk_id"])
             else:
@@ -647,5 +869,4 @@ def is_archived(chunk_id: str) -> bool:
     """
     if not validate_chunk_id(chunk_id):
         return False
-    archive_file = ARCHIVE_DIR / f"{chunk_id}.md.gz"
-    return archive_file.exists()
+    return _find_archive(chunk_id) is not None
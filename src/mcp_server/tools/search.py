@@ -9,24 +9,59 @@ Uses BM25S library (500x faster than rank_bm25) for efficient scoring.
 Phase 5.1 implementation.
 Phase 5.5c: Added project/domain filtering.
 Phase 8: Hybrid search (BM25 + cosine similarity) when semantic deps available.
+
+The BM25 index is persisted next to the chunks directory (bm25_index/) and
+reloaded while the chunk files and memory file are unchanged.
 """
 
-import json
+import hashlib
+import importlib.util
+import os
 import re
+import shutil
+from functools import lru_cache
 from pathlib import Path
 
-# BM25S import with fallback
-try:
-    import bm25s
+from .fileutil import CONTEXT_DIR, atomic_write_json, json_loads
+from .tokenizer_fr import TOKENIZER_VERSION, tokenize_fr, tokenize_fr_batch
 
-    BM25_AVAILABLE = True
-except ImportError:
-    BM25_AVAILABLE = False
+# bm25s (and numpy, which it pulls in) costs ~0.1 s to import, so it is only
+# looked up here and imported by _bm25s() the first time an index is needed
+BM25_AVAILABLE = importlib.util.find_spec("bm25s") is not None
+bm25s = None
 
-from .fileutil import CONTEXT_DIR
-from .tokenizer_fr import tokenize_fr
+# numpy normalizes scores for hybrid fusion; it is already loaded by then
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
 
 CHUNKS_DIR = CONTEXT_DIR / "chunks"
+BM25_INDEX_DIRNAME = "bm25_index"
+BM25_MANIFEST_NAME = "manifest.json"
+# {"version": ..., "chunks": {stem: [mtime_ns, size, tokens, summary]}}
+BM25_TOKENS_NAME = "tokens.json"
+
+# Persisted index and token cache format; also covers the tokenizer output
+BM25_INDEX_VERSION = f"1/tokenizer-{TOKENIZER_VERSION}"
+
+# Header fields prepended to the indexed text (Phase 8.1)
+_HEADER_META_KEYS = frozenset({"summary", "tags", "project", "domain"})
+
+_SUMMARY_RE = re.compile(r"^summary:\s*(.+)$", re.MULTILINE)
+
+
+@lru_cache(maxsize=512)
+def _query_tokens(query: str) -> tuple[str, ...]:
+    """Tokenize a search query, memoized (the same queries come back often)."""
+    return tuple(tokenize_fr(query))
+
+
+def _bm25s():
+    """Import bm25s on first use (check BM25_AVAILABLE before calling)."""
+    global bm25s
+    if bm25s is None:
+        import bm25s as module
+
+        bm25s = module
+    return bm25s
 
 
 class RLMSearch:
@@ -47,13 +82,110 @@ class RLMSearch:
             chunks_dir: Path to chunks directory (default: RLM/context/chunks)
         """
         self.chunks_dir = chunks_dir or CHUNKS_DIR
+        self.index_dir = self.chunks_dir.parent / BM25_INDEX_DIRNAME
         self.retriever = None
         self.chunk_ids = []
         self.chunk_summaries = {}
+        self.fingerprint = None  # Corpus fingerprint the retriever was built from
 
-    def _extract_content(self, chunk_file: Path) -> str:
+    def _fingerprint(self, include_insights: bool) -> str:
         """
-        Extract content from a chunk file, skipping YAML header.
+        Fingerprint of everything build_index() reads.
+
+        Combines BM25_INDEX_VERSION with name, mtime and size of every chunk
+        file (one scandir) and, when insights are included, of the memory file.
+        """
+        entries = []
+        try:
+            with os.scandir(self.chunks_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        st = entry.stat()
+                        entries.append(f"{entry.name}:{st.st_mtime_ns}:{st.st_size}")
+        except FileNotFoundError:
+            pass
+        entries.sort()
+        entries.insert(0, f"version:{BM25_INDEX_VERSION}")
+
+        if include_insights:
+            from .memory import MEMORY_FILE
+
+            try:
+                st = MEMORY_FILE.stat()
+                entries.append(f"memory:{st.st_mtime_ns}:{st.st_size}")
+            except FileNotFoundError:
+                entries.append("memory:-")
+
+        return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
+    def _load_token_cache(self) -> dict:
+        """Per-chunk tokens from the previous build, or {} if missing, unreadable or stale."""
+        try:
+            cache = json_loads((self.index_dir / BM25_TOKENS_NAME).read_bytes())
+        except Exception:
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != BM25_INDEX_VERSION:
+            return {}
+        chunks = cache.get("chunks")
+        return chunks if isinstance(chunks, dict) else {}
+
+    def load_index(self, include_insights: bool = True) -> bool:
+        """
+        Load the persisted BM25 index if it matches the current corpus.
+
+        Args:
+            include_insights: Whether the index must include insights
+
+        Returns:
+            True if the index was loaded, False if it is missing or stale
+        """
+        if not BM25_AVAILABLE:
+            return False
+
+        fingerprint = self._fingerprint(include_insights)
+        try:
+            manifest = json_loads((self.index_dir / BM25_MANIFEST_NAME).read_bytes())
+            if manifest.get("fingerprint") != fingerprint:
+                return False
+            retriever = _bm25s().BM25.load(str(self.index_dir / manifest["data_dir"]))
+        except Exception:
+            return False
+
+        self.retriever = retriever
+        self.chunk_ids = manifest["chunk_ids"]
+        self.chunk_summaries = manifest["chunk_summaries"]
+        self.fingerprint = fingerprint
+        return True
+
+    def _save_persisted(self, fingerprint: str) -> None:
+        """
+        Persist the BM25 index under bm25_index/.
+
+        Data goes to a directory named after the fingerprint, then the
+        manifest is swapped atomically: readers never see a partial index.
+        """
+        data_dir = fingerprint[:16]
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.retriever.save(str(self.index_dir / data_dir))
+        atomic_write_json(
+            self.index_dir / BM25_MANIFEST_NAME,
+            {
+                "fingerprint": fingerprint,
+                "data_dir": data_dir,
+                "chunk_ids": self.chunk_ids,
+                "chunk_summaries": self.chunk_summaries,
+            },
+            compact=True,
+        )
+
+        # Drop index data left by previous builds
+        for old in self.index_dir.iterdir():
+            if old.is_dir() and old.name != data_dir:
+                shutil.rmtree(old, ignore_errors=True)
+
+    def _extract_content_and_summary(self, chunk_file: Path) -> tuple[str, str]:
+        """
+        Read a chunk file once and return its searchable content and summary.
 
         Phase 8.1: Prepends summary, tags, project, and domain from the
         YAML header so BM25 can match on metadata keywords too.
@@ -62,50 +194,62 @@ class RLMSearch:
             chunk_file: Path to the chunk .md file
 
         Returns:
-            Content string with metadata keywords prepended
+            Tuple of (content with metadata keywords prepended, summary)
         """
-        with open(chunk_file, encoding="utf-8") as f:
-            content = f.read()
-
-        # Skip YAML header (between --- markers)
-        lines = content.split("\n")
-        content_start = 0
+        # Stream the YAML header (between --- markers), then read the body in one go
+        header = []
         in_header = False
-
-        for i, line in enumerate(lines):
-            if line.strip() == "---":
-                if not in_header:
-                    in_header = True
-                else:
-                    content_start = i + 1
-                    break
-
-        body = "\n".join(lines[content_start:])
+        with open(chunk_file, encoding="utf-8") as f:
+            for line in f:
+                header.append(line)
+                if line.strip() == "---":
+                    if not in_header:
+                        in_header = True
+                    else:
+                        body = f.read()
+                        break
+            else:
+                # No closing marker: the whole file is body
+                body = "".join(header)
+                header = []
 
         # Phase 8.1: Prepend metadata to boost keyword matching
         meta_parts = []
-        for line in lines[:content_start]:
-            if line.startswith("summary:"):
-                val = line.split(":", 1)[1].strip()
-                if val:
-                    meta_parts.append(val)
-            elif line.startswith("tags:"):
-                val = line.split(":", 1)[1].strip().replace(",", " ")
-                if val:
-                    meta_parts.append(val)
-            elif line.startswith("project:"):
-                val = line.split(":", 1)[1].strip()
-                if val:
-                    meta_parts.append(val)
-            elif line.startswith("domain:"):
-                val = line.split(":", 1)[1].strip()
-                if val:
-                    meta_parts.append(val)
+        summary = None
+        for line in header:
+            key, sep, val = line.partition(":")
+            if not sep or key not in _HEADER_META_KEYS:
+                continue
+            val = val.strip()
+            if key == "summary":
+                if summary is None:
+                    summary = val
+            elif key == "tags":
+                val = val.replace(",", " ")
+            if val:
+                meta_parts.append(val)
+
+        # No (non-empty) summary in the header: search the whole file as before
+        if not summary:
+            match = _SUMMARY_RE.search("".join(header) + body)
+            summary = match.group(1).strip() if match else ""
 
         if meta_parts:
             body = " ".join(meta_parts) + "\n" + body
 
-        return body
+        return body, summary
+
+    def _extract_content(self, chunk_file: Path) -> str:
+        """
+        Extract content from a chunk file, skipping YAML header.
+
+        Args:
+            chunk_file: Path to the chunk .md file
+
+        Returns:
+            Content string with metadata keywords prepended
+        """
+        return self._extract_content_and_summary(chunk_file)[0]
 
     def _extract_summary(self, chunk_file: Path) -> str:
         """
@@ -117,14 +261,7 @@ class RLMSearch:
         Returns:
             Summary string or empty string
         """
-        with open(chunk_file, encoding="utf-8") as f:
-            content = f.read()
-
-        # Find summary in YAML header
-        match = re.search(r"^summary:\s*(.+)$", content, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
-        return ""
+        return self._extract_content_and_summary(chunk_file)[1]
 
     def build_index(self, include_insights: bool = True) -> int:
         """
@@ -143,47 +280,77 @@ class RLMSearch:
         if not BM25_AVAILABLE:
             raise ImportError("bm25s is required for search. Install with: pip install bm25s")
 
+        fingerprint = self._fingerprint(include_insights)
+        self.fingerprint = fingerprint
         documents = []
         self.chunk_ids = []
         self.chunk_summaries = {}
 
-        # Collect all chunks
+        # Collect all chunks, re-tokenizing only files changed since the last build
         chunk_files = sorted(self.chunks_dir.glob("*.md"))
+        cached_tokens = self._load_token_cache()
+        token_cache = {}
 
         for chunk_file in chunk_files:
-            content = self._extract_content(chunk_file)
-            tokens = tokenize_fr(content)
+            st = chunk_file.stat()
+            cached = cached_tokens.get(chunk_file.stem)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                tokens, summary = cached[2], cached[3]
+            else:
+                content, summary = self._extract_content_and_summary(chunk_file)
+                tokens = tokenize_fr(content)
+            token_cache[chunk_file.stem] = [st.st_mtime_ns, st.st_size, tokens, summary]
 
             if tokens:  # Only index non-empty chunks
                 documents.append(tokens)
                 chunk_id = chunk_file.stem
                 self.chunk_ids.append(chunk_id)
-                self.chunk_summaries[chunk_id] = self._extract_summary(chunk_file)
+                self.chunk_summaries[chunk_id] = summary
 
         # Index insights from session_memory
         if include_insights:
             from .memory import MEMORY_FILE, _load_memory
 
             if MEMORY_FILE.exists():
-                memory = _load_memory()
-                for insight in memory.get("insights", []):
+                # Insights are short: tokenize them as one batch
+                insights = _load_memory().get("insights", [])
+                contents = []
+                for insight in insights:
                     content = insight["content"]
                     if insight.get("tags"):
                         content += " " + " ".join(insight["tags"])
-                    tokens = tokenize_fr(content)
+                    contents.append(content)
+                for insight, tokens in zip(insights, tokenize_fr_batch(contents), strict=True):
                     if tokens:
                         documents.append(tokens)
                         iid = f"insight:{insight['id']}"
                         self.chunk_ids.append(iid)
                         self.chunk_summaries[iid] = insight["content"][:80]
 
+        if token_cache != cached_tokens:
+            try:
+                self.index_dir.mkdir(parents=True, exist_ok=True)
+                atomic_write_json(
+                    self.index_dir / BM25_TOKENS_NAME,
+                    {"version": BM25_INDEX_VERSION, "chunks": token_cache},
+                    compact=True,
+                )
+            except OSError:
+                pass
+
         if not documents:
             return 0
 
         # Build BM25 index
-        self.retriever = bm25s.BM25()
+        self.retriever = _bm25s().BM25()
         self.retriever.index(documents)
 
+        # Persisting is an optimization: a read-only context dir must not break search
+        try:
+            self._save_persisted(fingerprint)
+        except OSError:
+            pass
+
         return len(documents)
 
     def search(self, query: str, top_k: int = 5, include_insights: bool = True) -> list[dict]:
@@ -201,14 +368,14 @@ class RLMSearch:
         if not BM25_AVAILABLE:
             raise ImportError("bm25s is required for search. Install with: pip install bm25s")
 
-        # Build index if not already done
-        if self.retriever is None:
+        # Load the persisted index, or build it if missing or stale
+        if self.retriever is None and not self.load_index(include_insights=include_insights):
             indexed = self.build_index(include_insights=include_insights)
             if indexed == 0:
                 return []
 
         # Tokenize query
-        query_tokens = tokenize_fr(query)
+        query_tokens = list(_query_tokens(query))
 
         if not query_tokens:
             return []
@@ -241,6 +408,13 @@ class RLMSearch:
 
 HYBRID_ALPHA = 0.6  # Weight for semantic score (0.6 semantic, 0.4 BM25)
 
+# Searchers kept warm across search() calls, keyed by (chunks_dir, include_insights)
+_SEARCHER_CACHE: dict[tuple, RLMSearch] = {}
+SEARCHER_CACHE_SIZE = 2
+
+# Chunk metadata for search filters, keyed by index.json (path, mtime_ns, size)
+_CHUNK_META_CACHE: dict = {"key": None, "meta": None}
+
 
 def _normalize_bm25_scores(results: list[dict]) -> list[dict]:
     """Normalize BM25 scores to [0, 1] range using min-max scaling.
@@ -256,20 +430,57 @@ def _normalize_bm25_scores(results: list[dict]) -> list[dict]:
     if not results:
         return results
 
-    scores = [r["score"] for r in results]
-    min_score = min(scores)
-    max_score = max(scores)
-    score_range = max_score - min_score
+    if NUMPY_AVAILABLE:
+        import numpy as np
 
-    for r in results:
+        scores = np.fromiter((r["score"] for r in results), dtype=np.float64, count=len(results))
+        score_range = np.ptp(scores)
         if score_range > 0:
-            r["score_norm"] = (r["score"] - min_score) / score_range
+            normed = ((scores - scores.min()) / score_range).tolist()
         else:
+            normed = [1.0] * len(results)  # All scores equal → all get 1.0
+        for r, score_norm in zip(results, normed, strict=True):
+            r["score_norm"] = score_norm
+        return results
+
+    scores = [r["score"] for r in results]
+    min_score = min(scores)
+    score_range = max(scores) - min_score
+
+    if score_range > 0:
+        for r, score in zip(results, scores, strict=True):
+            r["score_norm"] = (score - min_score) / score_range
+    else:
+        for r in results:
             r["score_norm"] = 1.0  # All scores equal → all get 1.0
 
     return results
 
 
+def _fuse_scores(
+    bm25_results: list[dict], semantic_hits: list[tuple[str, float]]
+) -> list[tuple[str, float]]:
+    """Blend normalized BM25 and semantic scores, best first.
+
+    Each chunk scores (1 - HYBRID_ALPHA) * bm25_norm + HYBRID_ALPHA * cosine,
+    a missing side counting as 0.
+
+    Args:
+        bm25_results: BM25 result dicts with 'chunk_id' and 'score'
+        semantic_hits: (chunk_id, cosine score) pairs
+
+    Returns:
+        List of (chunk_id, fused score) tuples sorted descending
+    """
+    bm25_weight = 1 - HYBRID_ALPHA
+    fused = {
+        r["chunk_id"]: bm25_weight * r["score_norm"] for r in _normalize_bm25_scores(bm25_results)
+    }
+    for cid, score in semantic_hits:
+        fused[cid] = fused.get(cid, 0) + HYBRID_ALPHA * score
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
 def _hybrid_search(query: str, top_k: int) -> list[tuple[str, float]] | None:
     """Perform semantic vector search if available.
 
@@ -285,14 +496,14 @@ def _hybrid_search(query: str, top_k: int) -> list[tuple[str, float]] | None:
     """
     try:
         from .embeddings import _get_cached_provider
-        from .vecstore import VectorStore
+        from .vecstore import get_store
 
         provider = _get_cached_provider()
         if provider is None:
             return None
 
-        store = VectorStore()
-        if not store.load():
+        store = get_store()
+        if not store.chunk_ids:
             return None
 
         query_vec = provider.embed([query])[0]
@@ -301,6 +512,43 @@ def _hybrid_search(query: str, top_k: int) -> list[tuple[str, float]] | None:
         return None
 
 
+def _chunk_meta(index_file: Path) -> dict | None:
+    """
+    Map chunk id -> index.json entry, or None if there is no index.
+
+    Parsed once per version of the file (path, mtime, size).
+    """
+    try:
+        st = index_file.stat()
+    except FileNotFoundError:
+        return None
+
+    key = (str(index_file), st.st_mtime_ns, st.st_size)
+    if _CHUNK_META_CACHE["key"] != key:
+        index = json_loads(index_file.read_bytes())
+        _CHUNK_META_CACHE["meta"] = {c["id"]: c for c in index.get("chunks", [])}
+        _CHUNK_META_CACHE["key"] = key
+    return _CHUNK_META_CACHE["meta"]
+
+
+def _get_searcher(include_insights: bool) -> RLMSearch:
+    """
+    Return a cached RLMSearch for CHUNKS_DIR, or a fresh one if the corpus changed.
+
+    A searcher is reused only while its fingerprint matches the chunk files
+    (and memory file); the least recently used entry is evicted.
+    """
+    key = (str(CHUNKS_DIR), include_insights)
+    searcher = _SEARCHER_CACHE.pop(key, None)
+    if searcher is None or searcher.fingerprint != searcher._fingerprint(include_insights):
+        searcher = RLMSearch(CHUNKS_DIR)
+
+    _SEARCHER_CACHE[key] = searcher
+    while len(_SEARCHER_CACHE) > SEARCHER_CACHE_SIZE:
+        del _SEARCHER_CACHE[next(iter(_SEARCHER_CACHE))]
+    return searcher
+
+
 def search(
     query: str,
     limit: int = 5,
@@ -332,7 +580,7 @@ def search(
     """
     from .navigation import _chunk_in_date_range, _entity_matches
 
-    searcher = RLMSearch()
+    searcher = _get_searcher(include_insights)
 
     try:
         # Get more results than needed for filtering
@@ -343,22 +591,10 @@ def search(
     # Phase 8: Hybrid fusion if semantic available
     semantic_hits = _hybrid_search(query, limit * 3)
     if semantic_hits is not None and results:
-        results = _normalize_bm25_scores(results)
-        bm25_map = {r["chunk_id"]: r.get("score_norm", 0) for r in results}
-        sem_map = dict(semantic_hits)
-        all_ids = set(bm25_map) | set(sem_map)
-        fused = []
-        for cid in all_ids:
-            score = (1 - HYBRID_ALPHA) * bm25_map.get(cid, 0) + HYBRID_ALPHA * sem_map.get(cid, 0)
-            fused.append(
-                {
-                    "chunk_id": cid,
-                    "score": score,
-                    "summary": searcher.chunk_summaries.get(cid, ""),
-                }
-            )
-        fused.sort(key=lambda x: x["score"], reverse=True)
-        results = fused
+        results = [
+            {"chunk_id": cid, "score": score, "summary": searcher.chunk_summaries.get(cid, "")}
+            for cid, score in _fuse_scores(results, semantic_hits)
+        ]
     elif semantic_hits is not None:
         # BM25 returned nothing but semantic has results
         results = [
@@ -369,15 +605,9 @@ def search(
     # Phase 5.5c + 7.1 + 7.2: Filter by project/domain/date/entity if specified
     has_filters = project or domain or date_from or date_to or entity
     if has_filters:
-        # Load index to get chunk metadata
-        index_file = CONTEXT_DIR / "index.json"
-        if index_file.exists():
-            with open(index_file, encoding="utf-8") as f:
-                index = json.load(f)
-
-            # Build lookup for metadata
-            chunk_meta = {c["id"]: c for c in index.get("chunks", [])}
-
+        # Chunk metadata from index.json (cached until the file changes)
+        chunk_meta = _chunk_meta(CONTEXT_DIR / "index.json")
+        if chunk_meta is not None:
             filtered = []
             for r in results:
                 meta = chunk_meta.get(r["chunk_id"], {})
@@ -86,6 +86,7 @@ def register_session(
     domain: str = "",
     ticket: str = "",
     tags: list = None,
+    started: str | None = None,
 ) -> dict:
     """
     Register a new session in the index.
@@ -97,6 +98,7 @@ def register_session(
         domain: Primary domain for this session
         ticket: Optional ticket reference
         tags: Optional list of tags
+        started: ISO timestamp for the session start (default: now)
 
     Returns:
         dict with status and session info
@@ -115,7 +117,7 @@ def register_session(
         "path": path,
         "domain": domain,
         "ticket": ticket,
-        "started": datetime.now().isoformat(),
+        "started": started or datetime.now().isoformat(),
         "chunks": [],
         "tags": tags or [],
     }
@@ -15,163 +15,194 @@ Phase 5.1 implementation based on PHASE5_PLAN.md section 4.
 
 import re
 import unicodedata
+from functools import cache
 
 # French stopwords (common words to filter out)
-STOPWORDS_FR = {
-    "le",
-    "la",
-    "les",
-    "l",
-    "un",
-    "une",
-    "des",
-    "du",
-    "de",
-    "d",
-    "et",
-    "ou",
-    "mais",
-    "donc",
-    "car",
-    "que",
-    "qui",
-    "quoi",
-    "je",
-    "tu",
-    "il",
-    "elle",
-    "on",
-    "nous",
-    "vous",
-    "ils",
-    "elles",
-    "ce",
-    "cette",
-    "ces",
-    "mon",
-    "ton",
-    "son",
-    "notre",
-    "votre",
-    "leur",
-    "est",
-    "sont",
-    "a",
-    "ont",
-    "fait",
-    "peut",
-    "doit",
-    "etre",
-    "avoir",
-    "ne",
-    "pas",
-    "plus",
-    "tres",
-    "bien",
-    "tout",
-    "tous",
-    "toute",
-    "toutes",
-    "pour",
-    "dans",
-    "sur",
-    "avec",
-    "sans",
-    "par",
-    "entre",
-    "vers",
-    "chez",
-    "au",
-    "aux",
-    "si",
-    "ni",
-    "comme",
-    "meme",
-    "aussi",
-    "encore",
-}
+STOPWORDS_FR = frozenset(
+    {
+        "le",
+        "la",
+        "les",
+        "l",
+        "un",
+        "une",
+        "des",
+        "du",
+        "de",
+        "d",
+        "et",
+        "ou",
+        "mais",
+        "donc",
+        "car",
+        "que",
+        "qui",
+        "quoi",
+        "je",
+        "tu",
+        "il",
+        "elle",
+        "on",
+        "nous",
+        "vous",
+        "ils",
+        "elles",
+        "ce",
+        "cette",
+        "ces",
+        "mon",
+        "ton",
+        "son",
+        "notre",
+        "votre",
+        "leur",
+        "est",
+        "sont",
+        "a",
+        "ont",
+        "fait",
+        "peut",
+        "doit",
+        "etre",
+        "avoir",
+        "ne",
+        "pas",
+        "plus",
+        "tres",
+        "bien",
+        "tout",
+        "tous",
+        "toute",
+        "toutes",
+        "pour",
+        "dans",
+        "sur",
+        "avec",
+        "sans",
+        "par",
+        "entre",
+        "vers",
+        "chez",
+        "au",
+        "aux",
+        "si",
+        "ni",
+        "comme",
+        "meme",
+        "aussi",
+        "encore",
+    }
+)
 
 # English stopwords (common words to filter out)
-STOPWORDS_EN = {
-    "the",
-    "a",
-    "an",
-    "is",
-    "are",
-    "was",
-    "were",
-    "be",
-    "been",
-    "being",
-    "have",
-    "has",
-    "had",
-    "do",
-    "does",
-    "did",
-    "will",
-    "would",
-    "could",
-    "should",
-    "shall",
-    "may",
-    "might",
-    "must",
-    "can",
-    "i",
-    "you",
-    "he",
-    "she",
-    "it",
-    "we",
-    "they",
-    "this",
-    "that",
-    "these",
-    "of",
-    "in",
-    "to",
-    "for",
-    "with",
-    "on",
-    "at",
-    "by",
-    "from",
-    "up",
-    "out",
-    "and",
-    "or",
-    "but",
-    "if",
-    "not",
-    "no",
-    "yes",
-    "so",
-    "as",
-    "than",
-    "very",
-    "too",
-    "just",
-    "only",
-    "also",
-    "about",
-    "more",
-    "some",
-    "any",
-    "what",
-    "which",
-    "who",
-    "when",
-    "where",
-    "how",
-    "all",
-    "each",
-    "both",
-}
-
-# Combined stopwords
+STOPWORDS_EN = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "shall",
+        "may",
+        "might",
+        "must",
+        "can",
+        "i",
+        "you",
+        "he",
+        "she",
+        "it",
+        "we",
+        "they",
+        "this",
+        "that",
+        "these",
+        "of",
+        "in",
+        "to",
+        "for",
+        "with",
+        "on",
+        "at",
+        "by",
+        "from",
+        "up",
+        "out",
+        "and",
+        "or",
+        "but",
+        "if",
+        "not",
+        "no",
+        "yes",
+        "so",
+        "as",
+        "than",
+        "very",
+        "too",
+        "just",
+        "only",
+        "also",
+        "about",
+        "more",
+        "some",
+        "any",
+        "what",
+        "which",
+        "who",
+        "when",
+        "where",
+        "how",
+        "all",
+        "each",
+        "both",
+    }
+)
+
+# Combined stopwords (frozensets: O(1) membership, shared read-only)
 STOPWORDS = STOPWORDS_FR | STOPWORDS_EN
 
+# Bump whenever tokenize_fr() output changes (stopwords, normalization, token
+# pattern): persisted BM25 indexes and token caches built by an older
+# version are discarded instead of being mixed with freshly tokenized queries
+TOKENIZER_VERSION = 1
+
+# Tokens: runs of letters and digits (matched after lowercasing and accent
+# normalization, so ASCII is enough)
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+# Astral-plane characters: the only ones _marks_re() does not cover
+_ASTRAL_RE = re.compile("[\U00010000-\U0010ffff]")
+
+
+@cache
+def _marks_re() -> re.Pattern:
+    """Regex matching a nonspacing mark (category 'Mn') in the BMP.
+
+    Built on first use (~10 ms), not at import: ASCII text never needs it.
+    """
+    marks = "".join(
+        chr(cp) for cp in range(0x300, 0x10000) if unicodedata.category(chr(cp)) == "Mn"
+    )
+    # One mark per match: measurably faster in re.sub than runs ("[...]+")
+    return re.compile(f"[{re.escape(marks)}]")
+
 
 def normalize_accent(text: str) -> str:
     """
@@ -192,10 +223,16 @@ def normalize_accent(text: str) -> str:
         >>> normalize_accent("événement")
         'evenement'
     """
+    if text.isascii():
+        return text  # Nothing to decompose
+
     # NFD decomposition: é -> e + combining acute accent
-    normalized = unicodedata.normalize("NFD", text)
-    # Remove combining characters (category 'Mn' = Mark, Nonspacing)
-    return "".join(c for c in normalized if unicodedata.category(c) != "Mn")
+    text = unicodedata.normalize("NFD", text)
+    # Remove combining characters (category 'Mn' = Mark, Nonspacing) in C
+    text = _marks_re().sub("", text)
+    if text.isascii() or not _ASTRAL_RE.search(text):
+        return text
+    return "".join(c for c in text if unicodedata.category(c) != "Mn")
 
 
 def tokenize_fr(text: str, remove_stopwords: bool = True) -> list[str]:
@@ -225,33 +262,42 @@ def tokenize_fr(text: str, remove_stopwords: bool = True) -> list[str]:
         >>> tokenize_fr("Deploy v19.0.2 on VPS Odoo")
         ['deploy', 'v19', '0', '2', 'vps', 'odoo']
     """
-    # Lowercase
-    text = text.lower()
-
-    # Normalize accents for matching (réaliste -> realiste)
-    text = normalize_accent(text)
-
-    # Extract tokens: words, numbers, and hyphenated compounds
-    # Pattern matches: word characters and internal hyphens
-    raw_tokens = re.findall(r"[a-z0-9]+(?:-[a-z0-9]+)*", text)
-
-    # Split compound words on hyphens
-    tokens = []
-    for token in raw_tokens:
-        if "-" in token:
-            # Split and add individual parts
-            parts = token.split("-")
-            tokens.extend(parts)
-        else:
-            tokens.append(token)
-
-    # Filter stopwords and short tokens
+    # Lowercase, then normalize accents for matching (Réaliste -> realiste)
+    text = normalize_accent(text.lower())
+
+    # One regex pass extracts words and numbers; hyphens are not word
+    # characters, so compounds come out split (jus-de-fruits -> jus, de, fruits).
+    # Stopwords and short tokens are filtered in the same comprehension.
     if remove_stopwords:
-        tokens = [t for t in tokens if t not in STOPWORDS and len(t) >= 2]
-    else:
-        tokens = [t for t in tokens if len(t) >= 2]
+        return [t for t in _TOKEN_RE.findall(text) if len(t) >= 2 and t not in STOPWORDS]
+    return [t for t in _TOKEN_RE.findall(text) if len(t) >= 2]
 
-    return tokens
+
+def tokenize_fr_batch(texts: list[str], remove_stopwords: bool = True) -> list[list[str]]:
+    """
+    Tokenize many texts, as tokenize_fr does one.
+
+    Lowercasing and accent normalization run once over the whole batch
+    (joined with NUL, which neither step can change or reach across)
+    instead of once per text.
+
+    Args:
+        texts: Input texts to tokenize
+        remove_stopwords: Whether to filter out common words (default: True)
+
+    Returns:
+        One token list per text, in order
+    """
+    joined = normalize_accent("\0".join(texts).lower())
+    parts = joined.split("\0")
+    if len(parts) != len(texts):
+        # A text contains NUL itself, or the batch is empty
+        return [tokenize_fr(text, remove_stopwords) for text in texts]
+
+    findall = _TOKEN_RE.findall
+    if remove_stopwords:
+        return [[t for t in findall(part) if len(t) >= 2 and t not in STOPWORDS] for part in parts]
+    return [[t for t in findall(part) if len(t) >= 2] for part in parts]
 
 
 # Quick test when run directly
@@ -5,6 +5,13 @@ Phase 8 implementation.
 
 Stores chunk embeddings in a .npz file for fast cosine similarity search.
 All numpy operations are guarded — module degrades gracefully if numpy is absent.
+
+Large stores (HNSW_MIN_VECTORS+) also get an approximate HNSW index saved
+next to the .npz when hnswlib is installed; brute force remains the fallback.
+The index is built once, then kept up to date row by row as vectors change.
+
+get_store() shares one loaded store between the chunk and search paths
+while the .npz is unchanged, so neither reloads the vectors or the index.
 """
 
 from pathlib import Path
@@ -17,19 +24,43 @@ except ImportError:
     np = None
     NUMPY_AVAILABLE = False
 
+# Approximate nearest neighbours for large stores (optional dependency)
+try:
+    import hnswlib
+
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    hnswlib = None
+    HNSWLIB_AVAILABLE = False
+
 from .fileutil import CONTEXT_DIR
 
 DEFAULT_EMBEDDINGS_PATH = CONTEXT_DIR / "embeddings.npz"
 
+# On-disk dtype for vectors (halves embeddings.npz); they are upcast to
+# float32 on load. Stores with values out of float16 range stay float32.
+STORAGE_DTYPE = "float16"
+
+# Below this many vectors brute force is exact and fast enough: no HNSW index
+HNSW_MIN_VECTORS = 10_000
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 100
+HNSW_EF_SEARCH = 64
+
+# Store returned by get_store(): reused while the .npz stat and the store's
+# own version are those recorded here (a store changed but not saved is reloaded)
+_STORE_CACHE: dict = {"key": None, "version": None, "store": None}
+
 
 class VectorStore:
     """Numpy-based vector store for chunk embeddings.
 
     Stores vectors in a .npz file with two arrays:
     - chunk_ids: 1D array of chunk ID strings
-    - vectors: 2D array of float32 vectors
+    - vectors: 2D array of vectors (float16 on disk, float32 in memory)
 
-    Search uses brute-force cosine similarity (fast enough for <10k chunks).
+    Search uses brute-force cosine similarity (fast enough for <10k chunks),
+    or the persisted HNSW index when one matches the loaded vectors.
     """
 
     def __init__(self, path: Path | None = None):
@@ -39,12 +70,67 @@ class VectorStore:
             path: Path to the .npz file (default: CONTEXT_DIR/embeddings.npz)
         """
         self.path = path or DEFAULT_EMBEDDINGS_PATH
+        self._id_to_idx: dict[str, int] = {}
         self.chunk_ids: list[str] = []
-        self.vectors = None  # np.ndarray or None
+        # Rows [0, _size) of _buffer are the vectors; spare rows absorb add()s
+        self._buffer = None
+        self._size = 0
+        # Open .npz whose vectors are decoded on first use (see load())
+        self._pending = None
+        self._version = 0  # Bumped on every change to the vectors
+        # L2-normalized rows of `vectors`: rows [0, _normed_rows) are current.
+        # Appends are normalized lazily, one new row at a time, at search time.
+        self._normed_buffer = None
+        self._normed_rows = 0
+        # HNSW index over the normalized vectors, labelled by row: labels
+        # [0, _ann_rows) are live, rows in _ann_dirty changed since _ann_version
+        self._ann = None
+        self._ann_version = -1
+        self._ann_rows = 0
+        self._ann_dirty: set[int] = set()
+
+    @property
+    def ann_path(self) -> Path:
+        """Path of the HNSW index saved alongside the .npz file."""
+        return self.path.with_suffix(".hnsw")
+
+    @property
+    def chunk_ids(self) -> list[str]:
+        """Chunk IDs, one per row of `vectors`."""
+        return self._chunk_ids
+
+    @chunk_ids.setter
+    def chunk_ids(self, value: list[str]) -> None:
+        self._chunk_ids = value
+        self._id_to_idx = {chunk_id: i for i, chunk_id in enumerate(value)}
+
+    @property
+    def vectors(self):
+        """2D np.ndarray of the stored vectors (a view), or None when empty."""
+        if self._pending is not None:
+            self._materialize()
+        if self._buffer is None or self._size == 0:
+            return None
+        return self._buffer[: self._size]
+
+    @vectors.setter
+    def vectors(self, value) -> None:
+        self._pending = None
+        self._buffer = value
+        self._size = 0 if value is None else len(value)
+        self._version += 1
+        self._normed_buffer = None
+        self._normed_rows = 0
+        self._ann = None
+        self._ann_dirty.clear()
 
     def load(self) -> bool:
         """Load vectors from .npz file.
 
+        Only the chunk IDs are read here: the vectors are decoded (and upcast
+        to float32) the first time they are needed, so callers that only
+        count embedded chunks never pay for the matrix.
+
         Returns:
             True if loaded successfully, False if file doesn't exist or numpy unavailable
         """
@@ -56,14 +142,108 @@ class VectorStore:
 
         try:
             data = np.load(self.path, allow_pickle=True)
+            if "vectors" not in data.files:
+                raise KeyError("vectors")
             self.chunk_ids = list(data["chunk_ids"])
-            self.vectors = data["vectors"].astype(np.float32)
-            return True
         except Exception:
             self.chunk_ids = []
             self.vectors = None
             return False
 
+        self.vectors = None
+        self._pending = data
+        return True
+
+    def _materialize(self) -> None:
+        """Decode the vectors deferred by load(), then load the HNSW index."""
+        data, self._pending = self._pending, None
+        try:
+            with data:
+                vectors = data["vectors"].astype(np.float32)
+        except Exception:
+            self.chunk_ids = []
+            self.vectors = None
+            return
+        version = self._version
+        self.vectors = vectors
+        self._version = version  # Decoding is not a change (get_store() keys on it)
+        self._load_ann()
+
+    def _load_ann(self) -> None:
+        """Load the HNSW index if it was saved with (or after) the current .npz."""
+        if not HNSWLIB_AVAILABLE or self.vectors is None:
+            return
+        try:
+            if self.ann_path.stat().st_mtime_ns < self.path.stat().st_mtime_ns:
+                return  # Left over from an older save
+            ann = hnswlib.Index(space="ip", dim=self.vectors.shape[1])
+            ann.load_index(str(self.ann_path))
+        except Exception:
+            return
+        # Saved right after a sync: every row is a live label, later labels are deleted
+        if ann.element_count >= len(self.chunk_ids):
+            ann.set_ef(HNSW_EF_SEARCH)
+            self._ann = ann
+            self._ann_version = self._version
+            self._ann_rows = len(self.chunk_ids)
+
+    def _sync_ann(self) -> bool:
+        """
+        Apply rows changed since the HNSW index was last synced, in place.
+
+        Changed rows are (re-)added under their row label and labels past the
+        last row are marked deleted: no rebuild.
+
+        Returns:
+            True if the index now matches the vectors, False if there is none
+        """
+        if self._ann is None:
+            return False
+        if self._ann_version == self._version:
+            return True
+
+        normed = self._normalized()
+        size = len(normed)
+        ann = self._ann
+        if size > ann.get_max_elements():
+            ann.resize_index(max(size, 2 * ann.get_max_elements()))
+        rows = sorted(row for row in self._ann_dirty if row < size)
+        if rows:
+            ann.add_items(normed[rows], np.asarray(rows))
+        for label in range(size, self._ann_rows):
+            ann.mark_deleted(label)
+        self._ann_rows = size
+        self._ann_dirty.clear()
+        self._ann_version = self._version
+        return True
+
+    def _save_ann(self) -> None:
+        """Persist the HNSW index (built on first use, then synced), or drop a stale one."""
+        if not HNSWLIB_AVAILABLE or len(self.chunk_ids) < HNSW_MIN_VECTORS:
+            self._ann = None
+            self.ann_path.unlink(missing_ok=True)
+            return
+
+        if not self._sync_ann():
+            normed = self._normalized()
+            ann = hnswlib.Index(space="ip", dim=normed.shape[1])
+            ann.init_index(max_elements=len(normed), M=HNSW_M, ef_construction=HNSW_EF_CONSTRUCTION)
+            ann.add_items(normed, np.arange(len(normed)))
+            ann.set_ef(HNSW_EF_SEARCH)
+            self._ann = ann
+            self._ann_version = self._version
+            self._ann_rows = len(normed)
+            self._ann_dirty.clear()
+
+        ann = self._ann
+        tmp_path = self.ann_path.with_suffix(".hnsw.tmp")
+        try:
+            ann.save_index(str(tmp_path))
+            tmp_path.rename(self.ann_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     def save(self) -> None:
         """Persist vectors atomically to .npz file."""
         if not NUMPY_AVAILABLE or self.vectors is None or len(self.chunk_ids) == 0:
@@ -76,11 +256,14 @@ class VectorStore:
         # np.savez auto-appends .npz if file doesn't end with .npz
         # So we use a .npz temp file to avoid double extension
         tmp_path = self.path.parent / (self.path.stem + "_tmp.npz")
+        dtype = STORAGE_DTYPE
+        if np.abs(self.vectors).max() >= np.finfo(dtype).max:
+            dtype = np.float32
         try:
             np.savez(
                 tmp_path,
                 chunk_ids=np.array(self.chunk_ids, dtype=object),
-                vectors=self.vectors.astype(np.float32),
+                vectors=self.vectors.astype(dtype),
             )
             tmp_path.rename(self.path)
         except Exception:
@@ -88,6 +271,13 @@ class VectorStore:
                 tmp_path.unlink()
             raise
 
+        # Written after the .npz so that load() can tell a stale index by mtime
+        self._save_ann()
+
+        if _STORE_CACHE["store"] is self:
+            _STORE_CACHE["key"] = _file_key(self.path)
+            _STORE_CACHE["version"] = self._version
+
     def add(self, chunk_id: str, vector) -> None:
         """Add a vector for a chunk.
 
@@ -103,17 +293,29 @@ class VectorStore:
         vector = np.asarray(vector, dtype=np.float32).reshape(1, -1)
 
         # Replace if exists
-        if chunk_id in self.chunk_ids:
-            idx = self.chunk_ids.index(chunk_id)
+        idx = self._id_to_idx.get(chunk_id)
+        if idx is not None:
             self.vectors[idx] = vector[0]
+            self._version += 1
+            self._ann_dirty.add(idx)
+            if idx < self._normed_rows:
+                self._normed_buffer[idx] = _unit_rows(vector)[0]
             return
 
-        # Append
-        self.chunk_ids.append(chunk_id)
+        # Append, doubling the buffer when full (amortized O(1) per add)
         if self.vectors is None:
-            self.vectors = vector
-        else:
-            self.vectors = np.vstack([self.vectors, vector])
+            self._buffer = np.empty((16, vector.shape[1]), dtype=np.float32)
+            self._size = 0
+        elif self._size == len(self._buffer):
+            grown = np.empty((2 * self._size, self._buffer.shape[1]), dtype=self._buffer.dtype)
+            grown[: self._size] = self._buffer[: self._size]
+            self._buffer = grown
+        self._buffer[self._size] = vector[0]
+        self._ann_dirty.add(self._size)
+        self._size += 1
+        self._version += 1
+        self._id_to_idx[chunk_id] = len(self._chunk_ids)
+        self._chunk_ids.append(chunk_id)
 
     def remove(self, chunk_id: str) -> bool:
         """Remove a chunk's vector.
@@ -124,19 +326,54 @@ class VectorStore:
         Returns:
             True if found and removed, False if not found
         """
-        if not NUMPY_AVAILABLE or chunk_id not in self.chunk_ids:
+        if not NUMPY_AVAILABLE:
+            return False
+        has_vectors = self.vectors is not None  # Decodes a lazily loaded store first
+        if chunk_id not in self._id_to_idx:
             return False
 
-        idx = self.chunk_ids.index(chunk_id)
-        self.chunk_ids.pop(idx)
-
-        if self.vectors is not None:
-            self.vectors = np.delete(self.vectors, idx, axis=0)
+        # Swap-remove: the last row (and its id) moves into the freed slot, so
+        # no other row shifts and no other id is renumbered. Order is not
+        # meaningful: search ranks by score.
+        idx = self._id_to_idx.pop(chunk_id)
+        last = len(self._chunk_ids) - 1
+        if idx != last:
+            moved = self._chunk_ids[last]
+            self._chunk_ids[idx] = moved
+            self._id_to_idx[moved] = idx
+        self._chunk_ids.pop()
+
+        if has_vectors:
+            if idx != last:
+                self._buffer[idx] = self._buffer[last]
+                self._ann_dirty.add(idx)
+                if idx < self._normed_rows:
+                    normed = self._normed_buffer
+                    if last < self._normed_rows:
+                        normed[idx] = normed[last]
+                    else:
+                        normed[idx] = _unit_rows(self._buffer[idx : idx + 1])[0]
+            self._size -= 1
+            self._normed_rows = min(self._normed_rows, self._size)
+            self._version += 1
             if len(self.chunk_ids) == 0:
                 self.vectors = None
 
         return True
 
+    def _normalized(self):
+        """Row-normalized vectors; only rows appended since the last call are normalized."""
+        start, end = self._normed_rows, self._size
+        if start < end:
+            if self._normed_buffer is None or len(self._normed_buffer) < len(self._buffer):
+                grown = np.empty(self._buffer.shape, dtype=np.float32)
+                if start:
+                    grown[:start] = self._normed_buffer[:start]
+                self._normed_buffer = grown
+            self._normed_buffer[start:end] = _unit_rows(self._buffer[start:end])
+            self._normed_rows = end
+        return self._normed_buffer[:end]
+
     def search(self, query_vec, top_k: int = 5) -> list[tuple[str, float]]:
         """Search for nearest vectors using cosine similarity.
 
@@ -150,25 +387,31 @@ class VectorStore:
         if not NUMPY_AVAILABLE or self.vectors is None or len(self.chunk_ids) == 0:
             return []
 
-        query_vec = np.asarray(query_vec, dtype=np.float32).reshape(1, -1)
+        query_vec = np.asarray(query_vec, dtype=np.float32).reshape(-1)
 
-        # Cosine similarity: dot(q, v) / (||q|| * ||v||)
+        # Cosine similarity: dot(q, v) / (||q|| * ||v||), rows normalized once
         q_norm = np.linalg.norm(query_vec)
         if q_norm == 0:
             return []
 
-        v_norms = np.linalg.norm(self.vectors, axis=1)
-        # Avoid division by zero
-        v_norms = np.where(v_norms == 0, 1e-10, v_norms)
+        query_vec = query_vec / q_norm
+        if self._sync_ann():
+            try:
+                return self._search_ann(query_vec, top_k)
+            except RuntimeError:
+                pass  # Too few reachable neighbours (deleted labels): exact search below
 
-        similarities = (self.vectors @ query_vec.T).flatten() / (v_norms * q_norm)
+        similarities = self._normalized() @ query_vec
 
         # Clamp to [0, 1] (negative similarities treated as 0)
         similarities = np.clip(similarities, 0, 1)
 
-        # Top-k
+        # Top-k: partial selection, then sort only the k candidates
         k = min(top_k, len(self.chunk_ids))
-        top_indices = np.argsort(similarities)[::-1][:k]
+        if k <= 0:
+            return []
+        top_indices = np.argpartition(similarities, -k)[-k:]
+        top_indices = top_indices[np.argsort(similarities[top_indices])[::-1]]
 
         results = []
         for idx in top_indices:
@@ -177,3 +420,61 @@ class VectorStore:
                 results.append((self.chunk_ids[idx], score))
 
         return results
+
+    def _search_ann(self, query_vec, top_k: int) -> list[tuple[str, float]]:
+        """Approximate top-k through the HNSW index (inner product on unit vectors)."""
+        k = min(top_k, len(self.chunk_ids))
+        if k <= 0:
+            return []
+        labels, distances = self._ann.knn_query(query_vec.reshape(1, -1), k=k)
+
+        results = []
+        for idx, distance in zip(labels[0], distances[0], strict=True):
+            # "ip" distance is 1 - dot; clamp to [0, 1] like the exact path
+            score = min(max(1.0 - float(distance), 0.0), 1.0)
+            if score > 0:
+                results.append((self.chunk_ids[idx], score))
+        return results
+
+
+def _file_key(path: Path) -> tuple | None:
+    """(path, mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def get_store(path: Path | None = None) -> VectorStore:
+    """
+    Loaded VectorStore for path (default: CONTEXT_DIR/embeddings.npz), shared.
+
+    The same store is returned while the .npz is unchanged on disk and the
+    store has no unsaved changes, so its vectors and HNSW index are decoded
+    once. Callers that mutate it must save() it. A missing file yields an
+    empty store.
+    """
+    path = path or DEFAULT_EMBEDDINGS_PATH
+    key = _file_key(path)
+    store = _STORE_CACHE["store"]
+    if (
+        store is not None
+        and key is not None
+        and key == _STORE_CACHE["key"]
+        and store._version == _STORE_CACHE["version"]
+    ):
+        return store
+
+    store = VectorStore(path)
+    store.load()
+    _STORE_CACHE["key"] = key
+    _STORE_CACHE["version"] = store._version
+    _STORE_CACHE["store"] = store
+    return store
+
+
+def _unit_rows(rows):
+    """L2-normalize each row of a 2D array (zero rows stay zero)."""
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    return rows / np.where(norms == 0, 1e-10, norms)
@@ -7,12 +7,27 @@ Provides:
 - Helper functions for test setup/teardown
 """
 
-import json
+import mmap
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
+# orjson-backed when installed, stdlib json otherwise (same shim as the server)
+from mcp_server.tools.fileutil import json_dumps, json_loads
+
+# Fixed creation time for helper-written chunks (no clock read per chunk)
+_TEST_TIMESTAMP = "2026-01-18T10:00:00"
+
+_CHUNK_TEMPLATE = """---
+summary: {summary}
+tags: {tags}
+created: {created}
+---
+
+{content}
+"""
+
 
 @pytest.fixture
 def temp_context_dir(tmp_path):
@@ -23,40 +38,38 @@ def temp_context_dir(tmp_path):
 
     # Initialize empty index
     index_file = context_dir / "index.json"
-    index_file.write_text(
-        json.dumps({"version": "2.1.0", "chunks": [], "total_tokens_estimate": 0}, indent=2)
+    index_file.write_bytes(
+        json_dumps({"version": "2.1.0", "chunks": [], "total_tokens_estimate": 0}, compact=True)
     )
 
     # Initialize empty memory
     memory_file = context_dir / "session_memory.json"
-    memory_file.write_text(
-        json.dumps(
+    memory_file.write_bytes(
+        json_dumps(
             {
                 "version": "1.0.0",
                 "insights": [],
                 "created": datetime.now().isoformat(),
                 "last_updated": datetime.now().isoformat(),
-            },
-            indent=2,
+            }
         )
     )
 
     # Initialize empty sessions
     sessions_file = context_dir / "sessions.json"
-    sessions_file.write_text(
-        json.dumps({"version": "1.0.0", "current_session": None, "sessions": {}}, indent=2)
+    sessions_file.write_bytes(
+        json_dumps({"version": "1.0.0", "current_session": None, "sessions": {}})
     )
 
     # Initialize default domains
     domains_file = context_dir / "domains.json"
-    domains_file.write_text(
-        json.dumps(
+    domains_file.write_bytes(
+        json_dumps(
             {
                 "domains": {
                     "default": {"description": "Default domains", "list": ["test", "dev", "prod"]}
                 }
-            },
-            indent=2,
+            }
         )
     )
 
@@ -99,15 +112,16 @@ def sample_chunks(temp_context_dir):
     for chunk in chunks_data:
         # Write chunk file
         chunk_file = chunks_dir / f"{chunk['id']}.md"
-        content = f"""---
-summary: {chunk["summary"]}
-tags: {", ".join(chunk["tags"])}
-created: 2026-01-18T10:00:00
----
-
-{chunk["content"]}
-"""
-        chunk_file.write_text(content)
+        chunk_file.write_bytes(
+            _CHUNK_TEMPLATE.format_map(
+                {
+                    "summary": chunk["summary"],
+                    "tags": ", ".join(chunk["tags"]),
+                    "created": _TEST_TIMESTAMP,
+                    "content": chunk["content"],
+                }
+            ).encode()
+        )
 
         # Add to index
         index_chunks.append(
@@ -116,7 +130,7 @@ created: 2026-01-18T10:00:00
                 "summary": chunk["summary"],
                 "tags": chunk["tags"],
                 "tokens_estimate": len(chunk["content"].split()) * 2,
-                "created": "2026-01-18T10:00:00",
+                "created": _TEST_TIMESTAMP,
                 "access_count": 0,
                 "project": chunk.get("project", ""),
                 "domain": chunk.get("domain", ""),
@@ -124,10 +138,10 @@ created: 2026-01-18T10:00:00
         )
 
     # Update index
-    index = json.loads(index_file.read_text())
+    index = json_loads(index_file.read_bytes())
     index["chunks"] = index_chunks
     index["total_tokens_estimate"] = sum(c["tokens_estimate"] for c in index_chunks)
-    index_file.write_text(json.dumps(index, indent=2))
+    index_file.write_bytes(json_dumps(index, compact=True))
 
     return chunks_data
 
@@ -156,21 +170,37 @@ def sample_insights(temp_context_dir):
         },
     ]
 
-    memory = json.loads(memory_file.read_text())
+    memory = json_loads(memory_file.read_bytes())
     memory["insights"] = insights
-    memory_file.write_text(json.dumps(memory, indent=2))
+    memory_file.write_bytes(json_dumps(memory))
 
     return insights
 
 
 @pytest.fixture
 def mock_context_paths(temp_context_dir, monkeypatch):
-    """Patch the CONTEXT_DIR paths in navigation module."""
-    # This fixture will be used to inject temp paths into the actual module
-    # Implementation depends on how we want to handle module imports
+    """Patch the context paths of navigation, retention and sessions onto the temp dir."""
+    import mcp_server.tools.navigation as navigation
+    import mcp_server.tools.retention as retention
+    import mcp_server.tools.sessions as sessions
+
+    monkeypatch.setattr(navigation, "CONTEXT_DIR", temp_context_dir)
+    monkeypatch.setattr(navigation, "CHUNKS_DIR", temp_context_dir / "chunks")
+    monkeypatch.setattr(navigation, "INDEX_FILE", temp_context_dir / "index.json")
+    monkeypatch.setattr(retention, "INDEX_FILE", temp_context_dir / "index.json")
+    monkeypatch.setattr(sessions, "CONTEXT_DIR", temp_context_dir)
+    monkeypatch.setattr(sessions, "SESSIONS_FILE", temp_context_dir / "sessions.json")
     return temp_context_dir
 
 
+@pytest.fixture
+def nav(mock_context_paths):
+    """Navigation module with its paths patched onto the temp context dir."""
+    import mcp_server.tools.navigation as navigation
+
+    return navigation
+
+
 # =============================================================================
 # Helper functions
 # =============================================================================
@@ -183,18 +213,92 @@ def create_chunk(chunks_dir: Path, chunk_id: str, content: str, **metadata) -> P
     summary = metadata.get("summary", content.split("\n")[0][:50])
     tags = metadata.get("tags", [])
 
-    chunk_content = f"""---
-summary: {summary}
-tags: {", ".join(tags) if tags else ""}
-created: {datetime.now().isoformat()}
----
-
-{content}
-"""
-    chunk_file.write_text(chunk_content)
+    chunk_file.write_bytes(
+        _CHUNK_TEMPLATE.format_map(
+            {
+                "summary": summary,
+                "tags": ", ".join(tags),
+                "created": _TEST_TIMESTAMP,
+                "content": content,
+            }
+        ).encode()
+    )
     return chunk_file
 
 
+def create_chunks_batch(context_dir: Path, chunks: list[dict]) -> list[dict]:
+    """
+    Write chunk files and their index.json entries with a single index write.
+
+    Each chunk dict needs "id" and "content"; "summary" and "tags" go into the
+    YAML header, and every other key (created_at, access_count, project...)
+    is copied into the index entry.
+    """
+    index_file = context_dir / "index.json"
+    chunks_dir = context_dir / "chunks"
+    entries = []
+
+    for chunk in chunks:
+        summary = chunk.get("summary", chunk["content"].split("\n")[0][:50])
+        tags = chunk.get("tags", [])
+        header = ["---", f"summary: {summary}", f"tags: {', '.join(tags)}"]
+        if "created_at" in chunk:
+            header.append(f"created_at: {chunk['created_at']}")
+        header.extend(["---", "", chunk["content"], ""])
+        # Encoded once and written in binary mode: no text-layer wrapper per file
+        (chunks_dir / f"{chunk['id']}.md").write_bytes("\n".join(header).encode())
+
+        entry = {
+            "id": chunk["id"],
+            "file": f"chunks/{chunk['id']}.md",
+            "summary": summary,
+            "tags": tags,
+            "tokens_estimate": len(chunk["content"].split()) * 2,
+            "access_count": 0,
+        }
+        entry.update((k, v) for k, v in chunk.items() if k not in ("content", "summary", "tags"))
+        entries.append(entry)
+
+    index = json_loads(index_file.read_bytes())
+    index["chunks"].extend(entries)
+    index_file.write_bytes(json_dumps(index, compact=True))
+    return entries
+
+
+def load_index_by_id(index_file: Path) -> dict[str, dict]:
+    """Parse index.json once and key its chunk entries by id."""
+    return {c["id"]: c for c in json_loads(index_file.read_bytes())["chunks"]}
+
+
+def read_mmap(path: Path) -> mmap.mmap:
+    """
+    Map a file read-only for byte-level assertions (use as a context manager).
+
+    Substring checks go through ``mm.find(b"...")`` without decoding the file
+    or copying it into a str.
+    """
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def read_frontmatter(path: Path) -> dict[str, str]:
+    """
+    Parse the YAML header of a chunk file without reading the body.
+
+    Lines are consumed only up to the closing ``---``; values are kept as raw
+    strings (``tags`` stays comma-separated).
+    """
+    meta = {}
+    with open(path, encoding="utf-8") as f:
+        assert f.readline().strip() == "---", f"{path.name} has no frontmatter"
+        for line in f:
+            if line.strip() == "---":
+                break
+            key, _, value = line.partition(":")
+            meta[key.strip()] = value.strip()
+    return meta
+
+
 def assert_chunk_exists(chunks_dir: Path, chunk_id: str) -> bool:
     """Assert that a chunk file exists."""
     chunk_file = chunks_dir / f"{chunk_id}.md"
@@ -0,0 +1,92 @@
+"""
+Tests for the append-only chunk access log (Phase 4.3 access counting).
+
+Tests cover:
+- peek() appends to access.log instead of rewriting index.json
+- Pending accesses are folded into loaded indexes (navigation and retention)
+- _save_index() absorbs the log into index.json and starts a fresh log
+- A failed index write keeps the old log, so no access is lost
+- Folding is incremental and never double-counts
+"""
+
+import pytest
+
+from mcp_server.tools.fileutil import fold_access_log
+from tests.conftest import load_index_by_id
+
+
+class TestAccessLog:
+    def test_peek_appends_without_rewriting_index(self, nav):
+        chunk_id = nav.chunk("Some content", project="p")["chunk_id"]
+        before = nav.INDEX_FILE.read_bytes()
+
+        nav.peek(chunk_id)
+        nav.peek(chunk_id)
+
+        assert nav.INDEX_FILE.read_bytes() == before
+        log = (nav.INDEX_FILE.parent / "access.log").read_text().splitlines()
+        assert [line.split("\t")[0] for line in log] == [chunk_id, chunk_id]
+
+    def test_pending_accesses_are_visible(self, nav):
+        import mcp_server.tools.retention as retention
+
+        chunk_id = nav.chunk("Some content", project="p")["chunk_id"]
+        nav.peek(chunk_id)
+        nav.peek(chunk_id)
+
+        listed = nav.list_chunks()["chunks"][0]
+        assert listed["access_count"] == 2
+        assert listed["last_accessed"]
+        assert retention._load_index()["chunks"][0]["access_count"] == 2
+
+    def test_save_absorbs_log(self, nav):
+        first = nav.chunk("First content", project="p")["chunk_id"]
+        nav.peek(first)
+        nav.peek(first)
+        nav.peek(first)
+
+        nav.chunk("Second content", project="p")
+
+        assert load_index_by_id(nav.INDEX_FILE)[first]["access_count"] == 3
+        assert (nav.INDEX_FILE.parent / "access.log").read_text() == ""
+        assert nav._load_index()["chunks"][0]["access_count"] == 3
+
+        nav.peek(first)
+        assert nav._load_index()["chunks"][0]["access_count"] == 4
+
+    def test_failed_save_keeps_log(self, nav, monkeypatch):
+        first = nav.chunk("First content", project="p")["chunk_id"]
+        nav.peek(first)
+        nav.peek(first)
+        log_file = nav.INDEX_FILE.parent / "access.log"
+        log_before = log_file.read_bytes()
+
+        real_write = nav.atomic_write_json
+
+        def disk_full(*args, **kwargs):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(nav, "atomic_write_json", disk_full)
+        with pytest.raises(OSError):
+            nav.chunk("Second content", project="p")
+        monkeypatch.setattr(nav, "atomic_write_json", real_write)
+
+        assert log_file.read_bytes() == log_before
+        assert not [p for p in log_file.parent.iterdir() if p.suffix == ".tmp"]
+        assert load_index_by_id(nav.INDEX_FILE)[first]["access_count"] == 0
+        assert nav._load_index()["chunks"][0]["access_count"] == 2
+
+    def test_fold_is_incremental(self, tmp_path):
+        log_file = tmp_path / "access.log"
+        index = {"chunks": [{"id": "a", "access_count": 1}, {"id": "b"}]}
+
+        log_file.write_text("a\t2026-01-01T00:00:00\nb\t2026-01-02T00:00:00\n")
+        fold_access_log(index, log_file)
+        fold_access_log(index, log_file)
+        assert [c.get("access_count") for c in index["chunks"]] == [2, 1]
+
+        with open(log_file, "a") as f:
+            f.write("a\t2026-01-03T00:00:00\nb\t2026-01")  # trailing partial line
+        fold_access_log(index, log_file)
+        assert [c.get("access_count") for c in index["chunks"]] == [3, 1]
+        assert index["chunks"][0]["last_accessed"] == "2026-01-03T00:00:00"
@@ -0,0 +1,111 @@
+"""
+Tests for the persisted BM25 index (context/bm25_index/).
+
+Tests cover:
+- build_index() persists the index and a fresh RLMSearch reloads it
+- Adding or rewriting a chunk invalidates the persisted index
+- Unchanged chunks are not re-read when the index is rebuilt
+- A tokenizer version change discards the index and the token cache
+- search() reuses a cached RLMSearch while the corpus is unchanged
+"""
+
+import pytest
+
+pytest.importorskip("bm25s")
+
+from mcp_server.tools.search import BM25_MANIFEST_NAME, RLMSearch  # noqa: E402
+
+
+def _write_chunk(chunks_dir, name, summary, body):
+    (chunks_dir / f"{name}.md").write_text(f"---\nsummary: {summary}\n---\n\n{body}\n")
+
+
+@pytest.fixture
+def chunks_dir(tmp_path):
+    chunks_dir = tmp_path / "chunks"
+    chunks_dir.mkdir()
+    _write_chunk(chunks_dir, "chunk_a", "Analyse trésorerie", "Flux de trésorerie mensuel")
+    _write_chunk(chunks_dir, "chunk_b", "Installation serveur", "Configuration nginx et SSL")
+    return chunks_dir
+
+
+class TestPersistedIndex:
+    def test_fresh_searcher_loads_persisted_index(self, chunks_dir, monkeypatch):
+        first = RLMSearch(chunks_dir=chunks_dir)
+        expected = first.search("nginx", include_insights=False)
+        assert (chunks_dir.parent / "bm25_index" / BM25_MANIFEST_NAME).exists()
+
+        second = RLMSearch(chunks_dir=chunks_dir)
+        monkeypatch.setattr(
+            second, "build_index", lambda **kw: pytest.fail("index should be loaded")
+        )
+        assert second.search("nginx", include_insights=False) == expected
+        assert second.chunk_summaries["chunk_b"] == "Installation serveur"
+
+    def test_changed_corpus_rebuilds(self, chunks_dir):
+        RLMSearch(chunks_dir=chunks_dir).search("nginx", include_insights=False)
+
+        _write_chunk(chunks_dir, "chunk_c", "Déploiement", "Reverse proxy nginx en production")
+        _write_chunk(chunks_dir, "chunk_b", "Installation serveur", "Configuration apache")
+
+        searcher = RLMSearch(chunks_dir=chunks_dir)
+        assert not searcher.load_index(include_insights=False)
+        results = searcher.search("nginx", include_insights=False)
+        assert [r["chunk_id"] for r in results] == ["chunk_c"]
+        index_dir = chunks_dir.parent / "bm25_index"
+        assert len([p for p in index_dir.iterdir() if p.is_dir()]) == 1
+
+    def test_rebuild_reuses_cached_tokens(self, chunks_dir, monkeypatch):
+        RLMSearch(chunks_dir=chunks_dir).build_index(include_insights=False)
+        _write_chunk(chunks_dir, "chunk_c", "Déploiement", "Reverse proxy nginx")
+
+        read = []
+        searcher = RLMSearch(chunks_dir=chunks_dir)
+        real_extract = searcher._extract_content_and_summary
+        monkeypatch.setattr(
+            searcher,
+            "_extract_content_and_summary",
+            lambda path: read.append(path.stem) or real_extract(path),
+        )
+
+        assert searcher.build_index(include_insights=False) == 3
+        assert read == ["chunk_c"]
+        assert searcher.chunk_summaries["chunk_a"] == "Analyse trésorerie"
+
+    def test_tokenizer_change_discards_index_and_tokens(self, chunks_dir, monkeypatch):
+        from mcp_server.tools import search as search_mod
+
+        RLMSearch(chunks_dir=chunks_dir).build_index(include_insights=False)
+        monkeypatch.setattr(search_mod, "BM25_INDEX_VERSION", "test/tokenizer-next")
+
+        read = []
+        searcher = RLMSearch(chunks_dir=chunks_dir)
+        real_extract = searcher._extract_content_and_summary
+        monkeypatch.setattr(
+            searcher,
+            "_extract_content_and_summary",
+            lambda path: read.append(path.stem) or real_extract(path),
+        )
+
+        assert not searcher.load_index(include_insights=False)
+        assert searcher.build_index(include_insights=False) == 2
+        assert read == ["chunk_a", "chunk_b"]
+
+
+class TestSearcherCache:
+    def test_search_reuses_searcher_until_corpus_changes(self, chunks_dir, monkeypatch):
+        from mcp_server.tools import search as search_mod
+
+        monkeypatch.setattr(search_mod, "CHUNKS_DIR", chunks_dir)
+        monkeypatch.setattr(search_mod, "_SEARCHER_CACHE", {})
+
+        search_mod.search("nginx", include_insights=False)
+        cached = search_mod._get_searcher(False)
+        assert search_mod._get_searcher(False) is cached
+
+        _write_chunk(chunks_dir, "chunk_c", "Déploiement", "Reverse proxy nginx")
+        result = search_mod.search("proxy", include_insights=False)
+
+        assert [r["chunk_id"] for r in result["results"]] == ["chunk_c"]
+        assert search_mod._get_searcher(False) is not cached
+        assert len(search_mod._SEARCHER_CACHE) == 1
@@ -0,0 +1,40 @@
+"""
+Tests for reading chunk bodies past the YAML header.
+
+Tests cover:
+- chunk() records content_offset pointing just past the closing "---"
+- peek() returns the same body via the offset and via the header scan
+- A stale offset falls back to scanning the header
+"""
+
+CONTENT = "Décision: garder l'API\n---\nligne après un séparateur\nfin"
+
+
+class TestContentOffset:
+    def test_offset_points_past_header(self, nav):
+        chunk_id = nav.chunk(CONTENT, summary="Résumé été", project="p")["chunk_id"]
+
+        entry = nav._load_index()["chunks"][0]
+        data = (nav.CHUNKS_DIR / f"{chunk_id}.md").read_bytes()
+        assert data[: entry["content_offset"]].endswith(b"---\n")
+        assert data[entry["content_offset"] :].decode() == "\n" + CONTENT
+
+    def test_offset_and_scan_agree(self, nav):
+        chunk_id = nav.chunk(CONTENT, project="p")["chunk_id"]
+        chunk_file = nav.CHUNKS_DIR / f"{chunk_id}.md"
+        offset = nav._load_index()["chunks"][0]["content_offset"]
+
+        with nav._open_body(chunk_file, offset) as f:
+            via_offset = list(f)
+        with nav._open_body(chunk_file) as f:
+            via_scan = list(f)
+
+        assert via_offset == via_scan
+        assert nav.peek(chunk_id)["content"] == "".join(via_scan)
+
+    def test_stale_offset_falls_back_to_scan(self, nav):
+        chunk_id = nav.chunk(CONTENT, project="p")["chunk_id"]
+        chunk_file = nav.CHUNKS_DIR / f"{chunk_id}.md"
+
+        with nav._open_body(chunk_file, 7) as f:
+            assert "".join(f) == "\n" + CONTENT
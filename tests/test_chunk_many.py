@@ -0,0 +1,63 @@
+"""
+Tests for chunk_many() batch ingestion.
+
+Tests cover:
+- One result per item, in order, matching what chunk() would return
+- Sequential IDs and a single index write for the whole batch
+- Duplicates against the index and within the batch
+- Invalid items rejected without aborting the batch
+"""
+
+
+class TestChunkMany:
+    def test_creates_all_with_one_index_write(self, nav, monkeypatch):
+        saves = []
+        real_save = nav._save_index
+        monkeypatch.setattr(nav, "_save_index", lambda *a: saves.append(1) or real_save(*a))
+
+        results = nav.chunk_many(
+            [
+                {"content": "First note", "project": "p", "tags": ["a"]},
+                {"content": "Second note", "project": "p", "chunk_type": "debug"},
+                {"content": "Third note", "project": "q", "domain": "bp"},
+            ]
+        )
+
+        assert [r["status"] for r in results] == ["created"] * 3
+        ids = [r["chunk_id"] for r in results]
+        assert [i.split("_", 1)[1] for i in ids] == ["p_001", "p_002", "q_001_bp"]
+        assert len(saves) == 1
+
+        index = nav._load_index()
+        assert [c["id"] for c in index["chunks"]] == ids
+        assert index["chunks"][1]["chunk_type"] == "debug"
+        assert nav.peek(ids[2])["content"].strip() == "Third note"
+
+    def test_duplicates_in_index_and_batch(self, nav):
+        existing = nav.chunk("Already saved", project="p")["chunk_id"]
+
+        results = nav.chunk_many(
+            [
+                {"content": "already   SAVED", "project": "p"},
+                {"content": "New one", "project": "p"},
+                {"content": "new one", "project": "p"},
+            ]
+        )
+
+        assert results[0]["status"] == "duplicate"
+        assert results[0]["existing_chunk_id"] == existing
+        assert results[1]["status"] == "created"
+        assert results[2]["status"] == "duplicate"
+        assert results[2]["existing_chunk_id"] == results[1]["chunk_id"]
+
+    def test_invalid_items_do_not_abort_batch(self, nav):
+        results = nav.chunk_many(
+            [
+                {"content": "x", "chunk_type": "insight"},
+                {"content": "y", "chunk_type": "bogus"},
+                {"content": "Valid content", "project": "p"},
+            ]
+        )
+
+        assert [r["status"] for r in results] == ["redirect", "error", "created"]
+        assert len(nav._load_index()["chunks"]) == 1
@@ -13,30 +13,8 @@ Tests cover:
 
 import json
 
-import pytest
-
-
-# =============================================================================
-# FIXTURES
-# =============================================================================
-
-
-@pytest.fixture
-def chunk_context(temp_context_dir, monkeypatch):
-    """Set up context with navigation module patched."""
-    import mcp_server.tools.navigation as navigation
-    import mcp_server.tools.sessions as sessions
-
-    monkeypatch.setattr(navigation, "CONTEXT_DIR", temp_context_dir)
-    monkeypatch.setattr(navigation, "CHUNKS_DIR", temp_context_dir / "chunks")
-    monkeypatch.setattr(navigation, "INDEX_FILE", temp_context_dir / "index.json")
-
-    # Patch sessions module paths
-    monkeypatch.setattr(sessions, "CONTEXT_DIR", temp_context_dir)
-    monkeypatch.setattr(sessions, "SESSIONS_FILE", temp_context_dir / "sessions.json")
-
-    return temp_context_dir
-
+from mcp_server.tools.navigation import chunk, peek
+from tests.conftest import load_index_by_id, read_frontmatter, read_mmap
 
 # =============================================================================
 # TESTS: Validation
@@ -46,51 +24,39 @@ def chunk_context(temp_context_dir, monkeypatch):
 class TestChunkTypeValidation:
     """Tests for chunk_type parameter validation."""
 
-    def test_valid_types_accepted(self, chunk_context):
+    def test_valid_types_accepted(self, mock_context_paths):
         """snapshot, session, debug should all be accepted."""
-        from mcp_server.tools.navigation import chunk
-
         for ctype in ("snapshot", "session", "debug"):
             result = chunk(f"Content for {ctype} test", chunk_type=ctype, tags=["test"])
             assert result["status"] == "created", f"Type '{ctype}' should be accepted"
 
-    def test_default_type_is_session(self, chunk_context):
+    def test_default_type_is_session(self, mock_context_paths):
         """Without explicit chunk_type, default should be 'session'."""
-        from mcp_server.tools.navigation import chunk
-
         result = chunk("Content without explicit type", tags=["test"])
         assert result["status"] == "created"
 
         # Verify in index
-        index = json.loads((chunk_context / "index.json").read_text())
-        created_chunk = next(c for c in index["chunks"] if c["id"] == result["chunk_id"])
-        assert created_chunk["chunk_type"] == "session"
+        by_id = load_index_by_id(mock_context_paths / "index.json")
+        assert by_id[result["chunk_id"]]["chunk_type"] == "session"
 
-    def test_invalid_type_rejected(self, chunk_context):
+    def test_invalid_type_rejected(self, mock_context_paths):
         """Invalid chunk_type should return error."""
-        from mcp_server.tools.navigation import chunk
-
         result = chunk("This should fail", chunk_type="foobar")
         assert result["status"] == "error"
         assert "foobar" in result["message"]
         assert "snapshot" in result["message"]  # Lists valid types
 
-    def test_insight_redirects(self, chunk_context):
+    def test_insight_redirects(self, mock_context_paths):
         """chunk_type='insight' should redirect to rlm_remember()."""
-        from mcp_server.tools.navigation import chunk
-
         result = chunk("This is a permanent fact", chunk_type="insight")
         assert result["status"] == "redirect"
         assert "rlm_remember" in result["message"]
 
-    def test_insight_does_not_create_chunk(self, chunk_context):
+    def test_insight_does_not_create_chunk(self, mock_context_paths):
         """Insight redirect should NOT create a chunk file."""
-        from mcp_server.tools.navigation import chunk
-
         chunk("Should not be saved", chunk_type="insight")
 
-        index = json.loads((chunk_context / "index.json").read_text())
-        assert len(index["chunks"]) == 0
+        assert load_index_by_id(mock_context_paths / "index.json") == {}
 
 
 # =============================================================================
@@ -101,43 +67,34 @@ class TestChunkTypeValidation:
 class TestChunkTypePersistence:
     """Tests for chunk_type storage in YAML frontmatter and index."""
 
-    def test_chunk_type_in_yaml_frontmatter(self, chunk_context):
+    def test_chunk_type_in_yaml_frontmatter(self, mock_context_paths):
         """chunk_type should appear in the YAML frontmatter of .md file."""
-        from mcp_server.tools.navigation import chunk
-
         result = chunk("Debug content", chunk_type="debug", tags=["test"])
         chunk_id = result["chunk_id"]
 
-        chunk_file = chunk_context / "chunks" / f"{chunk_id}.md"
-        content = chunk_file.read_text()
-
-        assert "chunk_type: debug" in content
+        chunk_file = mock_context_paths / "chunks" / f"{chunk_id}.md"
+        assert read_frontmatter(chunk_file)["chunk_type"] == "debug"
+        with read_mmap(chunk_file) as mm:
+            assert mm.find(b"Debug content") != -1
 
-    def test_chunk_type_in_index(self, chunk_context):
+    def test_chunk_type_in_index(self, mock_context_paths):
         """chunk_type should be stored in index.json metadata."""
-        from mcp_server.tools.navigation import chunk
-
         result = chunk("Snapshot content", chunk_type="snapshot", tags=["test"])
         chunk_id = result["chunk_id"]
 
-        index = json.loads((chunk_context / "index.json").read_text())
-        created_chunk = next(c for c in index["chunks"] if c["id"] == chunk_id)
-        assert created_chunk["chunk_type"] == "snapshot"
+        by_id = load_index_by_id(mock_context_paths / "index.json")
+        assert by_id[chunk_id]["chunk_type"] == "snapshot"
 
-    def test_each_type_persists_correctly(self, chunk_context):
+    def test_each_type_persists_correctly(self, mock_context_paths):
         """Each valid type should persist its own value."""
-        from mcp_server.tools.navigation import chunk
-
         types_created = {}
         for ctype in ("snapshot", "session", "debug"):
             result = chunk(f"Content {ctype}", chunk_type=ctype, tags=["test"])
             types_created[result["chunk_id"]] = ctype
 
-        index = json.loads((chunk_context / "index.json").read_text())
-        for idx_chunk in index["chunks"]:
-            expected = types_created.get(idx_chunk["id"])
-            if expected:
-                assert idx_chunk["chunk_type"] == expected
+        by_id = load_index_by_id(mock_context_paths / "index.json")
+        for chunk_id, expected in types_created.items():
+            assert by_id[chunk_id]["chunk_type"] == expected
 
 
 # =============================================================================
@@ -148,12 +105,10 @@ class TestChunkTypePersistence:
 class TestChunkTypeBackwardCompat:
     """Tests for backward compatibility with pre-Phase 9 chunks."""
 
-    def test_old_chunks_without_type_readable(self, chunk_context):
+    def test_old_chunks_without_type_readable(self, mock_context_paths):
         """Chunks without chunk_type in index should still be readable via peek."""
-        from mcp_server.tools.navigation import peek
-
         # Create a legacy chunk (no chunk_type in index or YAML)
-        chunks_dir = chunk_context / "chunks"
+        chunks_dir = mock_context_paths / "chunks"
         legacy_file = chunks_dir / "legacy_001.md"
         legacy_file.write_text("""---
 summary: Legacy chunk without type
@@ -164,7 +119,7 @@ created: 2026-01-15T10:00:00
 This is a legacy chunk from before Phase 9.
 """)
 
-        index = json.loads((chunk_context / "index.json").read_text())
+        index = json.loads((mock_context_paths / "index.json").read_text())
         index["chunks"].append({
             "id": "legacy_001",
             "file": "chunks/legacy_001.md",
@@ -174,7 +129,8 @@ This is a legacy chunk from before Phase 9.
             "access_count": 0,
             "created_at": "2026-01-15T10:00:00",
         })
-        (chunk_context / "index.json").write_text(json.dumps(index, indent=2))
+        payload = json.dumps(index, separators=(",", ":")).encode()
+        (mock_context_paths / "index.json").write_bytes(payload)
 
         result = peek("legacy_001")
         assert result["status"] == "success"
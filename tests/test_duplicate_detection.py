@@ -0,0 +1,64 @@
+"""
+Tests for chunk duplicate detection (Phase 4.2).
+
+Tests cover:
+- Re-saving the same content (modulo case/whitespace) is reported as duplicate
+- New chunks record the hash algorithm in index.json
+- Chunks indexed with a legacy SHA-256 hash (no hash_algo) are still matched
+- The hash lookup is extended in place as chunks are appended
+- ASCII and non-ASCII normalization produce identical hashes
+"""
+
+import hashlib
+import json
+
+
+class TestDuplicateDetection:
+    def test_normalized_content_is_duplicate(self, nav):
+        first = nav.chunk("Hello   World\nagain", project="p")
+        second = nav.chunk("hello world AGAIN", project="p")
+
+        assert second["status"] == "duplicate"
+        assert second["existing_chunk_id"] == first["chunk_id"]
+
+    def test_hash_algo_recorded(self, nav):
+        nav.chunk("Some content", project="p")
+
+        entry = nav._load_index()["chunks"][0]
+        assert entry["hash_algo"] == nav.HASH_ALGO
+        assert entry["content_hash"] == nav._content_hash("Some content")
+
+    def test_legacy_sha256_entry_matches(self, nav):
+        legacy_hash = hashlib.sha256(b"legacy content").hexdigest()
+        data = json.loads(nav.INDEX_FILE.read_text())
+        data["chunks"].append(
+            {"id": "2026-01-01_p_001", "file": "chunks/x.md", "content_hash": legacy_hash}
+        )
+        nav.INDEX_FILE.write_text(json.dumps(data, separators=(",", ":")))
+
+        result = nav.chunk("Legacy  Content", project="p")
+
+        assert result["status"] == "duplicate"
+        assert result["existing_chunk_id"] == "2026-01-01_p_001"
+
+    def test_lookup_extended_in_place_matches_rebuild(self, nav):
+        for i in range(3):
+            nav.chunk(f"Content {i} in server{i}.py", project="p" if i % 2 else "q", domain="bp")
+            # Entity structures are lazy: build them mid-way so they get extended too
+            nav._filter_chunks(nav._load_index(), entity="server")
+
+        index = nav._load_index()
+        cached = nav._index_lookup(index)
+        assert nav._LOOKUP_CACHE["lookup"] is cached
+
+        nav._LOOKUP_CACHE["key"] = None
+        rebuilt = nav._index_lookup(index)
+        assert rebuilt is not cached
+        nav._filter_chunks(index, entity="server")
+        assert rebuilt == cached
+        assert cached["entity_trigrams"]["ver"] == [0, 1, 2]
+
+    def test_ascii_fast_path_matches_str_normalization(self, nav):
+        for text in ["  A\tb\r\n\x1cC  ", "", "   ", "x\x0by\x0cz", "Été  Déjà vu"]:
+            expected = " ".join(text.lower().split()).encode()
+            assert nav._content_hash(text, "sha256") == hashlib.sha256(expected).hexdigest()
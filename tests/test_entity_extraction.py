@@ -136,6 +136,17 @@ class TestExtractEntities:
         total = sum(len(v) for v in result.values())
         assert total <= 10
 
+    def test_adjacent_entities_share_delimiter(self):
+        """A single separator between two entities must not hide the second one."""
+        result = _extract_entities("Bumped v1.2.3 v2.0.0 in a.py b.py")
+        assert result["versions"] == ["v1.2.3", "v2.0.0"]
+        assert result["files"] == ["a.py", "b.py"]
+
+    def test_ticket_inside_filename(self):
+        result = _extract_entities("See notes in JJ-123.md for details")
+        assert "JJ-123.md" in result["files"]
+        assert "JJ-123" in result["tickets"]
+
     def test_french_content(self):
         """Entity extraction should work with French text."""
         content = """
@@ -9,62 +9,90 @@ Tests:
 - Graceful degradation without thefuzz
 """
 
-import json
-from pathlib import Path
+import os
 
 import pytest
 
+import mcp_server.tools.navigation as nav
+from mcp_server.tools.fileutil import json_dumps
+from tests.conftest import create_chunks_batch
 
-class TestGrepFuzzyBasic:
-    """Basic fuzzy grep functionality tests."""
+_CHUNK_TEMPLATE = """---
+summary: {summary}
+tags: {tags}
+project: {project}
+domain: {domain}
+created: 2026-01-19T10:00:00
+---
+
+{content}
+"""
+
+
+class FuzzyContext:
+    """
+    Temporary context shared by all tests of a class.
+
+    The directory tree and the navigation patches are set up once per class;
+    each test only empties chunks/ and rewrites an empty index. Subclasses
+    carry an xdist_group mark so that, under ``pytest -n auto --dist
+    loadgroup``, classes spread across workers but each stays on one.
+    """
+
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def class_context(cls, tmp_path_factory):
+        """Create the context directory and patch navigation paths once per class."""
+        cls.context_dir = tmp_path_factory.mktemp("context")
+        cls.chunks_dir = cls.context_dir / "chunks"
+        cls.chunks_dir.mkdir()
+        cls.nav = nav
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(nav, "CONTEXT_DIR", cls.context_dir)
+            mp.setattr(nav, "CHUNKS_DIR", cls.chunks_dir)
+            mp.setattr(nav, "INDEX_FILE", cls.context_dir / "index.json")
+            yield
 
     @pytest.fixture(autouse=True)
-    def setup_temp_context(self, tmp_path, monkeypatch):
-        """Set up temporary context directory for each test."""
-        self.context_dir = tmp_path / "context"
-        self.chunks_dir = self.context_dir / "chunks"
-        self.chunks_dir.mkdir(parents=True)
-
-        # Initialize index
-        index_file = self.context_dir / "index.json"
-        index_file.write_text(
-            json.dumps({"version": "2.1.0", "chunks": [], "total_tokens_estimate": 0}, indent=2)
-        )
+    def setup_temp_context(self, class_context):
+        """Reset chunks/ and index.json before each test."""
+        for entry in os.scandir(self.chunks_dir):
+            os.unlink(entry.path)
 
-        # Patch the module paths
-        import mcp_server.tools.navigation as nav
+        # Parsed once; helpers append to it and rewrite index.json
+        self._index = {"version": "2.1.0", "chunks": [], "total_tokens_estimate": 0}
+        self._write_index()
 
-        monkeypatch.setattr(nav, "CONTEXT_DIR", self.context_dir)
-        monkeypatch.setattr(nav, "CHUNKS_DIR", self.chunks_dir)
-        monkeypatch.setattr(nav, "INDEX_FILE", self.context_dir / "index.json")
+        # index.json is rewritten in place (same inode) and chunk paths repeat
+        # across tests, so drop the stat-keyed caches
+        self.nav._INDEX_CACHE["key"] = None
+        self.nav._clear_body_cache()
 
-        self.nav = nav
+    def _write_index(self):
+        """Write the in-memory index to index.json."""
+        (self.context_dir / "index.json").write_bytes(json_dumps(self._index, compact=True))
 
     def _create_chunk(self, chunk_id: str, content: str, **metadata):
-        """Helper to create a chunk for testing."""
-        # Create chunk file
-        chunk_file = self.chunks_dir / f"{chunk_id}.md"
+        """Helper to create a chunk file and its index entry."""
         summary = metadata.get("summary", content.split("\n")[0][:50])
         tags = metadata.get("tags", [])
         project = metadata.get("project", "")
         domain = metadata.get("domain", "")
 
-        file_content = f"""---
-summary: {summary}
-tags: {", ".join(tags) if tags else ""}
-project: {project}
-domain: {domain}
-created: 2026-01-19T10:00:00
----
-
-{content}
-"""
-        chunk_file.write_text(file_content)
+        (self.chunks_dir / f"{chunk_id}.md").write_bytes(
+            _CHUNK_TEMPLATE.format_map(
+                {
+                    "summary": summary,
+                    "tags": ", ".join(tags),
+                    "project": project,
+                    "domain": domain,
+                    "content": content,
+                }
+            ).encode()
+        )
 
-        # Update index
-        index_file = self.context_dir / "index.json"
-        index = json.loads(index_file.read_text())
-        index["chunks"].append(
+        self._index["chunks"].append(
             {
                 "id": chunk_id,
                 "file": f"chunks/{chunk_id}.md",
@@ -76,7 +104,12 @@ created: 2026-01-19T10:00:00
                 "access_count": 0,
             }
         )
-        index_file.write_text(json.dumps(index, indent=2))
+        self._write_index()
+
+
+@pytest.mark.xdist_group("fuzzy_basic")
+class TestGrepFuzzyBasic(FuzzyContext):
+    """Basic fuzzy grep functionality tests."""
 
     def test_fuzzy_finds_exact_match(self):
         """Fuzzy grep should find exact matches."""
@@ -145,65 +178,10 @@ created: 2026-01-19T10:00:00
         assert 0 <= result["matches"][0]["score"] <= 100
 
 
-class TestGrepFuzzyFilters:
+@pytest.mark.xdist_group("fuzzy_filters")
+class TestGrepFuzzyFilters(FuzzyContext):
     """Test fuzzy grep with project/domain filters."""
 
-    @pytest.fixture(autouse=True)
-    def setup_temp_context(self, tmp_path, monkeypatch):
-        """Set up temporary context directory for each test."""
-        self.context_dir = tmp_path / "context"
-        self.chunks_dir = self.context_dir / "chunks"
-        self.chunks_dir.mkdir(parents=True)
-
-        index_file = self.context_dir / "index.json"
-        index_file.write_text(
-            json.dumps({"version": "2.1.0", "chunks": [], "total_tokens_estimate": 0}, indent=2)
-        )
-
-        import mcp_server.tools.navigation as nav
-
-        monkeypatch.setattr(nav, "CONTEXT_DIR", self.context_dir)
-        monkeypatch.setattr(nav, "CHUNKS_DIR", self.chunks_dir)
-        monkeypatch.setattr(nav, "INDEX_FILE", self.context_dir / "index.json")
-
-        self.nav = nav
-
-    def _create_chunk(self, chunk_id: str, content: str, **metadata):
-        """Helper to create a chunk for testing."""
-        chunk_file = self.chunks_dir / f"{chunk_id}.md"
-        summary = metadata.get("summary", content[:50])
-        tags = metadata.get("tags", [])
-        project = metadata.get("project", "")
-        domain = metadata.get("domain", "")
-
-        file_content = f"""---
-summary: {summary}
-tags: {", ".join(tags) if tags else ""}
-project: {project}
-domain: {domain}
-created: 2026-01-19T10:00:00
----
-
-{content}
-"""
-        chunk_file.write_text(file_content)
-
-        index_file = self.context_dir / "index.json"
-        index = json.loads(index_file.read_text())
-        index["chunks"].append(
-            {
-                "id": chunk_id,
-                "file": f"chunks/{chunk_id}.md",
-                "summary": summary,
-                "tags": tags,
-                "project": project,
-                "domain": domain,
-                "tokens_estimate": 100,
-                "access_count": 0,
-            }
-        )
-        index_file.write_text(json.dumps(index, indent=2))
-
     def test_fuzzy_filter_by_project(self):
         """Fuzzy grep should filter by project."""
         self._create_chunk("rlm_001", "Business plan RLM.", project="RLM")
@@ -227,58 +205,10 @@ created: 2026-01-19T10:00:00
         assert all(m["chunk_id"] == "bp_001" for m in result["matches"])
 
 
-class TestGrepFuzzyIntegration:
+@pytest.mark.xdist_group("fuzzy_integration")
+class TestGrepFuzzyIntegration(FuzzyContext):
     """Integration tests for fuzzy grep via grep() dispatcher."""
 
-    @pytest.fixture(autouse=True)
-    def setup_temp_context(self, tmp_path, monkeypatch):
-        """Set up temporary context directory."""
-        self.context_dir = tmp_path / "context"
-        self.chunks_dir = self.context_dir / "chunks"
-        self.chunks_dir.mkdir(parents=True)
-
-        index_file = self.context_dir / "index.json"
-        index_file.write_text(
-            json.dumps({"version": "2.1.0", "chunks": [], "total_tokens_estimate": 0}, indent=2)
-        )
-
-        import mcp_server.tools.navigation as nav
-
-        monkeypatch.setattr(nav, "CONTEXT_DIR", self.context_dir)
-        monkeypatch.setattr(nav, "CHUNKS_DIR", self.chunks_dir)
-        monkeypatch.setattr(nav, "INDEX_FILE", self.context_dir / "index.json")
-
-        self.nav = nav
-
-    def _create_chunk(self, chunk_id: str, content: str, **metadata):
-        """Helper to create a chunk."""
-        chunk_file = self.chunks_dir / f"{chunk_id}.md"
-        summary = metadata.get("summary", content[:50])
-
-        file_content = f"""---
-summary: {summary}
-created: 2026-01-19T10:00:00
----
-
-{content}
-"""
-        chunk_file.write_text(file_content)
-
-        index_file = self.context_dir / "index.json"
-        index = json.loads(index_file.read_text())
-        index["chunks"].append(
-            {
-                "id": chunk_id,
-                "file": f"chunks/{chunk_id}.md",
-                "summary": summary,
-                "project": metadata.get("project", ""),
-                "domain": metadata.get("domain", ""),
-                "tokens_estimate": 100,
-                "access_count": 0,
-            }
-        )
-        index_file.write_text(json.dumps(index, indent=2))
-
     def test_grep_dispatches_to_fuzzy(self):
         """grep() with fuzzy=True should use grep_fuzzy()."""
         self._create_chunk("test_001", "La validation est terminee.")
@@ -300,30 +230,85 @@ created: 2026-01-19T10:00:00
         # Exact regex won't find "validaton" in "validation"
         assert result["match_count"] == 0
 
-
-class TestGrepFuzzyEdgeCases:
+    def test_grep_literal_prefilter_keeps_case_folds(self):
+        """Literal prefilter must not drop chunks only re.IGNORECASE can match."""
+        self._create_chunk("test_003", "Valeur: 300 Kelvin")
+        self._create_chunk("test_004", "Rien a voir ici.")
+
+        result = self.nav.grep("kelvin")
+
+        assert [m["chunk_id"] for m in result["matches"]] == ["test_003"]
+
+    def test_grep_parallel_matches_sequential(self, monkeypatch):
+        """Thread-pool grep returns the same matches, in index order, as inline grep."""
+        for i in range(12):
+            self._create_chunk(f"test_{i:03d}", "\n".join(["token here"] * (i % 3) + ["other"]))
+        (self.chunks_dir / "test_004.md").unlink()  # indexed but missing on disk
+
+        results = {}
+        for parallel_min in (1, 1000):
+            monkeypatch.setattr(self.nav, "GREP_PARALLEL_MIN", parallel_min)
+            for limit in (1, 5, 50):
+                results[parallel_min, limit] = self.nav.grep("token", limit=limit)["matches"]
+
+        for limit in (1, 5, 50):
+            assert results[1, limit] == results[1000, limit]
+        assert len(results[1, 5]) == 5
+        assert "test_004" not in {m["chunk_id"] for m in results[1, 50]}
+
+    def test_fuzzy_parallel_matches_sequential(self, monkeypatch):
+        """Thread-pool fuzzy grep ranks matches exactly like the inline scan."""
+        for i in range(12):
+            self._create_chunk(f"test_{i:03d}", "\n".join(["validation ok", "validaton"][: i % 3]))
+        (self.chunks_dir / "test_004.md").unlink()  # indexed but missing on disk
+
+        results = {}
+        for parallel_min in (1, 1000):
+            monkeypatch.setattr(self.nav, "GREP_PARALLEL_MIN", parallel_min)
+            results[parallel_min] = self.nav.grep_fuzzy("validation", threshold=80, limit=50)
+
+        assert results[1] == results[1000]
+        assert results[1]["match_count"] > 0
+
+    def test_fuzzy_body_cache_sees_rewritten_chunk(self):
+        """Cached chunk bodies are re-read once the chunk file changes."""
+        self._create_chunk("test_005", "La validation est terminee.")
+        assert self.nav.grep_fuzzy("validation", threshold=90)["match_count"] == 1
+
+        self._create_chunk("test_005", "Tout autre contenu, beaucoup plus long.")
+        assert self.nav.grep_fuzzy("validation", threshold=90)["match_count"] == 0
+
+    def test_fuzzy_body_cache_is_bounded_by_bytes(self, monkeypatch):
+        """Least recently used bodies are evicted past BODY_CACHE_MAX_BYTES."""
+        for i in range(4):
+            self._create_chunk(f"test_00{i}", f"Validation numero {i}. " * 20)
+        budget = 2 * 2 * (self.chunks_dir / "test_000.md").stat().st_size
+        monkeypatch.setattr(self.nav, "BODY_CACHE_MAX_BYTES", budget)
+
+        assert self.nav.grep_fuzzy("validation", threshold=90)["match_count"] == 4
+        assert len(self.nav._BODY_CACHE) == 2
+        assert self.nav._BODY_CACHE_STATE["bytes"] <= budget
+
+    def test_fuzzy_parses_index_once(self, monkeypatch):
+        """Repeated fuzzy greps reuse the parsed index until index.json changes."""
+        self._create_chunk("test_006", "La validation est terminee.")
+        parses = []
+        real_loads = self.nav.json_loads
+        monkeypatch.setattr(self.nav, "json_loads", lambda b: parses.append(1) or real_loads(b))
+
+        for _ in range(10):
+            assert self.nav.grep_fuzzy("validation", threshold=90)["match_count"] == 1
+        assert len(parses) == 1
+
+        self._create_chunk("test_007", "Autre validation.")
+        assert self.nav.grep_fuzzy("validation", threshold=90)["match_count"] == 2
+        assert len(parses) == 2
+
+
+@pytest.mark.xdist_group("fuzzy_edge_cases")
+class TestGrepFuzzyEdgeCases(FuzzyContext):
     """Edge cases and error handling for fuzzy grep."""
 
-    @pytest.fixture(autouse=True)
-    def setup_temp_context(self, tmp_path, monkeypatch):
-        """Set up temporary context directory."""
-        self.context_dir = tmp_path / "context"
-        self.chunks_dir = self.context_dir / "chunks"
-        self.chunks_dir.mkdir(parents=True)
-
-        index_file = self.context_dir / "index.json"
-        index_file.write_text(
-            json.dumps({"version": "2.1.0", "chunks": [], "total_tokens_estimate": 0}, indent=2)
-        )
-
-        import mcp_server.tools.navigation as nav
-
-        monkeypatch.setattr(nav, "CONTEXT_DIR", self.context_dir)
-        monkeypatch.setattr(nav, "CHUNKS_DIR", self.chunks_dir)
-        monkeypatch.setattr(nav, "INDEX_FILE", self.context_dir / "index.json")
-
-        self.nav = nav
-
     def test_fuzzy_empty_chunks(self):
         """Fuzzy grep on empty database should return empty results."""
         result = self.nav.grep_fuzzy("test", threshold=80)
@@ -333,26 +318,18 @@ class TestGrepFuzzyEdgeCases:
 
     def test_fuzzy_respects_limit(self):
         """Fuzzy grep should respect the limit parameter."""
-        # Create many chunks
-        for i in range(20):
-            chunk_id = f"test_{i:03d}"
-            chunk_file = self.chunks_dir / f"{chunk_id}.md"
-            chunk_file.write_text(f"---\nsummary: Test {i}\n---\n\nTest content number {i}.")
-
-            index_file = self.context_dir / "index.json"
-            index = json.loads(index_file.read_text())
-            index["chunks"].append(
+        # Create many chunks, with a single index.json write
+        create_chunks_batch(
+            self.context_dir,
+            [
                 {
-                    "id": chunk_id,
-                    "file": f"chunks/{chunk_id}.md",
+                    "id": f"test_{i:03d}",
+                    "content": f"Test content number {i}.",
                     "summary": f"Test {i}",
-                    "project": "",
-                    "domain": "",
-                    "tokens_estimate": 10,
-                    "access_count": 0,
                 }
-            )
-            index_file.write_text(json.dumps(index, indent=2))
+                for i in range(20)
+            ],
+        )
 
         result = self.nav.grep_fuzzy("test", threshold=50, limit=5)
 
@@ -372,58 +349,10 @@ class TestGrepFuzzyEdgeCases:
             self.nav.FUZZY_AVAILABLE = original_available
 
 
-class TestRealWorldScenarios:
+@pytest.mark.xdist_group("fuzzy_real_world")
+class TestRealWorldScenarios(FuzzyContext):
     """Real-world fuzzy search scenarios."""
 
-    @pytest.fixture(autouse=True)
-    def setup_temp_context(self, tmp_path, monkeypatch):
-        """Set up temporary context directory."""
-        self.context_dir = tmp_path / "context"
-        self.chunks_dir = self.context_dir / "chunks"
-        self.chunks_dir.mkdir(parents=True)
-
-        index_file = self.context_dir / "index.json"
-        index_file.write_text(
-            json.dumps({"version": "2.1.0", "chunks": [], "total_tokens_estimate": 0}, indent=2)
-        )
-
-        import mcp_server.tools.navigation as nav
-
-        monkeypatch.setattr(nav, "CONTEXT_DIR", self.context_dir)
-        monkeypatch.setattr(nav, "CHUNKS_DIR", self.chunks_dir)
-        monkeypatch.setattr(nav, "INDEX_FILE", self.context_dir / "index.json")
-
-        self.nav = nav
-
-    def _create_chunk(self, chunk_id: str, content: str, **metadata):
-        """Helper to create a chunk."""
-        chunk_file = self.chunks_dir / f"{chunk_id}.md"
-        summary = metadata.get("summary", content[:50])
-
-        file_content = f"""---
-summary: {summary}
-created: 2026-01-19T10:00:00
----
-
-{content}
-"""
-        chunk_file.write_text(file_content)
-
-        index_file = self.context_dir / "index.json"
-        index = json.loads(index_file.read_text())
-        index["chunks"].append(
-            {
-                "id": chunk_id,
-                "file": f"chunks/{chunk_id}.md",
-                "summary": summary,
-                "project": metadata.get("project", ""),
-                "domain": metadata.get("domain", ""),
-                "tokens_estimate": 100,
-                "access_count": 0,
-            }
-        )
-        index_file.write_text(json.dumps(index, indent=2))
-
     def test_common_typo_buisness(self):
         """'buisness' should find 'business'."""
         self._create_chunk("bp_001", "Le business plan Joy Juice 2026 est pret.")
@@ -0,0 +1,102 @@
+"""
+Tests for the in-process index.json cache in navigation.
+
+Tests cover:
+- Repeated loads reuse the parsed index while the file is unchanged
+- External writes to index.json invalidate the cache
+- _save_index refreshes the cache with the saved dict
+"""
+
+import json
+
+
+class TestIndexCache:
+    def test_unchanged_file_is_not_reparsed(self, nav, monkeypatch):
+        first = nav._load_index()
+
+        def fail(_data):
+            raise AssertionError("index.json re-parsed while unchanged")
+
+        monkeypatch.setattr(nav, "json_loads", fail)
+        assert nav._load_index() is first
+
+    def test_external_write_invalidates(self, nav):
+        nav._load_index()
+
+        data = json.loads(nav.INDEX_FILE.read_text())
+        data["chunks"].append({"id": "2026-01-01_001", "file": "chunks/2026-01-01_001.md"})
+        nav.INDEX_FILE.write_text(json.dumps(data, separators=(",", ":")))
+
+        assert [c["id"] for c in nav._load_index()["chunks"]] == ["2026-01-01_001"]
+
+    def test_save_refreshes_cache(self, nav):
+        index = nav._load_index()
+        index["chunks"].append({"id": "2026-01-02_001", "file": "chunks/2026-01-02_001.md"})
+        nav._save_index(index)
+
+        assert nav._load_index() is index
+        on_disk = nav.INDEX_FILE.read_text()
+        assert json.loads(on_disk)["total_chunks"] == 1
+        assert "\n" not in on_disk  # written compact
+
+
+class TestIndexLookup:
+    def _write_index(self, nav, chunks):
+        data = json.loads(nav.INDEX_FILE.read_text())
+        data["chunks"] = chunks
+        nav.INDEX_FILE.write_text(json.dumps(data, separators=(",", ":")))
+
+    def test_filter_matches_linear_scan(self, nav):
+        chunks = [
+            {"id": "2026-01-10_A_001", "project": "A", "domain": "bp", "created_at": "2026-01-10"},
+            {
+                "id": "2026-01-20_B_001",
+                "project": "B",
+                "domain": "bp",
+                "created_at": "2026-01-20",
+                "entities": {"files": ["Server.py"], "tickets": ["JJ-12"]},
+            },
+            {"id": "2026-01-30_A_001", "project": "A", "domain": "seo", "entities": "old"},
+            {"id": "legacy", "project": "A", "domain": "bp", "entities": {"files": ["server.py"]}},
+        ]
+        self._write_index(nav, chunks)
+        index = nav._load_index()
+
+        for project, domain, date_from, date_to, entity in [
+            ("A", None, None, None, None),
+            (None, "bp", None, None, None),
+            ("A", "bp", "2026-01-01", None, None),
+            (None, None, "2026-01-15", "2026-01-30", None),
+            (None, None, None, "2026-01-10", None),
+            ("C", None, None, None, None),
+            (None, None, None, None, "SERVER"),
+            ("A", None, None, None, "server.py"),
+            (None, None, None, None, "py\x00jj"),
+            (None, None, None, None, "jj-1"),
+        ]:
+            expected = [
+                c["id"]
+                for c in chunks
+                if nav._chunk_in_date_range(c, date_from, date_to)
+                and (not project or c.get("project") == project)
+                and (not domain or c.get("domain") == domain)
+                and (not entity or nav._entity_matches(c, entity))
+            ]
+            got = [
+                c["id"]
+                for c in nav._filter_chunks(index, project, domain, date_from, date_to, entity)
+            ]
+            assert got == expected
+
+    def test_lookup_rebuilt_after_index_change(self, nav):
+        self._write_index(nav, [{"id": "2026-01-10_A_001", "project": "A"}])
+        assert nav._index_lookup(nav._load_index())["by_project"] == {"A": [0]}
+
+        self._write_index(
+            nav,
+            [
+                {"id": "2026-01-10_A_001", "project": "A"},
+                {"id": "2026-01-11_B_001", "project": "B"},
+            ],
+        )
+        assert nav._index_lookup(nav._load_index())["by_project"] == {"A": [0], "B": [1]}
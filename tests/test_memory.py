@@ -0,0 +1,65 @@
+"""
+Tests for RLM memory tools (remember / update / forget / memory_status).
+
+Tests cover:
+- Category and importance counters kept in sync across writes
+- Cache invalidation when session_memory.json changes on disk
+"""
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def memory_module(tmp_path, monkeypatch):
+    """Point the memory module at a fresh, empty memory file."""
+    import mcp_server.tools.memory as memory
+
+    monkeypatch.setattr(memory, "MEMORY_FILE", tmp_path / "session_memory.json")
+    return memory
+
+
+class TestMemoryCounters:
+    def test_status_counts_after_remember(self, memory_module):
+        memory_module.remember("A", category="decision", importance="high")
+        memory_module.remember("B", category="decision", importance="low")
+        memory_module.remember("C", category="fact")
+
+        status = memory_module.memory_status()
+        assert status["total_insights"] == 3
+        assert status["by_category"] == {"decision": 2, "fact": 1}
+        assert status["by_importance"] == {"high": 1, "low": 1, "medium": 1}
+
+    def test_status_counts_after_update_and_forget(self, memory_module):
+        first = memory_module.remember("A", category="decision")["id"]
+        second = memory_module.remember("B", category="fact", importance="high")["id"]
+
+        memory_module.update(first, category="finding", importance="critical")
+        memory_module.forget(second)
+
+        status = memory_module.memory_status()
+        assert status["by_category"] == {"finding": 1}
+        assert status["by_importance"] == {"critical": 1}
+
+    def test_no_change_update_does_not_touch_insight(self, memory_module):
+        insight_id = memory_module.remember("A")["id"]
+
+        result = memory_module.update(insight_id)
+
+        assert result["status"] == "no_change"
+        insight = memory_module.recall()["insights"][0]
+        assert "updated_at" not in insight
+
+    def test_external_write_invalidates_cache(self, memory_module):
+        memory_module.remember("A", category="decision")
+        assert memory_module.memory_status()["by_category"] == {"decision": 1}
+
+        data = json.loads(memory_module.MEMORY_FILE.read_text())
+        data["insights"].append(
+            {"id": "ext00001", "content": "external", "category": "todo", "created_at": "x"}
+        )
+        memory_module.MEMORY_FILE.write_text(json.dumps(data, indent=2))
+
+        status = memory_module.memory_status()
+        assert status["by_category"] == {"decision": 1, "todo": 1}
@@ -15,6 +15,9 @@ from datetime import datetime, timedelta
 
 import pytest
 
+import mcp_server.tools.retention as retention
+from tests.conftest import create_chunks_batch
+
 # Fixtures are automatically discovered from conftest.py by pytest
 
 
@@ -27,14 +30,16 @@ import pytest
 def retention_context(temp_context_dir, monkeypatch):
     """Set up context with retention module patched."""
     # Patch paths in retention module
-    import mcp_server.tools.retention as retention
-
-    monkeypatch.setattr(retention, "CONTEXT_DIR", temp_context_dir)
-    monkeypatch.setattr(retention, "CHUNKS_DIR", temp_context_dir / "chunks")
-    monkeypatch.setattr(retention, "ARCHIVE_DIR", temp_context_dir / "archive")
-    monkeypatch.setattr(retention, "INDEX_FILE", temp_context_dir / "index.json")
-    monkeypatch.setattr(retention, "ARCHIVE_INDEX_FILE", temp_context_dir / "archive_index.json")
-    monkeypatch.setattr(retention, "PURGE_LOG_FILE", temp_context_dir / "purge_log.json")
+    paths = {
+        "CONTEXT_DIR": temp_context_dir,
+        "CHUNKS_DIR": temp_context_dir / "chunks",
+        "ARCHIVE_DIR": temp_context_dir / "archive",
+        "INDEX_FILE": temp_context_dir / "index.json",
+        "ARCHIVE_INDEX_FILE": temp_context_dir / "archive_index.json",
+        "PURGE_LOG_FILE": temp_context_dir / "purge_log.json",
+    }
+    for name, path in paths.items():
+        monkeypatch.setattr(retention, name, path)
 
     # Create archive directory
     (temp_context_dir / "archive").mkdir(exist_ok=True)
@@ -45,9 +50,6 @@ def retention_context(temp_context_dir, monkeypatch):
 @pytest.fixture
 def old_chunks(retention_context):
     """Create old chunks for retention testing."""
-    chunks_dir = retention_context / "chunks"
-    index_file = retention_context / "index.json"
-
     # Date 45 days ago (past 30-day threshold)
     old_date = datetime.now() - timedelta(days=45)
     old_date_str = old_date.isoformat()
@@ -95,37 +97,8 @@ def old_chunks(retention_context):
         },
     ]
 
-    index_chunks = []
-
-    for chunk in chunks_data:
-        # Write chunk file
-        chunk_file = chunks_dir / f"{chunk['id']}.md"
-        chunk_file.write_text(f"""---
-summary: {chunk["summary"]}
-tags: {", ".join(chunk["tags"])}
-created_at: {chunk["created_at"]}
----
-
-{chunk["content"]}
-""")
-
-        # Add to index
-        index_chunks.append(
-            {
-                "id": chunk["id"],
-                "file": f"chunks/{chunk['id']}.md",
-                "summary": chunk["summary"],
-                "tags": chunk["tags"],
-                "tokens_estimate": len(chunk["content"].split()) * 2,
-                "created_at": chunk["created_at"],
-                "access_count": chunk["access_count"],
-            }
-        )
-
-    # Update index
-    index = json.loads(index_file.read_text())
-    index["chunks"] = index_chunks
-    index_file.write_text(json.dumps(index, indent=2))
+    # Chunk files plus one index.json write
+    create_chunks_batch(retention_context, chunks_data)
 
     return chunks_data
 
@@ -165,6 +138,18 @@ def test_is_immune_by_keyword(retention_context, old_chunks):
     assert is_immune(decision_chunk) is True
 
 
+def test_is_immune_by_recorded_keyword_flag(retention_context, old_chunks):
+    """The protected_keyword flag written with the chunk replaces the file scan."""
+    from mcp_server.tools.retention import is_immune
+
+    (retention_context / "chunks" / "old_decision_004.md").unlink()
+
+    flagged = {"id": "old_decision_004", "tags": [], "access_count": 0, "protected_keyword": True}
+    assert is_immune(flagged) is True
+    assert retention._has_protected_keyword("notes\na retenir: keep the v2 format") is True
+    assert retention._has_protected_keyword("nothing to keep here") is False
+
+
 def test_not_immune_regular_chunk(retention_context, old_chunks):
     """Regular old chunks without protection are not immune."""
     from mcp_server.tools.retention import is_immune
@@ -228,7 +213,7 @@ This is protected.
             "access_count": 0,
         }
     ]
-    index_file.write_text(json.dumps(index, indent=2))
+    index_file.write_bytes(json.dumps(index, separators=(",", ":")).encode())
 
     candidates = get_archive_candidates()
     assert len(candidates) == 0
@@ -260,7 +245,7 @@ def test_archive_chunk(retention_context, old_chunks):
     assert not (chunks_dir / "old_unused_001.md").exists()
 
     # Archive should exist
-    assert (archive_dir / "old_unused_001.md.gz").exists()
+    assert (archive_dir / f"old_unused_001{retention.ARCHIVE_SUFFIX}").exists()
 
 
 def test_archive_chunk_not_found(retention_context):
@@ -300,7 +285,7 @@ def test_restore_chunk(retention_context, old_chunks):
 
     # Archive first
     archive_chunk("old_unused_001")
-    assert (archive_dir / "old_unused_001.md.gz").exists()
+    assert (archive_dir / f"old_unused_001{retention.ARCHIVE_SUFFIX}").exists()
     assert not (chunks_dir / "old_unused_001.md").exists()
 
     # Restore
@@ -310,12 +295,46 @@ def test_restore_chunk(retention_context, old_chunks):
     assert result["chunk_id"] == "old_unused_001"
 
     # Archive should be gone
-    assert not (archive_dir / "old_unused_001.md.gz").exists()
+    assert not (archive_dir / f"old_unused_001{retention.ARCHIVE_SUFFIX}").exists()
 
     # Chunk should be back
     assert (chunks_dir / "old_unused_001.md").exists()
 
 
+@pytest.mark.parametrize("suffix", [".md.gz", ".md.zst"])
+def test_restore_chunk_each_format(retention_context, old_chunks, monkeypatch, suffix):
+    """Archives in either format (gzip or zstd) restore byte-for-byte."""
+    if suffix == ".md.zst":
+        pytest.importorskip("zstandard")
+    from mcp_server.tools.retention import archive_chunk, is_archived, restore_chunk
+
+    chunk_file = retention_context / "chunks" / "old_unused_001.md"
+    original = chunk_file.read_bytes()
+
+    monkeypatch.setattr(retention, "ARCHIVE_SUFFIX", suffix)
+    archive_chunk("old_unused_001")
+    assert (retention_context / "archive" / f"old_unused_001{suffix}").exists()
+    assert is_archived("old_unused_001")
+
+    assert restore_chunk("old_unused_001")["status"] == "restored"
+    assert chunk_file.read_bytes() == original
+    assert not is_archived("old_unused_001")
+
+
+def test_restore_chunk_size_limit(retention_context, old_chunks, monkeypatch):
+    """Archives that decompress past MAX_DECOMPRESSED_SIZE are rejected."""
+    from mcp_server.tools.retention import archive_chunk, restore_chunk
+
+    archive_chunk("old_unused_001")
+    monkeypatch.setattr(retention, "MAX_DECOMPRESSED_SIZE", 10)
+
+    result = restore_chunk("old_unused_001")
+
+    assert result["status"] == "error"
+    assert "exceeds" in result["message"]
+    assert not (retention_context / "chunks" / "old_unused_001.md").exists()
+
+
 def test_restore_chunk_not_found(retention_context):
     """restore_chunk returns error for non-existent archive."""
     from mcp_server.tools.retention import restore_chunk
@@ -346,7 +365,7 @@ def test_purge_chunk(retention_context, old_chunks):
     assert result["status"] == "purged"
 
     # Archive file should be gone
-    assert not (archive_dir / "old_unused_001.md.gz").exists()
+    assert not (archive_dir / f"old_unused_001{retention.ARCHIVE_SUFFIX}").exists()
 
     # Check purge log
     purge_log = _load_purge_log()
@@ -403,7 +422,7 @@ def test_retention_run_archive(retention_context, old_chunks):
     assert result["archived_count"] >= 1
 
     # Check archive was created
-    assert (archive_dir / "old_unused_001.md.gz").exists()
+    assert (archive_dir / f"old_unused_001{retention.ARCHIVE_SUFFIX}").exists()
 
 
 def test_retention_run_no_purge_by_default(retention_context, old_chunks):
@@ -428,6 +447,31 @@ def test_retention_run_empty_when_no_candidates(retention_context):
     assert result["error_count"] == 0
 
 
+@pytest.mark.parametrize("parallel_min", [1, 100], ids=["thread_pool", "serial"])
+def test_batch_archive_writes_each_index_once(
+    retention_context, old_chunks, monkeypatch, parallel_min
+):
+    """Archiving several chunks in one batch writes each index file once."""
+    monkeypatch.setattr(retention, "ARCHIVE_PARALLEL_MIN", parallel_min)
+    writes = []
+    real_write = retention.atomic_write_json
+    monkeypatch.setattr(
+        retention,
+        "atomic_write_json",
+        lambda path, data, **kw: writes.append(path.name) or real_write(path, data, **kw),
+    )
+
+    results = retention._archive_chunks(["old_unused_001", "missing_chunk", "recent_005"])
+
+    assert [r["status"] for r in results] == ["archived", "error", "archived"]
+    assert sorted(writes) == ["archive_index.json", "index.json"]
+    index_ids = {c["id"] for c in retention._load_index()["chunks"]}
+    assert index_ids.isdisjoint({"old_unused_001", "recent_005"})
+    archived = [a["id"] for a in retention._load_archive_index()["archives"]]
+    assert archived == ["old_unused_001", "recent_005"]
+    assert not (retention_context / "chunks" / "recent_005.md").exists()
+
+
 # =============================================================================
 # AUTO-RESTORE TESTS
 # =============================================================================
@@ -508,3 +552,24 @@ def test_index_updated_after_restore(retention_context, old_chunks):
     archive_index = _load_archive_index()
     archive_ids = [a["id"] for a in archive_index["archives"]]
     assert "old_unused_001" not in archive_ids
+
+
+def test_index_parsed_once_across_retention_run(retention_context, old_chunks, monkeypatch):
+    """Loads reuse the parsed index files; saves and external writes refresh them."""
+    parses = []
+    real_loads = retention.json_loads
+    monkeypatch.setattr(retention, "json_loads", lambda b: parses.append(b) or real_loads(b))
+
+    retention.retention_run(archive=True, purge=False)
+    retention.get_archive_candidates()
+    retention._load_archive_index()
+
+    # index.json parsed once; archive_index.json is created (and cached) by the saves
+    assert len(parses) == 1
+
+    index = json.loads(retention.INDEX_FILE.read_bytes())
+    index["chunks"] = index["chunks"][:1]
+    retention.INDEX_FILE.write_bytes(json.dumps(index).encode())
+
+    assert len(retention._load_index()["chunks"]) == 1
+    assert len(parses) == 2
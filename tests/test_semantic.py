@@ -61,6 +61,39 @@ class TestVectorStore:
         assert "chunk_2" in store2.chunk_ids
         assert store2.vectors.shape == (2, 3)
 
+    def test_load_defers_vectors(self, tmp_path):
+        """load() reads chunk IDs only; vectors are decoded on first use."""
+        store = self._make_store(tmp_path)
+        store.add("chunk_1", np.array([1.0, 0.0]))
+        store.add("chunk_2", np.array([0.0, 1.0]))
+        store.save()
+
+        store2 = self._make_store(tmp_path)
+        assert store2.load() is True
+        assert store2.chunk_ids == ["chunk_1", "chunk_2"]
+        assert store2._buffer is None
+
+        assert store2.remove("chunk_1") is True
+        assert store2.chunk_ids == ["chunk_2"]
+        np.testing.assert_array_equal(store2.vectors, [[0.0, 1.0]])
+
+    def test_saved_as_float16_loaded_as_float32(self, tmp_path):
+        """Vectors are stored compactly on disk but searched in float32."""
+        store = self._make_store(tmp_path)
+        store.add("chunk_1", np.array([0.1234, -0.5, 0.75]))
+        store.add("chunk_2", np.array([1e6, 0.0, 0.0]))  # out of float16 range
+        store.save()
+        assert np.load(store.path)["vectors"].dtype == np.float32
+
+        store.remove("chunk_2")
+        store.save()
+        assert np.load(store.path)["vectors"].dtype == np.float16
+
+        store2 = self._make_store(tmp_path)
+        store2.load()
+        assert store2.vectors.dtype == np.float32
+        np.testing.assert_allclose(store2.vectors[0], [0.1234, -0.5, 0.75], rtol=1e-3)
+
     def test_remove(self, tmp_path):
         """Remove deletes a chunk's vector."""
         store = self._make_store(tmp_path)
@@ -103,6 +136,92 @@ class TestVectorStore:
         store = self._make_store(tmp_path)
         assert store.load() is False
 
+    def test_hnsw_index_saved_and_used(self, tmp_path, monkeypatch):
+        """Large stores persist an HNSW index that agrees with brute force."""
+        pytest.importorskip("hnswlib")
+        import mcp_server.tools.vecstore as vecstore
+
+        monkeypatch.setattr(vecstore, "HNSW_MIN_VECTORS", 10)
+        store = self._make_store(tmp_path)
+        rng = np.random.default_rng(0)
+        for i in range(50):
+            store.add(f"chunk_{i}", rng.normal(size=8))
+        query = rng.normal(size=8)
+        exact = store.search(query, top_k=3)
+        store.save()
+        assert store.ann_path.exists()
+
+        store2 = self._make_store(tmp_path)
+        store2.load()
+        approx = store2.search(query, top_k=3)
+        assert store2._ann is not None
+        assert [cid for cid, _ in approx] == [cid for cid, _ in exact]
+        assert [s for _, s in approx] == pytest.approx([s for _, s in exact], abs=1e-2)
+
+        # Mutations are applied to the loaded index before the next search
+        store2.add("chunk_new", query)
+        assert store2.search(query, top_k=1)[0][0] == "chunk_new"
+
+    def test_hnsw_index_updated_without_rebuild(self, tmp_path, monkeypatch):
+        """Adds, replacements and removals after the first build patch the index in place."""
+        hnswlib = pytest.importorskip("hnswlib")
+        import mcp_server.tools.vecstore as vecstore
+
+        real_index = hnswlib.Index
+
+        monkeypatch.setattr(vecstore, "HNSW_MIN_VECTORS", 10)
+        store = self._make_store(tmp_path)
+        rng = np.random.default_rng(2)
+        for i in range(20):
+            store.add(f"chunk_{i}", rng.normal(size=8))
+        store.save()
+
+        def no_rebuild(*args, **kwargs):
+            raise AssertionError("HNSW index rebuilt")
+
+        monkeypatch.setattr(hnswlib, "Index", no_rebuild)
+        for i in range(20, 60):  # grows past the index capacity
+            store.add(f"chunk_{i}", rng.normal(size=8))
+        store.add("chunk_3", rng.normal(size=8))
+        for chunk_id in ("chunk_0", "chunk_59", "chunk_7"):
+            store.remove(chunk_id)
+        store.save()
+        monkeypatch.setattr(hnswlib, "Index", real_index)
+
+        reloaded = self._make_store(tmp_path)
+        reloaded.load()
+        for chunk_id in ("chunk_3", "chunk_58", "chunk_12"):
+            query = reloaded.vectors[reloaded.chunk_ids.index(chunk_id)]
+            top_id, score = reloaded.search(query, top_k=1)[0]
+            assert top_id == chunk_id
+            assert score == pytest.approx(1.0, abs=1e-3)
+        labels, _ = reloaded._ann.knn_query(rng.normal(size=(1, 8)), k=len(reloaded.chunk_ids))
+        assert sorted(labels[0]) == list(range(len(reloaded.chunk_ids)))
+
+    def test_get_store_shared_until_file_changes(self, tmp_path, monkeypatch):
+        """get_store() reuses one store across saves and reloads after outside changes."""
+        import mcp_server.tools.vecstore as vecstore
+
+        monkeypatch.setattr(vecstore, "_STORE_CACHE", {"key": None, "version": None, "store": None})
+        path = tmp_path / "test_embeddings.npz"
+        store = vecstore.get_store(path)
+        store.add("chunk_a", np.array([1.0, 0.0]))
+        store.save()
+        assert vecstore.get_store(path) is store
+
+        store.add("chunk_b", np.array([0.0, 1.0]))  # not saved: dropped
+        fresh = vecstore.get_store(path)
+        assert fresh is not store
+        assert fresh.chunk_ids == ["chunk_a"]
+        assert fresh.search(np.array([1.0, 0.0]))[0][0] == "chunk_a"  # decodes the vectors
+        assert vecstore.get_store(path) is fresh
+
+        other = self._make_store(tmp_path)
+        other.load()
+        other.add("chunk_c", np.array([0.5, 0.5]))
+        other.save()
+        assert sorted(vecstore.get_store(path).chunk_ids) == ["chunk_a", "chunk_c"]
+
     def test_add_replaces_existing(self, tmp_path):
         """Adding a chunk_id that already exists replaces the vector."""
         store = self._make_store(tmp_path)
@@ -113,6 +232,47 @@ class TestVectorStore:
         assert store.vectors.shape == (1, 2)
         np.testing.assert_array_almost_equal(store.vectors[0], [0.0, 1.0])
 
+    def test_normalized_rows_track_mutations(self, tmp_path):
+        """Incrementally normalized rows match a full renormalization after edits."""
+        rng = np.random.default_rng(0)
+        store = self._make_store(tmp_path)
+        for i in range(40):
+            store.add(f"c{i}", rng.normal(size=8))
+            if i % 7 == 0:
+                store.search(rng.normal(size=8))  # normalize what exists so far
+        store.add("c3", rng.normal(size=8))  # replace a normalized row
+        store.add("c39", np.zeros(8))  # zero row stays zero
+        store.remove("c5")
+        store.remove("c38")
+        store.add("c40", rng.normal(size=8))
+
+        vectors = store.vectors
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        expected = vectors / np.where(norms == 0, 1e-10, norms)
+        np.testing.assert_allclose(store._normalized(), expected, rtol=1e-6)
+
+    def test_remove_keeps_ids_paired_with_vectors(self, tmp_path):
+        """Swap-remove moves the last row into the hole without mixing up ids."""
+        rng = np.random.default_rng(1)
+        store = self._make_store(tmp_path)
+        added = {f"c{i}": rng.normal(size=4).astype(np.float32) for i in range(6)}
+        for chunk_id, vec in added.items():
+            store.add(chunk_id, vec)
+        store.search(rng.normal(size=4))
+        added["c6"] = rng.normal(size=4).astype(np.float32)  # not yet normalized
+        store.add("c6", added["c6"])
+
+        for chunk_id in ("c1", "c4", "c0"):
+            assert store.remove(chunk_id) is True
+            del added[chunk_id]
+
+        assert sorted(store.chunk_ids) == sorted(added)
+        for idx, chunk_id in enumerate(store.chunk_ids):
+            np.testing.assert_array_equal(store.vectors[idx], added[chunk_id])
+        top_id, score = store.search(added["c6"], top_k=1)[0]
+        assert top_id == "c6"
+        assert score == pytest.approx(1.0)
+
     def test_zero_query_vector(self, tmp_path):
         """Zero query vector returns empty results."""
         store = self._make_store(tmp_path)
@@ -182,7 +342,7 @@ class TestHybridFusion:
 
     def test_fusion_ordering(self):
         """Fused results should blend BM25 and semantic scores."""
-        from mcp_server.tools.search import HYBRID_ALPHA, _normalize_bm25_scores
+        from mcp_server.tools.search import _fuse_scores
 
         # Simulate BM25 results
         bm25_results = [
@@ -190,7 +350,6 @@ class TestHybridFusion:
             {"chunk_id": "b", "score": 5.0, "summary": "chunk b"},
             {"chunk_id": "c", "score": 1.0, "summary": "chunk c"},
         ]
-        bm25_results = _normalize_bm25_scores(bm25_results)
         # Norm: a=1.0, b=0.444, c=0.0
 
         # Simulate semantic results (different ordering)
@@ -200,17 +359,10 @@ class TestHybridFusion:
             ("d", 0.80),  # d only in semantic
         ]
 
-        # Perform fusion (same logic as in search.py)
-        bm25_map = {r["chunk_id"]: r.get("score_norm", 0) for r in bm25_results}
-        sem_map = dict(semantic_hits)
-        all_ids = set(bm25_map) | set(sem_map)
-
-        fused = []
-        for cid in all_ids:
-            score = (1 - HYBRID_ALPHA) * bm25_map.get(cid, 0) + HYBRID_ALPHA * sem_map.get(cid, 0)
-            fused.append({"chunk_id": cid, "score": score})
-
-        fused.sort(key=lambda x: x["score"], reverse=True)
+        fused = [
+            {"chunk_id": cid, "score": score}
+            for cid, score in _fuse_scores(bm25_results, semantic_hits)
+        ]
 
         # a: 0.4*1.0 + 0.6*0.60 = 0.76, b: 0.4*0.444 + 0.6*0.95 = 0.748
         # a and b are very close; a wins by a thin margin due to BM25 dominance
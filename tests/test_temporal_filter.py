@@ -149,7 +149,7 @@ class TestGrepTemporalFilter:
                     "chunks": [],
                     "total_tokens_estimate": 0,
                 },
-                indent=2,
+                separators=(",", ":"),
             )
         )
 
@@ -196,7 +196,7 @@ class TestGrepTemporalFilter:
                 "access_count": 0,
             }
         )
-        index_file.write_text(json.dumps(index, indent=2))
+        index_file.write_text(json.dumps(index, separators=(",", ":")))
 
     def test_grep_no_date_filter_returns_all(self):
         """Grep without date filter should return all matches."""
@@ -259,7 +259,7 @@ class TestGrepTemporalFilter:
                 # No created_at, no project — legacy format
             }
         )
-        index_file.write_text(json.dumps(index, indent=2))
+        index_file.write_text(json.dumps(index, separators=(",", ":")))
 
         # Should be excluded by date_from after its date
         result = self.nav.grep("Décision", date_from="2026-01-20")
@@ -291,7 +291,7 @@ class TestFuzzyTemporalFilter:
         index_file.write_text(
             json.dumps(
                 {"version": "2.1.0", "chunks": [], "total_tokens_estimate": 0},
-                indent=2,
+                separators=(",", ":"),
             )
         )
 
@@ -336,7 +336,7 @@ class TestFuzzyTemporalFilter:
                 "access_count": 0,
             }
         )
-        index_file.write_text(json.dumps(index, indent=2))
+        index_file.write_text(json.dumps(index, separators=(",", ":")))
 
     def test_fuzzy_with_date_filter(self):
         """Fuzzy grep should respect date filters."""
@@ -391,7 +391,7 @@ class TestSearchTemporalFilter:
                     "chunks": [],
                     "total_tokens_estimate": 0,
                 },
-                indent=2,
+                separators=(",", ":"),
             )
         )
 
@@ -437,7 +437,7 @@ class TestSearchTemporalFilter:
                 "access_count": 0,
             }
         )
-        index_file.write_text(json.dumps(index, indent=2))
+        index_file.write_text(json.dumps(index, separators=(",", ":")))
 
     def test_search_no_date_filter(self):
         """Search without date filter should return all relevant results."""
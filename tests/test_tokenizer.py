@@ -8,7 +8,7 @@ Tests:
 - Compound word splitting
 """
 
-from mcp_server.tools.tokenizer_fr import normalize_accent, tokenize_fr
+from mcp_server.tools.tokenizer_fr import normalize_accent, tokenize_fr, tokenize_fr_batch
 
 
 class TestNormalizeAccent:
@@ -31,6 +31,12 @@ class TestNormalizeAccent:
         assert normalize_accent("café au lait") == "cafe au lait"
         assert normalize_accent("scénario réaliste 2026") == "scenario realiste 2026"
 
+    def test_decomposed_and_non_latin_marks(self):
+        """Combining marks are stripped whatever their script or plane."""
+        assert normalize_accent("cafe\u0301 l’été") == "cafe l’ete"
+        assert normalize_accent("Ωμέγα") == "Ωμεγα"
+        assert normalize_accent("a\U0001d167b") == "ab"  # Astral-plane combining mark
+
 
 class TestTokenizeFr:
     """Tests for French/English tokenization."""
@@ -190,3 +196,12 @@ class TestEdgeCases:
         assert "jus" in tokens
         assert "est" in tokens
         assert "bon" in tokens
+
+    def test_batch_matches_single(self):
+        """tokenize_fr_batch gives tokenize_fr's result for each text."""
+        texts = ["Le jus-de-fruits pressé", "", "ΣΑΣ Café", "nul\0inside", "The BM25 plan"]
+        for remove_stopwords in (True, False):
+            expected = [tokenize_fr(t, remove_stopwords) for t in texts]
+            assert tokenize_fr_batch(texts, remove_stopwords) == expected
+            assert tokenize_fr_batch(texts[:3], remove_stopwords) == expected[:3]
+        assert tokenize_fr_batch([]) == []